@@ -72,12 +72,13 @@ class DecisionEngineAgent:
             )
             
             # Save to database (non-blocking - continue even if DB is unavailable)
-            try:
-                await self._save_decision(request.ticket_id, response, decision_type, context)
-            except Exception as db_error:
-                # Log but don't fail the request if DB is unavailable
-                import logging
-                logging.warning(f"Failed to save decision to database: {db_error}")
+            if request.persist:
+                try:
+                    await self._save_decision(request.ticket_id, response, decision_type, context)
+                except Exception as db_error:
+                    # Log but don't fail the request if DB is unavailable
+                    import logging
+                    logging.warning(f"Failed to save decision to database: {db_error}")
             
             # Record metrics
             duration = time.time() - start_time
@@ -56,7 +56,7 @@ async def make_decision(
         }
     
     # Use LLM for nuanced decisions
-    llm = get_llm_provider()
+    llm = get_llm_provider("decision")
     prompt = get_decision_prompt(router_result, knowledge_result, sentiment_result)
     schema = get_decision_schema()
     
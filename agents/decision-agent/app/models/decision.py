@@ -9,6 +9,7 @@ class DecisionRequest(BaseModel):
     router_result: Dict[str, Any]
     knowledge_result: Dict[str, Any]
     sentiment_result: Dict[str, Any]
+    persist: bool = True  # False when the orchestrator persists the result
 
 
 class DecisionResponse(BaseModel):
@@ -66,12 +66,13 @@ class KnowledgeAgent:
             )
             
             # Save to database (non-blocking - continue even if DB is unavailable)
-            try:
-                await self._save_search(request.ticket_id, response, result)
-            except Exception as db_error:
-                # Log but don't fail the request if DB is unavailable
-                import logging
-                logging.warning(f"Failed to save knowledge search to database: {db_error}")
+            if request.persist:
+                try:
+                    await self._save_search(request.ticket_id, response, result)
+                except Exception as db_error:
+                    # Log but don't fail the request if DB is unavailable
+                    import logging
+                    logging.warning(f"Failed to save knowledge search to database: {db_error}")
             
             # Record metrics
             duration = time.time() - start_time
@@ -8,6 +8,7 @@ class KnowledgeSearchRequest(BaseModel):
     ticket_id: str
     text: str = Field(..., min_length=1)
     category: Optional[str] = None
+    persist: bool = True  # False when the orchestrator persists the result
 
 
 class SimilarCase(BaseModel):
@@ -0,0 +1,126 @@
+"""BM25 lexical search over knowledge base cases."""
+import os
+import re
+import math
+import time
+import asyncio
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Optional
+from tools.vector_db.chroma_client import get_all_cases
+
+# Keeps identifiers such as "#12345", "err-502", "v2.1.2" or "premium_plan" whole
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[._\-/][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word and identifier tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """In-memory inverted index scored with Okapi BM25."""
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize empty index.
+        
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.cases: List[Dict[str, Any]] = []
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)  # term -> {doc: tf}
+        self.lengths: List[int] = []
+        self.average_length = 0.0
+        self.built_at = 0.0
+    
+    def build(self, cases: List[Dict[str, Any]]) -> "BM25Index":
+        """
+        Index cases.
+        
+        Args:
+            cases: Cases with id, text and metadata
+        
+        Returns:
+            self
+        """
+        self.cases = cases
+        self.postings = defaultdict(dict)
+        self.lengths = []
+        for doc, case in enumerate(cases):
+            tokens = tokenize(case.get("text", ""))
+            self.lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                self.postings[term][doc] = count
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        self.built_at = time.monotonic()
+        return self
+    
+    def __len__(self) -> int:
+        return len(self.cases)
+    
+    def search(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find cases sharing the most informative terms with the query.
+        
+        Args:
+            query_text: Query text
+            top_k: Number of results
+            filter_dict: Metadata equality filters (e.g. {"category": "BILLING"})
+        
+        Returns:
+            Cases with a bm25_score, best first
+        """
+        total = len(self.cases)
+        if not total:
+            return []
+        
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query_text)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc] / self.average_length)
+                scores[doc] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        
+        if filter_dict:
+            scores = {
+                doc: score for doc, score in scores.items()
+                if all(self.cases[doc].get("metadata", {}).get(key) == value for key, value in filter_dict.items())
+            }
+        
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [dict(self.cases[doc], bm25_score=score) for doc, score in ranked]
+
+
+_index: Optional[BM25Index] = None
+_build_lock: Optional[asyncio.Lock] = None
+
+
+async def get_bm25_index() -> BM25Index:
+    """
+    Get the BM25 index over all cases, rebuilding it every KNOWLEDGE_BM25_REFRESH_SECONDS.
+    
+    Returns:
+        BM25 index
+    """
+    global _index, _build_lock
+    refresh = float(os.getenv("KNOWLEDGE_BM25_REFRESH_SECONDS", "300"))
+    if _index is not None and time.monotonic() - _index.built_at < refresh:
+        return _index
+    
+    if _build_lock is None:
+        _build_lock = asyncio.Lock()
+    async with _build_lock:
+        if _index is None or time.monotonic() - _index.built_at >= refresh:
+            _index = BM25Index().build(await get_all_cases())
+    return _index
@@ -0,0 +1,60 @@
+"""Optional cross-encoder reranking of retrieved cases (CPU)."""
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+DEFAULT_RERANKER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+_model = None
+_model_lock = threading.Lock()
+# One thread: the model parallelizes inside the forward pass
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+
+
+def reranker_enabled() -> bool:
+    """Whether the cross-encoder reranker is enabled."""
+    return os.getenv("KNOWLEDGE_RERANKER", "false").lower() == "true"
+
+
+def get_reranker_model():
+    """Load the cross-encoder once (KNOWLEDGE_RERANKER_MODEL)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import CrossEncoder
+                _model = CrossEncoder(
+                    os.getenv("KNOWLEDGE_RERANKER_MODEL", DEFAULT_RERANKER_MODEL),
+                    max_length=int(os.getenv("KNOWLEDGE_RERANKER_MAX_LENGTH", "512"))
+                )
+    return _model
+
+
+async def rerank(query_text: str, cases: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Reorder cases by cross-encoder relevance to the query.
+    
+    Args:
+        query_text: Ticket text
+        cases: Retrieved cases
+        top_k: Number of cases to keep (all if None)
+    
+    Returns:
+        Cases with a rerank_score, best first
+    """
+    if not cases:
+        return cases
+    
+    def score():
+        return get_reranker_model().predict([(query_text, case.get("text", "")) for case in cases])
+    
+    loop = asyncio.get_running_loop()
+    scores = await loop.run_in_executor(_executor, score)
+    reranked = sorted(
+        (dict(case, rerank_score=float(value)) for case, value in zip(cases, scores)),
+        key=lambda case: case["rerank_score"],
+        reverse=True
+    )
+    return reranked[:top_k] if top_k else reranked
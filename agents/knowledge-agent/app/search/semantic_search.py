@@ -1,11 +1,24 @@
 """Semantic search logic."""
+import os
 from typing import List, Dict, Any
 from tools.llm.providers.factory import get_llm_provider
 from tools.llm.prompts.knowledge_prompts import (
     get_solution_adaptation_prompt,
     get_solution_schema
 )
-from app.search.vector_search import search_similar
+from app.search.vector_search import search_similar, hybrid_search_enabled
+from app.search.reranker import reranker_enabled
+
+
+def get_prompt_case_limit(top_k: int) -> int:
+    """
+    Number of retrieved cases sent to the adaptation prompt.
+    
+    Hybrid retrieval and reranking put the best case first far more often,
+    so fewer cases are needed (KNOWLEDGE_PROMPT_CASES, default 3 then).
+    """
+    default = 3 if hybrid_search_enabled() or reranker_enabled() else top_k
+    return max(1, int(os.getenv("KNOWLEDGE_PROMPT_CASES", str(default))))
 
 
 async def find_solution(
@@ -39,9 +52,9 @@ async def find_solution(
             "solvable_without_escalation": False
         }
     
-    # Format similar cases for LLM
+    # Format similar cases for LLM (only the best ones, to keep the prompt short)
     formatted_cases = []
-    for case in similar_cases:
+    for case in similar_cases[:get_prompt_case_limit(top_k)]:
         formatted_cases.append({
             "issue": case.get("text", ""),
             "solution": case.get("metadata", {}).get("resolution", ""),
@@ -57,7 +70,7 @@ async def find_solution(
     solvable_without_escalation = False
     
     try:
-        llm = get_llm_provider()
+        llm = get_llm_provider("knowledge")
         prompt = get_solution_adaptation_prompt(
             ticket_text=ticket_text,
             similar_cases=formatted_cases,
@@ -1,6 +1,62 @@
 """Vector search implementation."""
+import os
+import logging
 from typing import List, Dict, Any
 from tools.vector_db.chroma_client import search_similar_cases
+from tools.vector_db.embeddings import get_embedding_service
+from tools.monitoring.metrics import get_metrics_collector
+from app.search.lexical_search import get_bm25_index
+from app.search.reranker import reranker_enabled, rerank
+
+
+def hybrid_search_enabled() -> bool:
+    """Whether BM25 results are fused with vector results."""
+    return os.getenv("KNOWLEDGE_HYBRID_SEARCH", "false").lower() == "true"
+
+
+def reciprocal_rank_fusion(result_lists: List[List[Dict[str, Any]]], k: int = 60) -> List[Dict[str, Any]]:
+    """
+    Merge ranked lists with reciprocal-rank fusion.
+    
+    Each case scores sum(1 / (k + rank)) over the lists it appears in, so
+    cases ranked well by both lexical and vector search come first.
+    
+    Args:
+        result_lists: Ranked case lists (cases identified by "id")
+        k: Rank smoothing constant
+    
+    Returns:
+        Fused cases with an rrf_score, best first
+    """
+    scores: Dict[str, float] = {}
+    cases: Dict[str, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, case in enumerate(results, 1):
+            scores[case["id"]] = scores.get(case["id"], 0.0) + 1.0 / (k + rank)
+            # The first (vector) copy wins, it carries distance and similarity
+            merged = cases.setdefault(case["id"], dict(case))
+            for key, value in case.items():
+                merged.setdefault(key, value)
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    return [dict(cases[case_id], rrf_score=scores[case_id]) for case_id in ranked]
+
+
+async def _fill_similarity(query_text: str, cases: List[Dict[str, Any]]):
+    """Give lexical-only hits the same similarity score vector hits have."""
+    missing = [case for case in cases if "similarity" not in case]
+    if not missing:
+        return
+    
+    service = get_embedding_service()
+    query_vector = await service.embed(query_text)
+    vectors = await service.embed_many([case.get("text", "") for case in missing])
+    query_norm = sum(x * x for x in query_vector) ** 0.5 or 1.0
+    for case, vector in zip(missing, vectors):
+        norm = sum(x * x for x in vector) ** 0.5 or 1.0
+        cosine = sum(a * b for a, b in zip(query_vector, vector)) / (query_norm * norm)
+        # Same scale as Chroma's l2 space on normalized vectors: 1 - (2 - 2 * cosine)
+        case["distance"] = 2.0 - 2.0 * cosine
+        case["similarity"] = 2.0 * cosine - 1.0
 
 
 async def search_similar(
@@ -11,11 +67,16 @@ async def search_similar(
     """
     Search for similar cases using vector search.
     
+    With KNOWLEDGE_HYBRID_SEARCH=true, BM25 results over the case texts
+    are fused with the vector results (reciprocal-rank fusion), and with
+    KNOWLEDGE_RERANKER=true the fused candidates are reordered by a
+    cross-encoder.
+    
     Args:
         query_text: Query text
         category: Filter by category (optional)
         top_k: Number of results
-        
+    
     Returns:
         List of similar cases
     """
@@ -23,13 +84,40 @@ async def search_similar(
     if category:
         filter_dict = {"category": category}
     
+    hybrid = hybrid_search_enabled()
+    rerank_results = reranker_enabled()
+    # Fusion and reranking pick from a wider candidate pool
+    candidates = max(top_k, int(os.getenv("KNOWLEDGE_CANDIDATES", "20"))) if hybrid or rerank_results else top_k
+    
     results = await search_similar_cases(
         query_text=query_text,
-        top_k=top_k,
+        top_k=candidates,
         filter_dict=filter_dict
     )
     
+    if hybrid:
+        try:
+            index = await get_bm25_index()
+            lexical = index.search(query_text, top_k=candidates, filter_dict=filter_dict)
+            results = reciprocal_rank_fusion([results, lexical])
+            get_metrics_collector().increment_counter("knowledge.hybrid.lexical_hits", len(lexical))
+        except Exception as e:
+            # Lexical search is an enhancement; vector results still stand
+            logging.warning(f"Hybrid search failed, using vector results only: {e}")
+    
+    if rerank_results:
+        try:
+            results = await rerank(query_text, results)
+        except Exception as e:
+            logging.warning(f"Reranking failed, keeping retrieval order: {e}")
+    
+    results = results[:top_k]
+    if hybrid:
+        try:
+            await _fill_similarity(query_text, results)
+        except Exception as e:
+            logging.warning(f"Could not score lexical-only hits: {e}")
+            for case in results:
+                case.setdefault("similarity", 0.0)
+    
     return results
-
-
-
@@ -1,6 +1,7 @@
 """Knowledge Agent FastAPI application."""
 import sys
 import os
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,6 +17,10 @@ sys.path.insert(0, str(project_root))
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
+from tools.vector_db.chroma_client import get_vector_backend, warm_local_index
+from app.search.vector_search import hybrid_search_enabled
+from app.search.lexical_search import get_bm25_index
+from app.search.reranker import reranker_enabled, get_reranker_model
 
 app = FastAPI(
     title="Knowledge Agent",
@@ -36,6 +41,21 @@ app.add_middleware(
 app.include_router(router, prefix="/api", tags=["knowledge"])
 
 
+@app.on_event("startup")
+async def startup():
+    """Load the in-process indexes and models before serving requests."""
+    if get_vector_backend() == "local":
+        warm_local_index()
+    if hybrid_search_enabled():
+        try:
+            await get_bm25_index()
+        except Exception as e:
+            # Built on the first search instead
+            logging.warning(f"BM25 index not built at startup: {e}")
+    if reranker_enabled():
+        get_reranker_model()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
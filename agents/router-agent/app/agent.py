@@ -1,12 +1,25 @@
 """Router Agent implementation."""
+import os
 import time
-from typing import Dict, Any
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List, Tuple
 from tools.llm.providers.factory import get_llm_provider
-from tools.llm.prompts.router_prompts import get_classification_prompt, get_classification_schema
+from tools.llm.prompts.router_prompts import (
+    CATEGORIES,
+    get_classification_prompt,
+    get_classification_schema,
+    get_batch_classification_prompt,
+    get_batch_classification_schema
+)
+from tools.llm.prompts.triage_prompts import get_triage_prompt, get_triage_schema
 from tools.database.postgres import get_db_session
 from tools.database.models.classification import Classification as ClassificationModel
+from tools.database.models.sentiment import Sentiment as SentimentModel, SentimentLevel
 from tools.database.models.ticket import Ticket
 from app.models.classification import ClassificationResponse
+from app.models.triage import TriageResponse, TriageSentiment
+from app.classifiers.local_classifier import load_local_classifier
 from tools.monitoring.metrics import get_metrics_collector
 
 
@@ -16,20 +29,26 @@ class RouterAgent:
     def __init__(self):
         """Initialize Router Agent."""
         try:
-            self.llm = get_llm_provider()
+            self.llm = get_llm_provider("router")
             self.metrics = get_metrics_collector()
+            # Max tickets packed into one batch classification prompt
+            self.batch_size = int(os.getenv("ROUTER_BATCH_SIZE", "10"))
+            # Optional CPU classifier answering confident tickets without the LLM
+            self.local_classifier = load_local_classifier()
+            self.local_threshold = float(os.getenv("ROUTER_LOCAL_CONFIDENCE_THRESHOLD", "0.9"))
         except Exception as e:
             import logging
             logging.error(f"Failed to initialize Router Agent: {e}")
             raise
     
-    async def classify(self, ticket_id: str, ticket_text: str) -> ClassificationResponse:
+    async def classify(self, ticket_id: str, ticket_text: str, persist: bool = True) -> ClassificationResponse:
         """
         Classify a ticket into a category.
         
         Args:
             ticket_id: Ticket ID
             ticket_text: Ticket text
+            persist: Save classification to database
             
         Returns:
             Classification result
@@ -37,51 +56,270 @@ class RouterAgent:
         start_time = time.time()
         
         try:
-            # Get classification prompt
-            prompt = get_classification_prompt(ticket_text)
-            schema = get_classification_schema()
+            # Confident local prediction skips the LLM
+            classification = self._classify_locally(ticket_id, ticket_text)
             
-            # Call LLM
+            if classification is None:
+                classification = await self._classify_with_llm(ticket_id, ticket_text)
+            
+            # Save to database (non-blocking - continue even if DB is unavailable)
+            if persist:
+                try:
+                    await self._save_classification(ticket_id, classification)
+                except Exception as db_error:
+                    # Log but don't fail the request if DB is unavailable
+                    import logging
+                    logging.warning(f"Failed to save classification to database: {db_error}")
+            
+            # Record metrics
+            duration = time.time() - start_time
+            self.metrics.record_agent_call("router", True, duration)
+            
+            return classification
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.metrics.record_agent_call("router", False, duration)
+            raise
+    
+    async def _classify_with_llm(self, ticket_id: str, ticket_text: str) -> ClassificationResponse:
+        """Classify one ticket with the LLM, without trying the local model."""
+        # Get classification prompt
+        prompt = get_classification_prompt(ticket_text)
+        schema = get_classification_schema()
+        
+        # Call LLM
+        result = await self.llm.generate_json(
+            prompt=prompt,
+            schema=schema,
+            temperature=0.3  # Lower temperature for more consistent classification
+        )
+        
+        # Create response
+        return ClassificationResponse(
+            ticket_id=ticket_id,
+            category=result.get("category", "OTHER"),
+            subcategory=result.get("subcategory"),
+            confidence=result.get("confidence", 0.0),
+            reason=result.get("reason")
+        )
+    
+    async def classify_batch(
+        self,
+        tickets: List[Tuple[str, str]],
+        persist: bool = True
+    ) -> Tuple[List[ClassificationResponse], int]:
+        """
+        Classify many tickets, packing up to batch_size tickets into each LLM call.
+        
+        Tickets whose batch answer is missing or malformed are classified
+        individually.
+        
+        Args:
+            tickets: (ticket_id, ticket_text) pairs
+            persist: Save classifications to database
+            
+        Returns:
+            Classifications in input order, and how many needed the per-ticket fallback
+        """
+        start_time = time.time()
+        
+        try:
+            # Confident local predictions skip the LLM
+            classified: Dict[int, ClassificationResponse] = {}
+            for index, (ticket_id, ticket_text) in enumerate(tickets):
+                local = self._classify_locally(ticket_id, ticket_text)
+                if local is not None:
+                    classified[index] = local
+            remaining = [index for index in range(len(tickets)) if index not in classified]
+            
+            chunks = [
+                remaining[start:start + self.batch_size]
+                for start in range(0, len(remaining), self.batch_size)
+            ]
+            chunk_results = await asyncio.gather(*[
+                self._classify_chunk([tickets[index] for index in chunk])
+                for chunk in chunks
+            ])
+            
+            fallback_count = 0
+            for chunk, (results, fallbacks) in zip(chunks, chunk_results):
+                classified.update(zip(chunk, results))
+                fallback_count += fallbacks
+            classifications = [classified[index] for index in range(len(tickets))]
+            
+            # Save to database (non-blocking - continue even if DB is unavailable)
+            if persist:
+                try:
+                    await self._save_classifications(classifications)
+                except Exception as db_error:
+                    logging.warning(f"Failed to save batch classifications to database: {db_error}")
+            
+            duration = time.time() - start_time
+            self.metrics.record_agent_call("router_batch", True, duration)
+            self.metrics.increment_counter("router_batch.tickets", len(tickets))
+            self.metrics.increment_counter("router_batch.fallbacks", fallback_count)
+            
+            return classifications, fallback_count
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.metrics.record_agent_call("router_batch", False, duration)
+            raise
+    
+    async def _classify_chunk(
+        self,
+        chunk: List[Tuple[str, str]]
+    ) -> Tuple[List[ClassificationResponse], int]:
+        """Classify one chunk with a single LLM call, falling back per ticket."""
+        answers: Dict[int, Dict[str, Any]] = {}
+        try:
+            result = await self.llm.generate_json(
+                prompt=get_batch_classification_prompt([text for _, text in chunk]),
+                schema=get_batch_classification_schema(),
+                temperature=0.3
+            )
+            answers = self._map_batch_answers(result, len(chunk))
+        except Exception as e:
+            logging.warning(f"Batch classification failed, classifying tickets individually: {e}")
+        
+        missing = [index for index in range(len(chunk)) if index not in answers]
+        if missing:
+            # The local model already passed on these tickets in classify_batch
+            fallbacks = await asyncio.gather(*[
+                self._classify_with_llm(chunk[index][0], chunk[index][1])
+                for index in missing
+            ])
+            for index, classification in zip(missing, fallbacks):
+                answers[index] = classification
+        
+        results = []
+        for index, (ticket_id, _) in enumerate(chunk):
+            answer = answers[index]
+            if isinstance(answer, ClassificationResponse):
+                results.append(answer)
+            else:
+                results.append(ClassificationResponse(ticket_id=ticket_id, **answer))
+        return results, len(missing)
+    
+    def _classify_locally(self, ticket_id: str, ticket_text: str) -> Optional[ClassificationResponse]:
+        """Classify with the local model if it is loaded and confident enough."""
+        if self.local_classifier is None:
+            return None
+        
+        category, confidence = self.local_classifier.predict(ticket_text)
+        if category is None or confidence < self.local_threshold:
+            self.metrics.increment_counter("router.local_escalated")
+            return None
+        
+        self.metrics.increment_counter("router.local_answered")
+        return ClassificationResponse(
+            ticket_id=ticket_id,
+            category=category,
+            subcategory=None,
+            confidence=round(confidence, 4),
+            reason="Classified by local model"
+        )
+    
+    @staticmethod
+    def _map_batch_answers(result: Dict[str, Any], count: int) -> Dict[int, Dict[str, Any]]:
+        """Map valid batch answers to ticket positions; invalid or duplicate entries are dropped."""
+        answers: Dict[int, Dict[str, Any]] = {}
+        entries = result.get("results") if isinstance(result, dict) else None
+        if not isinstance(entries, list):
+            return answers
+        
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get("index")
+            category = entry.get("category")
+            try:
+                confidence = float(entry.get("confidence"))
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(index, int) or not 0 <= index < count or index in answers:
+                continue
+            if category not in CATEGORIES or not 0.0 <= confidence <= 1.0:
+                continue
+            answers[index] = {
+                "category": category,
+                "subcategory": entry.get("subcategory"),
+                "confidence": confidence,
+                "reason": entry.get("reason")
+            }
+        return answers
+    
+    async def triage(self, ticket_id: str, ticket_text: str, persist: bool = True) -> TriageResponse:
+        """
+        Classify a ticket and analyze its sentiment with a single LLM call.
+        
+        Args:
+            ticket_id: Ticket ID
+            ticket_text: Ticket text
+            persist: Save classification and sentiment to database
+            
+        Returns:
+            Classification and sentiment
+        """
+        start_time = time.time()
+        
+        try:
             result = await self.llm.generate_json(
-                prompt=prompt,
-                schema=schema,
-                temperature=0.3  # Lower temperature for more consistent classification
+                prompt=get_triage_prompt(ticket_text),
+                schema=get_triage_schema(),
+                temperature=0.3
             )
+            classification_result = result.get("classification") or {}
+            sentiment_result = result.get("sentiment") or {}
             
-            # Create response
             classification = ClassificationResponse(
                 ticket_id=ticket_id,
-                category=result.get("category", "OTHER"),
-                subcategory=result.get("subcategory"),
-                confidence=result.get("confidence", 0.0),
-                reason=result.get("reason")
+                category=classification_result.get("category", "OTHER"),
+                subcategory=classification_result.get("subcategory"),
+                confidence=classification_result.get("confidence", 0.0),
+                reason=classification_result.get("reason")
+            )
+            level = sentiment_result.get("level", "NEUTRAL")
+            if level not in SentimentLevel.__members__:
+                level = "NEUTRAL"
+            sentiment = TriageSentiment(
+                score=sentiment_result.get("score", 0.5),
+                level=level,
+                urgency=sentiment_result.get("urgency"),
+                churn_risk=sentiment_result.get("churn_risk", False),
+                requires_human=sentiment_result.get("requires_human", False),
+                recommended_handler=sentiment_result.get("recommended_handler")
             )
             
             # Save to database (non-blocking - continue even if DB is unavailable)
-            try:
-                await self._save_classification(ticket_id, classification)
-            except Exception as db_error:
-                # Log but don't fail the request if DB is unavailable
-                import logging
-                logging.warning(f"Failed to save classification to database: {db_error}")
+            if persist:
+                try:
+                    await self._save_classification(ticket_id, classification, sentiment)
+                except Exception as db_error:
+                    logging.warning(f"Failed to save triage to database: {db_error}")
             
-            # Record metrics
             duration = time.time() - start_time
-            self.metrics.record_agent_call("router", True, duration)
+            self.metrics.record_agent_call("triage", True, duration)
             
-            return classification
+            return TriageResponse(
+                ticket_id=ticket_id,
+                classification=classification,
+                sentiment=sentiment
+            )
             
         except Exception as e:
             duration = time.time() - start_time
-            self.metrics.record_agent_call("router", False, duration)
+            self.metrics.record_agent_call("triage", False, duration)
             raise
     
     async def _save_classification(
         self,
         ticket_id: str,
-        classification: ClassificationResponse
+        classification: ClassificationResponse,
+        sentiment: Optional[TriageSentiment] = None
     ):
-        """Save classification to database."""
+        """Save classification (and triage sentiment, if given) to database."""
         async for session in get_db_session():
             # Get ticket UUID
             ticket = await session.get(Ticket, ticket_id)
@@ -90,16 +328,41 @@ class RouterAgent:
                 return
             
             # Create classification record
-            db_classification = ClassificationModel(
-                ticket_id=ticket.ticket_id,
-                category=classification.category,
-                subcategory=classification.subcategory,
-                confidence=classification.confidence,
-                reason=classification.reason,
-                agent_version="1.0.0"
-            )
+            session.add(self._classification_model(ticket, classification))
+            
+            if sentiment is not None:
+                session.add(SentimentModel(
+                    ticket_id=ticket.ticket_id,
+                    score=sentiment.score,
+                    level=SentimentLevel[sentiment.level],
+                    urgency=sentiment.urgency,
+                    churn_risk=sentiment.churn_risk,
+                    requires_human=sentiment.requires_human,
+                    recommended_handler=sentiment.recommended_handler
+                ))
             
-            session.add(db_classification)
             await session.commit()
             break
+    
+    async def _save_classifications(self, classifications: List[ClassificationResponse]):
+        """Save several classifications in one transaction."""
+        async for session in get_db_session():
+            for classification in classifications:
+                ticket = await session.get(Ticket, classification.ticket_id)
+                if ticket:
+                    session.add(self._classification_model(ticket, classification))
+            await session.commit()
+            break
+    
+    @staticmethod
+    def _classification_model(ticket: Ticket, classification: ClassificationResponse) -> ClassificationModel:
+        """Build classification record for a ticket."""
+        return ClassificationModel(
+            ticket_id=ticket.ticket_id,
+            category=classification.category,
+            subcategory=classification.subcategory,
+            confidence=classification.confidence,
+            reason=classification.reason,
+            agent_version="1.0.0"
+        )
 
@@ -2,8 +2,11 @@
 from fastapi import APIRouter, HTTPException
 from app.models.classification import (
     ClassificationRequest,
-    ClassificationResponse
+    ClassificationResponse,
+    BatchClassificationRequest,
+    BatchClassificationResponse
 )
+from app.models.triage import TriageRequest, TriageResponse
 from app.agent import RouterAgent
 
 router = APIRouter()
@@ -24,7 +27,8 @@ async def process_ticket(request: ClassificationRequest) -> ClassificationRespon
     try:
         result = await agent.classify(
             ticket_id=request.ticket_id,
-            ticket_text=request.text
+            ticket_text=request.text,
+            persist=request.persist
         )
         return result
     except Exception as e:
@@ -39,6 +43,62 @@ async def process_ticket(request: ClassificationRequest) -> ClassificationRespon
         )
 
 
+@router.post("/process/batch", response_model=BatchClassificationResponse)
+async def process_batch(request: BatchClassificationRequest) -> BatchClassificationResponse:
+    """
+    Classify many tickets, several per LLM call.
+    
+    Args:
+        request: Batch classification request
+        
+    Returns:
+        Classifications in request order
+    """
+    try:
+        results, fallback_count = await agent.classify_batch(
+            tickets=[(ticket.ticket_id, ticket.text) for ticket in request.tickets],
+            persist=request.persist
+        )
+        return BatchClassificationResponse(results=results, fallback_count=fallback_count)
+    except Exception as e:
+        import traceback
+        error_detail = f"{type(e).__name__}: {str(e)}"
+        import logging
+        logging.error(f"Router Agent batch error: {error_detail}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Router Agent batch classification failed: {error_detail}. Check logs for full traceback."
+        )
+
+
+@router.post("/triage", response_model=TriageResponse)
+async def triage_ticket(request: TriageRequest) -> TriageResponse:
+    """
+    Classify a ticket and analyze its sentiment in one LLM call.
+    
+    Args:
+        request: Triage request
+        
+    Returns:
+        Classification and sentiment
+    """
+    try:
+        return await agent.triage(
+            ticket_id=request.ticket_id,
+            ticket_text=request.text,
+            persist=request.persist
+        )
+    except Exception as e:
+        import traceback
+        error_detail = f"{type(e).__name__}: {str(e)}"
+        import logging
+        logging.error(f"Router Agent triage error: {error_detail}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Router Agent triage failed: {error_detail}. Check logs for full traceback."
+        )
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,4 @@
+# Router Agent Classifiers
+
+
+
@@ -0,0 +1,153 @@
+"""Lightweight in-process ticket classifier (TF-IDF nearest centroid)."""
+import os
+import re
+import json
+import math
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word unigrams and bigrams."""
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{first}_{second}" for first, second in zip(words, words[1:])]
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    if not norm:
+        return {}
+    return {term: value / norm for term, value in vector.items()}
+
+
+class LocalTicketClassifier:
+    """
+    TF-IDF nearest-centroid classifier over ticket text.
+
+    Each category is represented by the normalized mean TF-IDF vector of its
+    training tickets; a ticket is assigned to the most similar centroid.
+    Confidence is a softmax over the cosine similarities.
+    """
+
+    def __init__(
+        self,
+        idf: Optional[Dict[str, float]] = None,
+        centroids: Optional[Dict[str, Dict[str, float]]] = None,
+        temperature: float = 0.05
+    ):
+        """
+        Initialize classifier.
+
+        Args:
+            idf: Inverse document frequency per term
+            centroids: Normalized TF-IDF centroid per category
+            temperature: Softmax temperature; lower gives sharper confidences
+        """
+        self.idf = idf or {}
+        self.centroids = centroids or {}
+        self.temperature = temperature
+
+    def _vector(self, text: str) -> Dict[str, float]:
+        counts = Counter(token for token in tokenize(text) if token in self.idf)
+        return _normalize({
+            term: (1 + math.log(count)) * self.idf[term]
+            for term, count in counts.items()
+        })
+
+    def fit(self, texts: List[str], labels: List[str], min_df: int = 2) -> "LocalTicketClassifier":
+        """
+        Train on labelled tickets.
+
+        Args:
+            texts: Ticket texts
+            labels: Category of each ticket
+            min_df: Terms in fewer tickets than this are ignored
+
+        Returns:
+            self
+        """
+        doc_freq: Counter = Counter()
+        for text in texts:
+            doc_freq.update(set(tokenize(text)))
+        total = len(texts)
+        self.idf = {
+            term: math.log((1 + total) / (1 + freq)) + 1
+            for term, freq in doc_freq.items()
+            if freq >= min_df
+        }
+
+        sums: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for text, label in zip(texts, labels):
+            for term, value in self._vector(text).items():
+                sums[label][term] += value
+        self.centroids = {label: _normalize(vector) for label, vector in sums.items()}
+        return self
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Classify a ticket.
+
+        Returns:
+            (category, confidence), or (None, 0.0) if no known terms match
+        """
+        vector = self._vector(text)
+        if not vector or not self.centroids:
+            return None, 0.0
+
+        similarities = {
+            label: sum(value * centroid.get(term, 0.0) for term, value in vector.items())
+            for label, centroid in self.centroids.items()
+        }
+        if max(similarities.values()) <= 0.0:
+            return None, 0.0
+
+        top = max(similarities.values())
+        weights = {
+            label: math.exp((similarity - top) / self.temperature)
+            for label, similarity in similarities.items()
+        }
+        category = max(weights, key=weights.get)
+        return category, weights[category] / sum(weights.values())
+
+    def save(self, path: str):
+        """Write model to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "idf": self.idf,
+                "centroids": self.centroids,
+                "temperature": self.temperature
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalTicketClassifier":
+        """Read model from a JSON file."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            idf=data["idf"],
+            centroids=data["centroids"],
+            temperature=data.get("temperature", 0.05)
+        )
+
+
+def load_local_classifier() -> Optional[LocalTicketClassifier]:
+    """
+    Load the model at ROUTER_LOCAL_CLASSIFIER_PATH.
+
+    Returns:
+        Classifier, or None if the path is unset or the model can't be read
+    """
+    path = os.getenv("ROUTER_LOCAL_CLASSIFIER_PATH")
+    if not path:
+        return None
+    try:
+        return LocalTicketClassifier.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"Local classifier not loaded from {path}: {e}")
+        return None
@@ -1,12 +1,13 @@
 """Classification models for Router Agent."""
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 
 
 class ClassificationRequest(BaseModel):
     """Request model for classification."""
     ticket_id: str
     text: str = Field(..., min_length=1, description="Ticket text to classify")
+    persist: bool = Field(True, description="Save result to database (false when the orchestrator persists it)")
 
 
 class ClassificationResponse(BaseModel):
@@ -18,4 +19,22 @@ class ClassificationResponse(BaseModel):
     reason: Optional[str] = None
 
 
+class BatchTicket(BaseModel):
+    """One ticket in a batch classification request."""
+    ticket_id: str
+    text: str = Field(..., min_length=1)
+
+
+class BatchClassificationRequest(BaseModel):
+    """Request model for batch classification."""
+    tickets: List[BatchTicket] = Field(..., min_length=1, max_length=500)
+    persist: bool = True
+
+
+class BatchClassificationResponse(BaseModel):
+    """Response model for batch classification (same order as the request)."""
+    results: List[ClassificationResponse]
+    fallback_count: int = 0  # Tickets classified individually after a malformed batch answer
+
+
 
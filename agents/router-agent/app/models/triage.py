@@ -0,0 +1,28 @@
+"""Triage models for Router Agent."""
+from pydantic import BaseModel, Field
+from typing import Optional
+from app.models.classification import ClassificationResponse
+
+
+class TriageRequest(BaseModel):
+    """Request model for combined classification and sentiment analysis."""
+    ticket_id: str
+    text: str = Field(..., min_length=1, description="Ticket text to triage")
+    persist: bool = Field(True, description="Save results to database (false when the orchestrator persists them)")
+
+
+class TriageSentiment(BaseModel):
+    """Sentiment part of a triage result (same fields as the sentiment agent returns)."""
+    score: float = Field(..., ge=0.0, le=1.0)
+    level: str  # CALM, NEUTRAL, UPSET, ANGRY
+    urgency: Optional[str] = None
+    churn_risk: bool = False
+    requires_human: bool = False
+    recommended_handler: Optional[str] = None  # BOT, HUMAN, MANAGER
+
+
+class TriageResponse(BaseModel):
+    """Response model for triage."""
+    ticket_id: str
+    classification: ClassificationResponse
+    sentiment: TriageSentiment
@@ -1,13 +1,14 @@
 """Sentiment Agent implementation."""
 import time
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.models.sentiment import (
     SentimentAnalysisRequest,
     SentimentAnalysisResponse
 )
 from app.analyzers.llm_sentiment import analyze_sentiment_llm
-from app.analyzers.huggingface_sentiment import analyze_sentiment_hf
+from app.analyzers.huggingface_sentiment import analyze_sentiment_hf, hf_enabled
+from app.analyzers.lexicon_sentiment import analyze_sentiment_lexicon
 from tools.database.postgres import get_db_session
 from tools.database.models.sentiment import Sentiment as SentimentModel, SentimentLevel
 from tools.database.models.ticket import Ticket
@@ -19,8 +20,12 @@ class SentimentAnalyzerAgent:
     
     def __init__(self):
         """Initialize Sentiment Agent."""
-        self.use_hf = os.getenv("USE_HUGGINGFACE", "false").lower() == "true"
+        self.use_hf = hf_enabled()
+        # Rule/lexicon pre-screen answers clearly calm or angry tickets without the LLM
+        self.use_lexicon = os.getenv("SENTIMENT_LEXICON_ENABLED", "false").lower() == "true"
         self.metrics = get_metrics_collector()
+        self.fast_path_count = 0
+        self.total_count = 0
     
     async def analyze(self, request: SentimentAnalysisRequest) -> SentimentAnalysisResponse:
         """
@@ -39,7 +44,9 @@ class SentimentAnalyzerAgent:
             if self.use_hf:
                 result = await analyze_sentiment_hf(request.text)
             else:
-                result = await analyze_sentiment_llm(request.text)
+                result = self._prescreen(request.text)
+                if result is None:
+                    result = await analyze_sentiment_llm(request.text)
             
             # Map level string to enum
             level_map = {
@@ -62,12 +69,13 @@ class SentimentAnalyzerAgent:
             )
             
             # Save to database (non-blocking - continue even if DB is unavailable)
-            try:
-                await self._save_sentiment(request.ticket_id, response, level)
-            except Exception as db_error:
-                # Log but don't fail the request if DB is unavailable
-                import logging
-                logging.warning(f"Failed to save sentiment to database: {db_error}")
+            if request.persist:
+                try:
+                    await self._save_sentiment(request.ticket_id, response, level)
+                except Exception as db_error:
+                    # Log but don't fail the request if DB is unavailable
+                    import logging
+                    logging.warning(f"Failed to save sentiment to database: {db_error}")
             
             # Record metrics
             duration = time.time() - start_time
@@ -80,6 +88,21 @@ class SentimentAnalyzerAgent:
             self.metrics.record_agent_call("sentiment", False, duration)
             raise
     
+    def _prescreen(self, ticket_text: str) -> Optional[Dict[str, Any]]:
+        """Lexicon result for unambiguous tickets (None sends the ticket to the LLM)."""
+        if not self.use_lexicon:
+            return None
+        
+        result = analyze_sentiment_lexicon(ticket_text)
+        self.total_count += 1
+        if result is not None:
+            self.fast_path_count += 1
+            self.metrics.increment_counter("sentiment.fast_path")
+        else:
+            self.metrics.increment_counter("sentiment.llm_path")
+        self.metrics.set_gauge("sentiment.fast_path_share", self.fast_path_count / self.total_count)
+        return result
+    
     async def _save_sentiment(
         self,
         ticket_id: str,
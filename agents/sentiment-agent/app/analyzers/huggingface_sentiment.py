@@ -1,42 +1,301 @@
-"""HuggingFace-based sentiment analysis (optional)."""
-from typing import Dict, Any
+"""HuggingFace-based sentiment analysis (local CPU inference)."""
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import os
+import time
+import asyncio
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+from app.analyzers.lexicon_sentiment import has_churn_intent
 
+logger = get_logger(__name__)
 
-async def analyze_sentiment_hf(ticket_text: str) -> Dict[str, Any]:
+DEFAULT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+
+# Label names used by common sentiment checkpoints
+LABEL_ALIASES = {
+    "negative": "negative",
+    "neutral": "neutral",
+    "positive": "positive",
+    "label_0": "negative",
+    "label_1": "neutral",
+    "label_2": "positive"
+}
+
+
+class HFSentimentModel:
+    """
+    Sequence classification model running on CPU.
+    
+    Loaded once; optionally int8 dynamically quantized (Linear layers),
+    which typically cuts CPU latency by half for BERT-sized models.
+    """
+    
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        quantize: Optional[bool] = None,
+        max_length: Optional[int] = None
+    ):
+        """
+        Load tokenizer and model.
+        
+        Args:
+            model_name: HuggingFace model id or local path (defaults to HF_SENTIMENT_MODEL)
+            quantize: Apply int8 dynamic quantization (defaults to HF_QUANTIZE)
+            max_length: Max tokens per ticket (defaults to HF_MAX_LENGTH)
+        """
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        
+        self.torch = torch
+        self.model_name = model_name or os.getenv("HF_SENTIMENT_MODEL", DEFAULT_MODEL)
+        self.quantize = quantize if quantize is not None else os.getenv("HF_QUANTIZE", "false").lower() == "true"
+        self.max_length = max_length or int(os.getenv("HF_MAX_LENGTH", "256"))
+        
+        num_threads = os.getenv("HF_NUM_THREADS")
+        if num_threads:
+            torch.set_num_threads(int(num_threads))
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+        model.eval()
+        if self.quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model
+        
+        self.labels = [
+            LABEL_ALIASES.get(model.config.id2label[index].lower(), model.config.id2label[index].lower())
+            for index in range(len(model.config.id2label))
+        ]
+    
+    def predict(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Run one forward pass over a batch.
+        
+        Args:
+            texts: Ticket texts
+        
+        Returns:
+            Label probabilities per text
+        """
+        inputs = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt"
+        )
+        with self.torch.inference_mode():
+            probabilities = self.torch.softmax(self.model(**inputs).logits, dim=-1).tolist()
+        return [dict(zip(self.labels, row)) for row in probabilities]
+
+
+def to_sentiment_result(probabilities: Dict[str, float], ticket_text: str = "") -> Dict[str, Any]:
     """
-    Analyze sentiment using HuggingFace transformers (optional).
+    Map model label probabilities to the sentiment agent's result fields.
     
-    Note: This requires transformers library and model download.
-    For production, LLM-based analysis is recommended.
+    The classifier only knows polarity, so churn risk comes from explicit
+    churn phrases in the text (cancel my account, chargeback, ...), not
+    from how negative the ticket is.
     
     Args:
+        probabilities: Probability per label (negative/neutral/positive)
         ticket_text: Ticket text
-        
+    
     Returns:
         Sentiment analysis result
     """
-    # This is a placeholder - would require transformers library
-    # and a sentiment analysis model like 'cardiffnlp/twitter-roberta-base-sentiment'
+    negative = probabilities.get("negative", 0.0)
+    positive = probabilities.get("positive", 0.0)
+    # 0.0 = very calm, 1.0 = extremely angry
+    score = round(min(1.0, max(0.0, 0.5 * (1.0 + negative - positive))), 4)
     
-    use_hf = os.getenv("USE_HUGGINGFACE", "false").lower() == "true"
+    if score < 0.3:
+        level, urgency = "CALM", "LOW"
+    elif score < 0.5:
+        level, urgency = "NEUTRAL", "MEDIUM"
+    elif score < 0.7:
+        level, urgency = "UPSET", "MEDIUM"
+    else:
+        level, urgency = "ANGRY", "HIGH"
     
-    if not use_hf:
-        raise NotImplementedError(
-            "HuggingFace sentiment analysis not enabled. "
-            "Set USE_HUGGINGFACE=true to enable."
-        )
+    churn_risk = has_churn_intent(ticket_text)
+    requires_human = score >= 0.7 or churn_risk
+    if churn_risk:
+        handler = "MANAGER"
+    elif requires_human:
+        handler = "HUMAN"
+    else:
+        handler = "BOT"
     
-    # Placeholder implementation
-    # In production, would load model and run inference
     return {
-        "score": 0.5,
-        "level": "NEUTRAL",
-        "urgency": "MEDIUM",
-        "churn_risk": False,
-        "requires_human": False,
-        "recommended_handler": "BOT"
+        "score": score,
+        "level": level,
+        "urgency": urgency,
+        "churn_risk": churn_risk,
+        "requires_human": requires_human,
+        "recommended_handler": handler
     }
 
 
+class SentimentBatcher:
+    """
+    Dynamic micro-batcher in front of the model.
+    
+    Concurrent requests are queued; a collector task waits up to
+    HF_BATCH_MAX_WAIT_MS after the first request or until HF_BATCH_MAX_SIZE
+    requests arrive, then runs one forward pass on a dedicated inference
+    thread so the event loop is never blocked.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None
+    ):
+        """
+        Initialize batcher.
+        
+        Args:
+            max_batch_size: Max texts per forward pass (defaults to HF_BATCH_MAX_SIZE)
+            max_wait_ms: Max wait to fill a batch (defaults to HF_BATCH_MAX_WAIT_MS)
+        """
+        self.max_batch_size = max_batch_size or int(os.getenv("HF_BATCH_MAX_SIZE", "16"))
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else float(os.getenv("HF_BATCH_MAX_WAIT_MS", "5"))) / 1000
+        self.model: Optional[HFSentimentModel] = None
+        self.metrics = get_metrics_collector()
+        # One thread: torch parallelizes inside the forward pass
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hf-sentiment")
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+    
+    async def start(self):
+        """Load the model (once) and start the collector task."""
+        async with self._start_lock:
+            if self.model is None:
+                loop = asyncio.get_running_loop()
+                start_time = time.time()
+                self.model = await loop.run_in_executor(self._executor, HFSentimentModel)
+                logger.info(
+                    "HF sentiment model loaded",
+                    model=self.model.model_name,
+                    quantized=self.model.quantize,
+                    duration=time.time() - start_time
+                )
+            if self._collector is None or self._collector.done():
+                self._queue = asyncio.Queue()
+                self._collector = asyncio.create_task(self._collect())
+    
+    async def stop(self):
+        """Stop the collector task and the inference thread."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        self._executor.shutdown(wait=False)
+    
+    async def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Queue a ticket for the next batch and wait for its result.
+        
+        Args:
+            text: Ticket text
+        
+        Returns:
+            Sentiment analysis result
+        """
+        if self._collector is None or self._collector.done():
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+    
+    async def _next_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for a request, then gather more until the batch is full or the wait expires."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _collect(self):
+        """Run forward passes over queued requests until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            # Callers that gave up don't need a slot in the forward pass
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+            
+            self.metrics.set_gauge("hf_sentiment.queue_depth", self._queue.qsize())
+            # Sizes are counts, not timings: last size plus totals for the mean
+            self.metrics.set_gauge("hf_sentiment.batch_size", len(batch))
+            self.metrics.increment_counter("hf_sentiment.batches")
+            self.metrics.increment_counter("hf_sentiment.batched_texts", len(batch))
+            start_time = time.perf_counter()
+            try:
+                probabilities = await loop.run_in_executor(
+                    self._executor,
+                    self.model.predict,
+                    [text for text, _ in batch]
+                )
+            except Exception as e:
+                logger.error("HF sentiment batch failed", size=len(batch), error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.metrics.record_timing("hf_sentiment.forward", time.perf_counter() - start_time)
+            
+            for (text, future), row in zip(batch, probabilities):
+                if not future.done():
+                    future.set_result(to_sentiment_result(row, text))
+
 
+_batcher: Optional[SentimentBatcher] = None
+
+
+def get_sentiment_batcher() -> SentimentBatcher:
+    """Get or create the HF sentiment batcher singleton."""
+    global _batcher
+    if _batcher is None:
+        _batcher = SentimentBatcher()
+    return _batcher
+
+
+def hf_enabled() -> bool:
+    """Whether local HF sentiment analysis is enabled."""
+    return os.getenv("USE_HUGGINGFACE", "false").lower() == "true"
+
+
+async def analyze_sentiment_hf(ticket_text: str) -> Dict[str, Any]:
+    """
+    Analyze sentiment using a local HuggingFace transformers model.
+    
+    Requests are micro-batched with concurrent ones (see SentimentBatcher).
+    
+    Args:
+        ticket_text: Ticket text
+    
+    Returns:
+        Sentiment analysis result
+    """
+    if not hf_enabled():
+        raise NotImplementedError(
+            "HuggingFace sentiment analysis not enabled. "
+            "Set USE_HUGGINGFACE=true to enable."
+        )
+    
+    return await get_sentiment_batcher().analyze(ticket_text)
@@ -0,0 +1,168 @@
+"""Rule/lexicon sentiment pre-screen for clearly calm or clearly angry tickets."""
+from typing import Dict, Any, Optional
+import re
+
+ANGER_TERMS = {
+    "angry", "furious", "ridiculous", "unacceptable", "outrageous", "terrible",
+    "horrible", "awful", "worst", "useless", "pathetic", "disgusting", "scam",
+    "incompetent", "disgrace", "joke", "livid", "fed up", "sick of", "never again",
+    "had enough", "waste of", "rip off", "ripoff"
+}
+
+# Leaving the service, not routine requests such as cancelling a single order
+CHURN_PHRASES = {
+    "cancel my account", "cancel my subscription", "close my account", "delete my account",
+    "cancelling my account", "canceling my account", "cancelling my subscription",
+    "canceling my subscription", "take my business", "going elsewhere", "competitor",
+    "chargeback", "dispute the charge", "lawyer", "legal action", "report you",
+    "never buy", "never order", "last time i"
+}
+
+PROFANITY = {"damn", "hell", "crap", "wtf", "shit", "fuck", "fucking", "bs", "bullshit", "pissed"}
+
+CALM_MARKERS = {
+    "thank you", "thanks", "please", "appreciate", "could you", "would you", "quick question",
+    "just wondering", "no rush", "when you get a chance", "wondering if", "kind regards"
+}
+
+SARCASM_PHRASES = {
+    "thanks for nothing", "thanks a lot for nothing", "thanks for wasting", "great job",
+    "well done", "big surprise", "yeah right", "so helpful", "oh great"
+}
+
+# Politeness does not make these calm: they need a closer look
+URGENCY_TERMS = {
+    "asap", "as soon as possible", "urgent", "urgently", "immediately", "right now",
+    "emergency", "critical", "deadline"
+}
+
+MONEY_TERMS = {
+    "charged", "charge", "charges", "overcharged", "overdrawn", "refund", "refunded",
+    "billed", "billing", "payment", "money", "fee", "fees", "invoice"
+}
+
+OUTAGE_TERMS = {
+    "down", "outage", "not working", "doesn't work", "does not work", "broken", "crashed",
+    "crashing", "error", "errors", "can't access", "cannot access", "can't log in",
+    "cannot log in", "locked out", "production", "data loss", "lost my"
+}
+
+REPEAT_CONTACT_TERMS = {
+    "again", "still", "second time", "third time", "fourth time", "multiple times",
+    "several times", "keep asking", "already contacted", "already asked", "no response",
+    "no reply", "nobody", "no one", "follow up", "following up"
+}
+
+WORD_PATTERN = re.compile(r"[A-Za-z']+")
+
+
+def _count_terms(text: str, terms) -> int:
+    """Count term occurrences (whole words or phrases) in lowercased text."""
+    return sum(len(re.findall(rf"\b{re.escape(term)}\b", text)) for term in terms)
+
+
+def has_churn_intent(ticket_text: str) -> bool:
+    """Whether the ticket says outright that the customer is leaving."""
+    return _count_terms(ticket_text.lower(), CHURN_PHRASES) > 0
+
+
+def score_lexicon(ticket_text: str) -> Dict[str, Any]:
+    """
+    Extract lexicon features and a rough 0-1 anger score.
+    
+    Args:
+        ticket_text: Ticket text
+    
+    Returns:
+        Feature counts and score
+    """
+    lowered = ticket_text.lower()
+    words = WORD_PATTERN.findall(ticket_text)
+    long_words = [word for word in words if len(word) >= 3]
+    caps_ratio = (
+        sum(1 for word in long_words if word.isupper()) / len(long_words)
+        if long_words else 0.0
+    )
+    features = {
+        "anger": _count_terms(lowered, ANGER_TERMS),
+        "churn": _count_terms(lowered, CHURN_PHRASES),
+        "profanity": _count_terms(lowered, PROFANITY),
+        "calm": _count_terms(lowered, CALM_MARKERS),
+        "sarcasm": _count_terms(lowered, SARCASM_PHRASES),
+        "concerns": (
+            _count_terms(lowered, URGENCY_TERMS)
+            + _count_terms(lowered, MONEY_TERMS)
+            + _count_terms(lowered, OUTAGE_TERMS)
+            + _count_terms(lowered, REPEAT_CONTACT_TERMS)
+            + len(re.findall(r"[$€£]\s?\d", ticket_text))
+        ),
+        "exclamations": ticket_text.count("!"),
+        "caps_ratio": round(caps_ratio, 3)
+    }
+    
+    score = (
+        0.2
+        + 0.15 * min(features["anger"], 3)
+        + 0.2 * min(features["churn"], 2)
+        + 0.2 * min(features["profanity"], 2)
+        + 0.05 * min(features["exclamations"], 4)
+        + 0.5 * min(caps_ratio, 0.6)
+        - 0.05 * min(features["calm"], 2)
+    )
+    features["score"] = round(min(1.0, max(0.0, score)), 3)
+    return features
+
+
+def analyze_sentiment_lexicon(ticket_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Answer unambiguous tickets without a model call.
+    
+    A ticket is clearly angry when it threatens to leave and uses anger
+    terms or profanity, or piles up anger terms and profanity; shouting
+    and exclamation marks alone are not enough. It is clearly calm when
+    it is polite and shows no anger, sarcasm, urgency, money, outage or
+    repeat-contact signal at all. Everything else is ambiguous.
+    
+    Args:
+        ticket_text: Ticket text
+    
+    Returns:
+        Sentiment analysis result, or None if the ticket is ambiguous
+    """
+    features = score_lexicon(ticket_text)
+    anger = features["anger"] + features["profanity"]
+    heated = (
+        anger > 0
+        or features["sarcasm"] > 0
+        or features["exclamations"] >= 2
+        or features["caps_ratio"] >= 0.3
+    )
+    
+    if (features["churn"] and anger) or anger >= 3:
+        churn_risk = features["churn"] > 0
+        return {
+            "score": max(features["score"], 0.8),
+            "level": "ANGRY",
+            "urgency": "HIGH",
+            "churn_risk": churn_risk,
+            "requires_human": True,
+            "recommended_handler": "MANAGER" if churn_risk else "HUMAN"
+        }
+    
+    if (
+        features["calm"]
+        and not heated
+        and not features["churn"]
+        and not features["concerns"]
+        and features["caps_ratio"] < 0.1
+    ):
+        return {
+            "score": min(features["score"], 0.2),
+            "level": "CALM",
+            "urgency": "LOW",
+            "churn_risk": False,
+            "requires_human": False,
+            "recommended_handler": "BOT"
+        }
+    
+    return None
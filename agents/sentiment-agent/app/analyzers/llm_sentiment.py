@@ -14,7 +14,7 @@ async def analyze_sentiment_llm(ticket_text: str) -> Dict[str, Any]:
     Returns:
         Sentiment analysis result
     """
-    llm = get_llm_provider()
+    llm = get_llm_provider("sentiment")
     prompt = get_sentiment_analysis_prompt(ticket_text)
     schema = get_sentiment_schema()
     
@@ -7,6 +7,7 @@ class SentimentAnalysisRequest(BaseModel):
     """Request model for sentiment analysis."""
     ticket_id: str
     text: str = Field(..., min_length=1)
+    persist: bool = True  # False when the orchestrator persists the result
 
 
 class SentimentAnalysisResponse(BaseModel):
@@ -16,6 +16,7 @@ sys.path.insert(0, str(project_root))
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
+from app.analyzers.huggingface_sentiment import hf_enabled, get_sentiment_batcher
 
 app = FastAPI(
     title="Sentiment Agent",
@@ -36,6 +37,20 @@ app.add_middleware(
 app.include_router(router, prefix="/api", tags=["sentiment"])
 
 
+@app.on_event("startup")
+async def startup():
+    """Load the local sentiment model before serving requests."""
+    if hf_enabled():
+        await get_sentiment_batcher().start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the local sentiment batcher."""
+    if hf_enabled():
+        await get_sentiment_batcher().stop()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,7 +1,7 @@
 """Health check endpoints."""
 from fastapi import APIRouter
-import httpx
-import os
+from orchestrator.app.core.http_pool import get_agent_pool
+from tools.database.postgres import get_pool_stats
 
 router = APIRouter()
 
@@ -9,18 +9,13 @@ router = APIRouter()
 @router.get("/health/detailed")
 async def detailed_health_check():
     """Detailed health check including agent status."""
-    agents = {
-        "router": os.getenv("ROUTER_AGENT_URL", "http://localhost:8001"),
-        "knowledge": os.getenv("KNOWLEDGE_AGENT_URL", "http://localhost:8002"),
-        "sentiment": os.getenv("SENTIMENT_AGENT_URL", "http://localhost:8003"),
-        "decision": os.getenv("DECISION_AGENT_URL", "http://localhost:8004")
-    }
+    pool = get_agent_pool()
     
     agent_status = {}
-    for name, url in agents.items():
+    for name, url in pool.agent_urls.items():
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{url}/api/health")
+            async with pool.client(name) as client:
+                response = await client.get("/api/health", timeout=5.0)
                 agent_status[name] = {
                     "status": "healthy" if response.status_code == 200 else "unhealthy",
                     "url": url
@@ -38,4 +33,7 @@ async def detailed_health_check():
     }
 
 
-
+@router.get("/health/pools")
+async def connection_pool_stats():
+    """Agent and database connection pool saturation statistics."""
+    return {"agents": get_agent_pool().get_stats(), "database": get_pool_stats()}
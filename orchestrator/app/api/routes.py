@@ -1,11 +1,20 @@
 """API routes for Orchestrator."""
+import os
+import json
 from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any
 from orchestrator.app.models.ticket import (
     TicketCreateRequest,
-    TicketProcessingResponse
+    TicketBatchCreateRequest,
+    TicketBatchItemResponse,
+    TicketProcessingResponse,
+    TicketAcceptedResponse
 )
 from orchestrator.app.core.orchestrator import Orchestrator
+from orchestrator.app.core.worker_pool import TicketWorkerPool
+from orchestrator.app.core.events import get_event_bus
+from orchestrator.app.core.result_cache import invalidate_pipeline_cache
 from tools.database.postgres import get_db_session
 from tools.database.models.ticket import Ticket
 from tools.database.models.classification import Classification
@@ -15,6 +24,7 @@ from tools.database.models.decision import Decision
 
 router = APIRouter()
 orchestrator = Orchestrator()
+worker_pool = TicketWorkerPool(orchestrator)
 
 
 @router.get("/tickets", response_model=List[dict])
@@ -159,6 +169,34 @@ async def get_ticket(ticket_id: str):
         raise HTTPException(status_code=404, detail="Ticket not found")
 
 
+@router.get("/tickets/{ticket_id}/events")
+async def stream_ticket_events(ticket_id: str) -> StreamingResponse:
+    """
+    Stream per-stage workflow progress as server-sent events.
+    
+    Each stage (router, knowledge, sentiment, decision) is pushed as soon as
+    it finishes, followed by a final ``completed`` or ``failed`` event.
+    Stages that finished before the client connected are replayed first.
+    
+    Args:
+        ticket_id: Ticket ID
+        
+    Returns:
+        text/event-stream response
+    """
+    timeout = float(os.getenv("EVENT_STREAM_IDLE_TIMEOUT", "60"))
+    
+    async def event_stream():
+        async for event in get_event_bus().subscribe(ticket_id, timeout=timeout):
+            yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/tickets", response_model=TicketProcessingResponse)
 async def create_ticket(request: TicketCreateRequest) -> TicketProcessingResponse:
     """
@@ -177,26 +215,7 @@ async def create_ticket(request: TicketCreateRequest) -> TicketProcessingRespons
             body=request.body
         )
         
-        # Ensure workflow is serializable
-        workflow_data = result.get("workflow", {})
-        if workflow_data:
-            # Convert any non-serializable values
-            import json
-            try:
-                json.dumps(workflow_data)  # Test if serializable
-            except (TypeError, ValueError):
-                # Convert to serializable format
-                workflow_data = json.loads(json.dumps(workflow_data, default=str))
-        
-        return TicketProcessingResponse(
-            ticket_id=result["ticket_id"],
-            status=result["status"],
-            decision=result.get("decision"),
-            solution=result.get("solution"),
-            escalated=result.get("escalated", False),
-            message=result.get("message", "Ticket processed"),
-            workflow=workflow_data
-        )
+        return _to_processing_response(result)
     except Exception as e:
         import traceback
         import logging
@@ -205,6 +224,128 @@ async def create_ticket(request: TicketCreateRequest) -> TicketProcessingRespons
         raise HTTPException(status_code=500, detail=error_detail)
 
 
+@router.post("/tickets/async", response_model=TicketAcceptedResponse, status_code=202)
+async def create_ticket_async(request: TicketCreateRequest) -> TicketAcceptedResponse:
+    """
+    Create a ticket and queue it for background processing.
+    
+    Returns as soon as the ticket is persisted; progress is polled through
+    ``GET /api/tickets/{ticket_id}``.
+    
+    Args:
+        request: Ticket creation request
+        
+    Returns:
+        Accepted ticket ID
+    """
+    try:
+        ticket_id = await orchestrator._create_ticket(
+            request.customer_id,
+            request.subject,
+            request.body
+        )
+    except Exception as e:
+        # Without a persisted ticket there is nothing to poll
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {type(e).__name__}: {str(e)}")
+    
+    try:
+        await worker_pool.submit({
+            "ticket_id": ticket_id,
+            "customer_id": request.customer_id,
+            "subject": request.subject,
+            "body": request.body
+        })
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Job queue unavailable: {type(e).__name__}: {str(e)}")
+    
+    return TicketAcceptedResponse(
+        ticket_id=ticket_id,
+        status="queued",
+        message="Ticket accepted for processing"
+    )
+
+
+@router.post("/tickets/batch")
+async def create_tickets_batch(request: TicketBatchCreateRequest) -> StreamingResponse:
+    """
+    Create and process a batch of tickets.
+    
+    Tickets are inserted together and processed with bounded concurrency.
+    Results are streamed back as newline-delimited JSON, one line per
+    ticket in completion order; each line carries the ticket's ``index``
+    in the request.
+    
+    Args:
+        request: Batch creation request
+        
+    Returns:
+        NDJSON stream of per-ticket results
+    """
+    max_batch_size = int(os.getenv("BATCH_MAX_TICKETS", "1000"))
+    if len(request.tickets) > max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(request.tickets)} tickets (max {max_batch_size})"
+        )
+    
+    async def stream_results():
+        async for result in orchestrator.process_batch(
+            tickets=[ticket.model_dump() for ticket in request.tickets],
+            max_concurrency=request.max_concurrency
+        ):
+            if result.get("status") == "failed":
+                item = TicketBatchItemResponse(**result)
+            else:
+                item = TicketBatchItemResponse(
+                    index=result["index"],
+                    **_to_processing_response(result).model_dump()
+                )
+            yield item.model_dump_json() + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+def _to_processing_response(result: Dict[str, Any]) -> TicketProcessingResponse:
+    """Convert an orchestrator result into the API response model."""
+    # Ensure workflow is serializable
+    workflow_data = result.get("workflow", {})
+    if workflow_data:
+        # Convert any non-serializable values
+        try:
+            json.dumps(workflow_data)  # Test if serializable
+        except (TypeError, ValueError):
+            # Convert to serializable format
+            workflow_data = json.loads(json.dumps(workflow_data, default=str))
+    
+    return TicketProcessingResponse(
+        ticket_id=result["ticket_id"],
+        status=result["status"],
+        decision=result.get("decision"),
+        solution=result.get("solution"),
+        escalated=result.get("escalated", False),
+        message=result.get("message", "Ticket processed"),
+        workflow=workflow_data
+    )
+
+
+@router.post("/cache/invalidate")
+async def invalidate_cache():
+    """
+    Invalidate cached pipeline results.
+    
+    Call after the knowledge base changes so repeated tickets are
+    re-evaluated against the new cases.
+    
+    Returns:
+        New cache generation
+    """
+    try:
+        generation = await invalidate_pipeline_cache()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Cache unavailable: {type(e).__name__}: {str(e)}")
+    return {"status": "invalidated", "generation": generation}
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,291 @@
+"""Declarative workflow DAG engine."""
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+from orchestrator.app.core.error_handler import retry_with_backoff
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StageNode:
+    """
+    One stage of a workflow.
+
+    The stage function is called with the values named in ``inputs`` as
+    keyword arguments. With a single output its return value is stored under
+    that name; with several outputs it must return a dict keyed by them.
+    """
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)  # Ordering-only dependencies
+    timeout: Optional[float] = None  # Per attempt, in seconds
+    max_retries: int = 1
+    retry_delay: float = 1.0
+    condition: Optional[Callable[[Dict[str, Any]], bool]] = None  # Skip node when it returns False
+    defaults: Dict[str, Any] = field(default_factory=dict)  # Outputs used when the node is skipped
+
+
+@dataclass
+class NodeRun:
+    """Execution record of one node."""
+    status: str = "pending"  # pending, running, done, skipped, failed
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    attempts: int = 0
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+class WorkflowRun:
+    """State of one workflow execution: values, node records and running tasks."""
+
+    def __init__(self, dag: "WorkflowDAG", initial: Dict[str, Any]):
+        self.dag = dag
+        self.values: Dict[str, Any] = dict(initial)
+        self.nodes: Dict[str, NodeRun] = {name: NodeRun() for name in dag.nodes}
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def skip(self, name: str, outputs: Optional[Dict[str, Any]] = None):
+        """
+        Skip a node that has not finished yet, cancelling it if running.
+
+        Args:
+            name: Node name
+            outputs: Output values to use instead (defaults to node.defaults)
+        """
+        record = self.nodes[name]
+        if record.status in ("done", "skipped", "failed"):
+            return
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+        self._mark_skipped(name, outputs)
+
+    def _mark_skipped(self, name: str, outputs: Optional[Dict[str, Any]] = None):
+        node = self.dag.nodes[name]
+        record = self.nodes[name]
+        record.status = "skipped"
+        record.finished_at = time.time()
+        if record.started_at is None:
+            record.started_at = record.finished_at
+        values = dict(node.defaults)
+        values.update(outputs or {})
+        for output in node.outputs:
+            self.values.setdefault(output, values.get(output))
+
+    def critical_path(self) -> List[str]:
+        """
+        Chain of nodes that determined the total run time.
+
+        Walks back from the last node to finish through whichever dependency
+        finished last.
+        """
+        finished = {
+            name: record for name, record in self.nodes.items()
+            if record.finished_at is not None and record.status == "done"
+        }
+        if not finished:
+            return []
+
+        path = []
+        current = max(finished, key=lambda name: finished[name].finished_at)
+        while current is not None:
+            path.append(current)
+            deps = [dep for dep in self.dag.dependencies[current] if dep in finished]
+            current = max(deps, key=lambda name: finished[name].finished_at) if deps else None
+        return list(reversed(path))
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-node status, offset from run start and duration in seconds."""
+        return {
+            name: {
+                "status": record.status,
+                "start": (record.started_at - self.started_at) if record.started_at else None,
+                "duration": record.duration,
+                "attempts": record.attempts
+            }
+            for name, record in self.nodes.items()
+        }
+
+
+class WorkflowDAG:
+    """A set of stage nodes scheduled by their data and ordering dependencies."""
+
+    def __init__(self, nodes: List[StageNode], initial_inputs: Optional[List[str]] = None):
+        """
+        Build and validate a workflow.
+
+        Args:
+            nodes: Stage nodes
+            initial_inputs: Names of values supplied when the workflow is run
+
+        Raises:
+            ValueError: If names clash, an input has no producer or there is a cycle
+        """
+        self.nodes: Dict[str, StageNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate stage name: {node.name}")
+            self.nodes[node.name] = node
+
+        self.initial_inputs = list(initial_inputs or [])
+        producers: Dict[str, str] = {}
+        for node in nodes:
+            for output in node.outputs:
+                if output in producers or output in self.initial_inputs:
+                    raise ValueError(f"Value '{output}' is produced more than once")
+                producers[output] = node.name
+
+        self.dependencies: Dict[str, List[str]] = {}
+        for node in nodes:
+            deps = []
+            for name in node.inputs:
+                if name in producers:
+                    deps.append(producers[name])
+                elif name not in self.initial_inputs:
+                    raise ValueError(f"Stage '{node.name}' needs '{name}' which nothing provides")
+            for name in node.after:
+                if name not in self.nodes:
+                    raise ValueError(f"Stage '{node.name}' runs after unknown stage '{name}'")
+                deps.append(name)
+            self.dependencies[node.name] = list(dict.fromkeys(deps))
+
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        """Raise ValueError if dependencies contain a cycle."""
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Workflow has a cycle through stage '{name}'")
+            visiting.add(name)
+            for dep in self.dependencies[name]:
+                visit(dep)
+            visiting.remove(name)
+            visited.add(name)
+
+        for name in self.nodes:
+            visit(name)
+
+    async def run(
+        self,
+        initial: Dict[str, Any],
+        on_node_complete: Optional[Callable[[WorkflowRun, str], Awaitable[None]]] = None
+    ) -> WorkflowRun:
+        """
+        Execute the workflow, running independent nodes concurrently.
+
+        Args:
+            initial: Values for initial_inputs
+            on_node_complete: Awaited after each node finishes successfully;
+                it may call ``run.skip()`` on downstream nodes
+
+        Returns:
+            Completed workflow run
+
+        Raises:
+            Exception: First node failure (remaining nodes are cancelled)
+        """
+        run = WorkflowRun(self, initial)
+
+        try:
+            while True:
+                self._start_ready_nodes(run)
+                if not run._tasks:
+                    break
+
+                done, _ = await asyncio.wait(
+                    set(run._tasks.values()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for name, task in list(run._tasks.items()):
+                    # A completion hook may already have skipped this node
+                    if task not in done or run._tasks.get(name) is not task:
+                        continue
+                    del run._tasks[name]
+                    record = run.nodes[name]
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        record.status = "failed"
+                        raise task.exception()
+
+                    self._store_outputs(run, name, task.result())
+                    record.status = "done"
+                    if on_node_complete is not None:
+                        await on_node_complete(run, name)
+        finally:
+            for task in run._tasks.values():
+                task.cancel()
+            run._tasks = {}
+            run.finished_at = time.time()
+
+        return run
+
+    def _start_ready_nodes(self, run: WorkflowRun):
+        """Start (or skip) every pending node whose dependencies have finished."""
+        progressed = True
+        while progressed:
+            progressed = False
+            for name, node in self.nodes.items():
+                record = run.nodes[name]
+                if record.status != "pending":
+                    continue
+                if any(run.nodes[dep].status not in ("done", "skipped") for dep in self.dependencies[name]):
+                    continue
+
+                if node.condition is not None and not node.condition(run.values):
+                    run._mark_skipped(name)
+                    progressed = True  # Skipping may unblock other nodes
+                    continue
+
+                record.status = "running"
+                record.started_at = time.time()
+                kwargs = {key: run.values.get(key) for key in node.inputs}
+                run._tasks[name] = asyncio.create_task(self._execute(node, record, kwargs))
+
+    @staticmethod
+    async def _execute(node: StageNode, record: NodeRun, kwargs: Dict[str, Any]) -> Any:
+        """Run a node with its timeout and retry policy."""
+        async def attempt(**call_kwargs):
+            record.attempts += 1
+            if node.timeout:
+                return await asyncio.wait_for(node.func(**call_kwargs), timeout=node.timeout)
+            return await node.func(**call_kwargs)
+
+        attempt.__name__ = node.name
+        try:
+            return await retry_with_backoff(
+                attempt,
+                max_retries=node.max_retries,
+                initial_delay=node.retry_delay,
+                **kwargs
+            )
+        finally:
+            # Stamped here, not when run() reaps the task, which can be later
+            # (another node's completion hook, several nodes in one wakeup)
+            if record.finished_at is None:
+                record.finished_at = time.time()
+
+    def _store_outputs(self, run: WorkflowRun, name: str, result: Any):
+        """Store a node's return value under its declared outputs."""
+        node = self.nodes[name]
+        if len(node.outputs) == 1:
+            run.values[node.outputs[0]] = result
+        elif node.outputs:
+            for output in node.outputs:
+                run.values[output] = result.get(output)
@@ -0,0 +1,156 @@
+"""Per-ticket workflow progress events."""
+import os
+import json
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, AsyncIterator
+from tools.cache import redis_client
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Event types that end a ticket's stream
+TERMINAL_EVENTS = ("completed", "failed")
+
+
+def make_event(ticket_id: str, event_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a workflow event."""
+    return {
+        "ticket_id": str(ticket_id),
+        "type": event_type,
+        "data": data or {},
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+class WorkflowEventBus(ABC):
+    """Publishes stage results of a ticket to its subscribers."""
+
+    @abstractmethod
+    async def publish(self, ticket_id: str, event: Dict[str, Any]):
+        """Publish an event for a ticket."""
+        pass
+
+    @abstractmethod
+    def subscribe(self, ticket_id: str, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a ticket's events.
+
+        Events already published are replayed first, so subscribing after
+        submission does not miss early stages. The stream ends after a
+        terminal event or when no event arrives within timeout seconds.
+        """
+        pass
+
+
+class InMemoryEventBus(WorkflowEventBus):
+    """Process-local event bus (events only visible on the processing instance)."""
+
+    def __init__(self, max_tickets: int = 1000):
+        """Initialize event bus keeping history for the last max_tickets tickets."""
+        self.max_tickets = max_tickets
+        self._history: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    async def publish(self, ticket_id: str, event: Dict[str, Any]):
+        """Record event and push it to live subscribers."""
+        ticket_id = str(ticket_id)
+        self._history.setdefault(ticket_id, []).append(event)
+        self._history.move_to_end(ticket_id)
+        while len(self._history) > self.max_tickets:
+            self._history.popitem(last=False)
+
+        for queue in self._subscribers.get(ticket_id, []):
+            queue.put_nowait(event)
+
+    async def subscribe(self, ticket_id: str, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """Replay history, then yield live events."""
+        ticket_id = str(ticket_id)
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(ticket_id, []).append(queue)
+        # Snapshot taken with the queue registered: earlier events come from
+        # history, later ones from the queue, none twice
+        history = list(self._history.get(ticket_id, []))
+        try:
+            for event in history:
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    return
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+        finally:
+            self._subscribers[ticket_id].remove(queue)
+            if not self._subscribers[ticket_id]:
+                del self._subscribers[ticket_id]
+
+
+class RedisStreamEventBus(WorkflowEventBus):
+    """Event bus on one Redis stream per ticket, shared by all instances."""
+
+    def __init__(self, ttl: Optional[int] = None):
+        """Initialize Redis event bus; ticket streams expire after ttl seconds."""
+        self.ttl = ttl or int(os.getenv("EVENT_STREAM_TTL", "3600"))
+
+    @staticmethod
+    def _stream(ticket_id: str) -> str:
+        return f"tickets:events:{ticket_id}"
+
+    async def publish(self, ticket_id: str, event: Dict[str, Any]):
+        """Append event to the ticket's stream."""
+        stream = self._stream(ticket_id)
+        await redis_client.stream_add(stream, {"event": json.dumps(event)})
+        await redis_client.expire(stream, self.ttl)
+
+    async def subscribe(self, ticket_id: str, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """Read the ticket's stream from the beginning, blocking for new events."""
+        stream = self._stream(ticket_id)
+        last_id = "0"
+        while True:
+            entries = await redis_client.stream_read(stream, last_id, block_ms=int(timeout * 1000))
+            if not entries:
+                return
+            for entry_id, fields in entries:
+                last_id = entry_id
+                event = json.loads(fields["event"])
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+
+
+_event_bus: Optional[WorkflowEventBus] = None
+
+
+def get_event_bus() -> WorkflowEventBus:
+    """
+    Get global event bus for configured backend.
+
+    EVENT_BUS_BACKEND is "memory" (default) or "redis"; use redis when
+    tickets are processed by workers on another instance.
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    global _event_bus
+    if _event_bus is not None:
+        return _event_bus
+
+    backend = os.getenv("EVENT_BUS_BACKEND", "memory").lower()
+    if backend == "memory":
+        _event_bus = InMemoryEventBus()
+    elif backend == "redis":
+        _event_bus = RedisStreamEventBus()
+    else:
+        raise ValueError(
+            f"Unknown event bus backend: {backend}. "
+            f"Supported backends: memory, redis"
+        )
+    return _event_bus
@@ -0,0 +1,130 @@
+"""Shared HTTP connection pools for orchestrator-to-agent calls."""
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+import httpx
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AgentClientPool:
+    """
+    Long-lived httpx clients, one connection pool per agent.
+
+    Clients are created on application startup and closed on shutdown so
+    TCP/TLS connections are reused across tickets instead of being opened
+    for every agent call.
+    """
+
+    def __init__(self):
+        """Initialize pool configuration from environment."""
+        self.agent_urls = {
+            "router": os.getenv("ROUTER_AGENT_URL", "http://localhost:8001"),
+            "knowledge": os.getenv("KNOWLEDGE_AGENT_URL", "http://localhost:8002"),
+            "sentiment": os.getenv("SENTIMENT_AGENT_URL", "http://localhost:8003"),
+            "decision": os.getenv("DECISION_AGENT_URL", "http://localhost:8004")
+        }
+        self.max_connections = int(os.getenv("AGENT_POOL_MAX_CONNECTIONS", "100"))
+        self.max_keepalive = int(os.getenv("AGENT_POOL_MAX_KEEPALIVE", "20"))
+        self.keepalive_expiry = float(os.getenv("AGENT_POOL_KEEPALIVE_EXPIRY", "30.0"))
+        self.timeout = float(os.getenv("AGENT_POOL_TIMEOUT", "30.0"))
+        self.http2 = os.getenv("AGENT_POOL_HTTP2", "true").lower() == "true"
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._in_flight: Dict[str, int] = {name: 0 for name in self.agent_urls}
+        self.metrics = get_metrics_collector()
+
+    def _build_client(self, name: str) -> httpx.AsyncClient:
+        """Create the pooled client for one agent."""
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry
+        )
+        try:
+            return httpx.AsyncClient(
+                base_url=self.agent_urls[name],
+                limits=limits,
+                timeout=self.timeout,
+                http2=self.http2
+            )
+        except ImportError:
+            # HTTP/2 needs the optional 'h2' package
+            logger.warning("HTTP/2 support not installed, falling back to HTTP/1.1", agent=name)
+            return httpx.AsyncClient(
+                base_url=self.agent_urls[name],
+                limits=limits,
+                timeout=self.timeout
+            )
+
+    async def start(self):
+        """Create pooled clients for all agents."""
+        for name in self.agent_urls:
+            if name not in self._clients:
+                self._clients[name] = self._build_client(name)
+        logger.info(
+            "Agent connection pools started",
+            agents=list(self._clients),
+            max_connections=self.max_connections,
+            http2=self.http2
+        )
+
+    async def close(self):
+        """Close all pooled clients."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients = {}
+
+    def get_client(self, name: str) -> httpx.AsyncClient:
+        """Get the pooled client for an agent (created lazily if not started)."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._build_client(name)
+            self._clients[name] = client
+        return client
+
+    @asynccontextmanager
+    async def client(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow an agent client while tracking in-flight requests."""
+        self._in_flight[name] = self._in_flight.get(name, 0) + 1
+        self._record_saturation(name)
+        try:
+            yield self.get_client(name)
+        finally:
+            self._in_flight[name] -= 1
+            self._record_saturation(name)
+
+    def _record_saturation(self, name: str):
+        """Publish pool saturation gauge for an agent."""
+        self.metrics.set_gauge(
+            f"agent_pool_saturation.{name}",
+            self._in_flight[name] / self.max_connections if self.max_connections else 0.0
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool saturation statistics per agent."""
+        stats = {}
+        for name, url in self.agent_urls.items():
+            in_flight = self._in_flight.get(name, 0)
+            stats[name] = {
+                "url": url,
+                "open": name in self._clients and not self._clients[name].is_closed,
+                "in_flight": in_flight,
+                "max_connections": self.max_connections,
+                "saturation": in_flight / self.max_connections if self.max_connections else 0.0
+            }
+        return stats
+
+
+# Global agent client pool
+_agent_pool: Optional[AgentClientPool] = None
+
+
+def get_agent_pool() -> AgentClientPool:
+    """Get global agent client pool."""
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentClientPool()
+    return _agent_pool
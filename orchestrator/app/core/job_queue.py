@@ -0,0 +1,169 @@
+"""Job queues for asynchronous ticket processing."""
+import os
+import json
+import uuid
+import asyncio
+import socket
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Tuple
+from tools.cache import redis_client
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobQueue(ABC):
+    """Base class for ticket job queues."""
+
+    @abstractmethod
+    async def enqueue(self, job: Dict[str, Any]) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            job: JSON-serializable job payload
+
+        Returns:
+            Job ID
+        """
+        pass
+
+    @abstractmethod
+    async def dequeue(self, consumer: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Take the next job for a consumer.
+
+        Args:
+            consumer: Consumer (worker) name
+
+        Returns:
+            (job_id, job) or None if no job is available
+        """
+        pass
+
+    @abstractmethod
+    async def ack(self, job_id: str):
+        """Mark a job as done so it is not delivered again."""
+        pass
+
+    async def close(self):
+        """Release queue resources."""
+        pass
+
+
+class InMemoryJobQueue(JobQueue):
+    """Process-local job queue (not durable, for tests and single-node dev)."""
+
+    def __init__(self, poll_timeout: float = 1.0):
+        """Initialize in-memory queue."""
+        self.poll_timeout = poll_timeout
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def enqueue(self, job: Dict[str, Any]) -> str:
+        """Add a job to the queue."""
+        job_id = uuid.uuid4().hex
+        await self._queue.put((job_id, job))
+        return job_id
+
+    async def dequeue(self, consumer: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Take the next job, waiting up to poll_timeout seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=self.poll_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def ack(self, job_id: str):
+        """Jobs are removed on dequeue, nothing to acknowledge."""
+        pass
+
+    def qsize(self) -> int:
+        """Number of jobs waiting."""
+        return self._queue.qsize()
+
+
+class RedisStreamJobQueue(JobQueue):
+    """
+    Durable job queue backed by a Redis Stream and consumer group.
+
+    Jobs stay in the group's pending list until acknowledged, so jobs held by
+    a worker that died are re-claimed by another worker after claim_idle_ms.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[str] = None,
+        group: Optional[str] = None,
+        block_ms: int = 1000,
+        claim_idle_ms: Optional[int] = None
+    ):
+        """Initialize Redis Streams queue."""
+        self.stream = stream or os.getenv("JOB_QUEUE_STREAM", "tickets:jobs")
+        self.group = group or os.getenv("JOB_QUEUE_GROUP", "orchestrator-workers")
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms or int(os.getenv("JOB_QUEUE_CLAIM_IDLE_MS", "300000"))
+        self.consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+
+    async def _ensure_group(self):
+        """Create the consumer group on first use."""
+        if not self._group_ready:
+            await redis_client.stream_create_group(self.stream, self.group)
+            self._group_ready = True
+
+    async def enqueue(self, job: Dict[str, Any]) -> str:
+        """Append a job to the stream."""
+        await self._ensure_group()
+        return await redis_client.stream_add(self.stream, {"payload": json.dumps(job)})
+
+    async def dequeue(self, consumer: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Take a stale pending job if any, otherwise wait for a new one."""
+        await self._ensure_group()
+        consumer_name = f"{self.consumer_prefix}-{consumer}"
+
+        entries = await redis_client.stream_claim_stale(
+            self.stream, self.group, consumer_name, self.claim_idle_ms, count=1
+        )
+        if not entries:
+            entries = await redis_client.stream_read_group(
+                self.stream, self.group, consumer_name, count=1, block_ms=self.block_ms
+            )
+        if not entries:
+            return None
+
+        entry_id, fields = entries[0]
+        try:
+            return entry_id, json.loads(fields["payload"])
+        except (KeyError, ValueError) as e:
+            # Malformed entry would be redelivered forever, drop it
+            logger.error("Dropping malformed job", job_id=entry_id, error=str(e))
+            await self.ack(entry_id)
+            return None
+
+    async def ack(self, job_id: str):
+        """Acknowledge and delete a finished job."""
+        await redis_client.stream_ack(self.stream, self.group, job_id)
+
+
+def create_job_queue(backend: Optional[str] = None) -> JobQueue:
+    """
+    Create job queue for configured backend.
+
+    Args:
+        backend: "redis" or "memory" (defaults to JOB_QUEUE_BACKEND)
+
+    Returns:
+        Job queue instance
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    backend = (backend or os.getenv("JOB_QUEUE_BACKEND", "redis")).lower()
+
+    if backend == "redis":
+        return RedisStreamJobQueue()
+    elif backend == "memory":
+        return InMemoryJobQueue()
+    raise ValueError(
+        f"Unknown job queue backend: {backend}. "
+        f"Supported backends: redis, memory"
+    )
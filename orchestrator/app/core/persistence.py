@@ -0,0 +1,169 @@
+"""Orchestrator-owned persistence of stage results."""
+import os
+from typing import Dict, Any, List, Optional
+from tools.database.postgres import get_db_session
+from tools.database.models.ticket import Ticket, TicketStatus
+from tools.database.models.classification import Classification
+from tools.database.models.knowledge_search import KnowledgeSearch
+from tools.database.models.sentiment import Sentiment, SentimentLevel
+from tools.database.models.decision import Decision, DecisionType
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def build_stage_records(ticket: Ticket, results: Dict[str, Any]) -> List[Any]:
+    """
+    Build database rows for stage results.
+
+    Args:
+        ticket: Ticket the results belong to
+        results: Any of router_result, knowledge_result, sentiment_result, decision_result
+
+    Returns:
+        Unsaved Classification, KnowledgeSearch, Sentiment and Decision rows
+    """
+    records = []
+
+    router_result = results.get("router_result")
+    if router_result:
+        records.append(Classification(
+            ticket_id=ticket.ticket_id,
+            category=router_result.get("category", "OTHER"),
+            subcategory=router_result.get("subcategory"),
+            confidence=router_result.get("confidence", 0.0),
+            reason=router_result.get("reason")
+        ))
+
+    knowledge_result = results.get("knowledge_result")
+    if knowledge_result:
+        records.append(KnowledgeSearch(
+            ticket_id=ticket.ticket_id,
+            query=str(ticket.ticket_id),
+            similar_cases_found=knowledge_result.get("similar_cases_found", 0),
+            top_match_case_id=knowledge_result.get("top_match_case_id"),
+            similarity_score=knowledge_result.get("similarity_score"),
+            solution=knowledge_result.get("solution"),
+            solution_confidence=knowledge_result.get("confidence"),
+            solvable_without_escalation=knowledge_result.get("solvable_without_escalation", False),
+            similar_cases_data=knowledge_result.get("similar_cases")
+        ))
+
+    sentiment_result = results.get("sentiment_result")
+    if sentiment_result:
+        # An unknown level must not fail the transaction holding every stage row
+        level = sentiment_result.get("level", "NEUTRAL")
+        if level not in SentimentLevel.__members__:
+            logger.warning(f"Unknown sentiment level '{level}', saving NEUTRAL")
+            level = "NEUTRAL"
+        records.append(Sentiment(
+            ticket_id=ticket.ticket_id,
+            score=sentiment_result.get("score", 0.5),
+            level=SentimentLevel[level],
+            urgency=sentiment_result.get("urgency"),
+            churn_risk=sentiment_result.get("churn_risk", False),
+            requires_human=sentiment_result.get("requires_human", False),
+            recommended_handler=sentiment_result.get("recommended_handler")
+        ))
+
+    decision_result = results.get("decision_result")
+    if decision_result:
+        decision = decision_result.get("decision", "ESCALATE_TO_HUMAN")
+        if decision not in DecisionType.__members__:
+            logger.warning(f"Unknown decision '{decision}', saving ESCALATE_TO_HUMAN")
+            decision = "ESCALATE_TO_HUMAN"
+        records.append(Decision(
+            ticket_id=ticket.ticket_id,
+            final_decision=DecisionType[decision],
+            confidence=decision_result.get("confidence", 0.0),
+            reasoning=decision_result.get("reasoning"),
+            context=decision_result.get("context"),
+            priority=decision_result.get("priority"),
+            sla_minutes=decision_result.get("sla_minutes"),
+            ai_confidence=decision_result.get("reasoning")
+        ))
+
+    return records
+
+
+async def save_stage_results(
+    ticket_id: str,
+    results: Dict[str, Any],
+    status: Optional[TicketStatus] = None
+):
+    """
+    Save stage results and optionally the ticket status in one transaction.
+
+    Args:
+        ticket_id: Ticket ID
+        results: Any of router_result, knowledge_result, sentiment_result, decision_result
+        status: New ticket status (unchanged if omitted)
+    """
+    async for session in get_db_session():
+        ticket = await session.get(Ticket, ticket_id)
+        if not ticket:
+            return
+
+        session.add_all(build_stage_records(ticket, results))
+        if status is not None:
+            ticket.status = status
+
+        await session.commit()
+        break
+
+
+def get_persistence_mode() -> str:
+    """
+    Get configured persistence mode.
+
+    ORCHESTRATOR_PERSISTENCE is "agent" (default: every agent saves its own
+    result) or "orchestrator" (agents skip saving and the orchestrator writes
+    all results through a StageResultWriter).
+    """
+    mode = os.getenv("ORCHESTRATOR_PERSISTENCE", "agent").lower()
+    if mode not in ("agent", "orchestrator"):
+        logger.warning(f"Unknown persistence mode '{mode}', using agent")
+        mode = "agent"
+    return mode
+
+
+def get_persistence_checkpoints() -> List[str]:
+    """Stages after which pending results are flushed (PERSISTENCE_CHECKPOINTS)."""
+    names = os.getenv("PERSISTENCE_CHECKPOINTS", "")
+    return [name.strip().lower() for name in names.split(",") if name.strip()]
+
+
+class StageResultWriter:
+    """
+    Collects stage results and status changes of one ticket.
+
+    Nothing is written until flush(), which saves everything collected since
+    the previous flush in a single transaction.
+    """
+
+    def __init__(self, ticket_id: str):
+        """Initialize writer for a ticket."""
+        self.ticket_id = ticket_id
+        self.results: Dict[str, Any] = {}
+        self.status: Optional[TicketStatus] = None
+
+    def add(self, name: str, result: Dict[str, Any]):
+        """Collect a stage result (e.g. "router_result")."""
+        self.results[name] = result
+
+    def set_status(self, status: TicketStatus):
+        """Record the latest ticket status."""
+        self.status = status
+
+    @property
+    def pending(self) -> bool:
+        """Whether anything is waiting to be written."""
+        return bool(self.results) or self.status is not None
+
+    async def flush(self):
+        """Write collected results and status in one transaction."""
+        if not self.pending:
+            return
+        await save_stage_results(self.ticket_id, self.results, self.status)
+        self.results = {}
+        self.status = None
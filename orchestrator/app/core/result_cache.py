@@ -0,0 +1,92 @@
+"""Content-hash cache of full pipeline results."""
+import os
+import re
+import hashlib
+from typing import Dict, Any, Optional
+from tools.cache import redis_client
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped to invalidate every cached result (e.g. after knowledge base changes)
+GENERATION_KEY = "pipeline_cache:generation"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize ticket text so trivially different copies share a cache key."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class PipelineResultCache:
+    """
+    Redis cache of router, knowledge, sentiment and decision results.
+
+    Keys are a hash of the customer and the normalized subject and body, and
+    include a generation number so the whole cache can be
+    invalidated with a single INCR.
+    """
+
+    def __init__(self):
+        """Initialize cache configuration from environment."""
+        self.enabled = os.getenv("PIPELINE_CACHE_ENABLED", "false").lower() == "true"
+        self.ttl = int(os.getenv("PIPELINE_CACHE_TTL", "3600"))
+        # Sharing results across customers replays one customer's resolution
+        # text to another, so it has to be switched on explicitly
+        self.scope_by_customer = os.getenv("PIPELINE_CACHE_SCOPE_CUSTOMER", "true").lower() == "true"
+        self.metrics = get_metrics_collector()
+
+    async def _key(self, customer_id: str, subject: str, body: str) -> str:
+        """Build the cache key for a ticket."""
+        generation = await redis_client.get(GENERATION_KEY) or "0"
+        content = f"{normalize_text(subject)}\n{normalize_text(body)}"
+        if self.scope_by_customer:
+            content = f"{customer_id}\n{content}"
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"pipeline_cache:{generation}:{digest}"
+
+    async def get(self, customer_id: str, subject: str, body: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached stage results for a ticket.
+
+        Returns:
+            Dict with router_result, knowledge_result, sentiment_result and
+            decision_result, or None on a miss (or when Redis is unavailable)
+        """
+        if not self.enabled:
+            return None
+        try:
+            cached = await redis_client.get_json(await self._key(customer_id, subject, body))
+        except Exception as e:
+            self.metrics.increment_counter("pipeline_cache.error")
+            logger.warning("Pipeline cache lookup failed", error=str(e))
+            return None
+
+        self.metrics.increment_counter("pipeline_cache.hit" if cached else "pipeline_cache.miss")
+        return cached
+
+    async def set(self, customer_id: str, subject: str, body: str, results: Dict[str, Any]):
+        """Store stage results for a ticket."""
+        if not self.enabled:
+            return
+        try:
+            await redis_client.set_json(await self._key(customer_id, subject, body), results, ttl=self.ttl)
+        except Exception as e:
+            self.metrics.increment_counter("pipeline_cache.error")
+            logger.warning("Pipeline cache store failed", error=str(e))
+
+
+async def invalidate_pipeline_cache() -> int:
+    """
+    Invalidate all cached pipeline results.
+
+    Call this when the knowledge base changes. Old entries become
+    unreachable and expire through their TTL.
+
+    Returns:
+        New cache generation
+    """
+    generation = await redis_client.incr(GENERATION_KEY)
+    get_metrics_collector().increment_counter("pipeline_cache.invalidations")
+    logger.info("Pipeline cache invalidated", generation=generation)
+    return generation
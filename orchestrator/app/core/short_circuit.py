@@ -0,0 +1,113 @@
+"""Short-circuit rules that skip pipeline stages once the outcome is known."""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable
+
+
+@dataclass
+class ShortCircuitRule:
+    """
+    Skip downstream stages when a completed stage already determines the outcome.
+
+    ``predicate`` receives the workflow values after ``after_stage`` completes.
+    ``outputs`` replaces the outputs of skipped stages (e.g. a synthesized
+    decision_result when the decision stage itself is skipped).
+    """
+    name: str
+    after_stage: str
+    predicate: Callable[[Dict[str, Any]], bool]
+    skip: List[str]
+    outputs: Dict[str, Any] = field(default_factory=dict)
+
+
+def _sentiment(values: Dict[str, Any]) -> Dict[str, Any]:
+    return values.get("sentiment_result") or {}
+
+
+def _category(values: Dict[str, Any]) -> str:
+    return (values.get("router_result") or {}).get("category", "")
+
+
+def build_rules(sentiment_threshold: float = 0.85) -> Dict[str, ShortCircuitRule]:
+    """
+    Build the available short-circuit rules.
+
+    The sentiment, churn and bug rules mirror the hard rules in the decision
+    agent's ``make_decision``, which never consult the knowledge result. They
+    only skip the knowledge stage; the decision agent still runs and applies
+    its hard rule without an LLM call. SPAM has no hard rule there, so its
+    decision is synthesized here and the decision stage is skipped too.
+
+    Args:
+        sentiment_threshold: Must match the decision agent's sentiment hard rule
+
+    Returns:
+        Rules keyed by name
+    """
+    rules = [
+        ShortCircuitRule(
+            name="spam",
+            after_stage="router",
+            predicate=lambda values: _category(values) == "SPAM",
+            skip=["knowledge", "sentiment", "decision"],
+            outputs={
+                "decision_result": {
+                    "decision": "AUTO_RESOLVE",
+                    "confidence": 0.95,
+                    "reasoning": "Classified as spam. Closed without further processing.",
+                    "priority": "LOW",
+                    "sla_minutes": None
+                }
+            }
+        ),
+        ShortCircuitRule(
+            name="bug",
+            after_stage="router",
+            predicate=lambda values: _category(values) == "BUG",
+            skip=["knowledge"]
+        ),
+        ShortCircuitRule(
+            name="high_sentiment",
+            after_stage="sentiment",
+            predicate=lambda values: _sentiment(values).get("score", 0.0) >= sentiment_threshold,
+            skip=["knowledge"]
+        ),
+        ShortCircuitRule(
+            name="churn_risk",
+            after_stage="sentiment",
+            predicate=lambda values: bool(_sentiment(values).get("churn_risk", False)),
+            skip=["knowledge"]
+        ),
+    ]
+    return {rule.name: rule for rule in rules}
+
+
+def get_short_circuit_rules(names: Optional[str] = None) -> List[ShortCircuitRule]:
+    """
+    Get enabled short-circuit rules.
+
+    Args:
+        names: Comma-separated rule names or "all" (defaults to SHORT_CIRCUIT_RULES;
+            empty disables short-circuiting)
+
+    Returns:
+        Enabled rules in evaluation order
+
+    Raises:
+        ValueError: If a rule name is unknown
+    """
+    names = names if names is not None else os.getenv("SHORT_CIRCUIT_RULES", "")
+    threshold = float(os.getenv("SHORT_CIRCUIT_SENTIMENT_THRESHOLD", "0.85"))
+    available = build_rules(threshold)
+
+    requested = [name.strip().lower() for name in names.split(",") if name.strip()]
+    if requested == ["all"]:
+        return list(available.values())
+
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise ValueError(
+            f"Unknown short-circuit rules: {', '.join(unknown)}. "
+            f"Supported rules: {', '.join(available)}"
+        )
+    return [available[name] for name in requested]
@@ -0,0 +1,112 @@
+"""Background worker pool for queued ticket processing."""
+import os
+import asyncio
+from typing import Dict, Any, List, Optional
+from orchestrator.app.core.job_queue import JobQueue, create_job_queue
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TicketWorkerPool:
+    """Pool of asyncio workers that drain the job queue through the orchestrator."""
+
+    def __init__(self, orchestrator, queue: Optional[JobQueue] = None, size: Optional[int] = None):
+        """
+        Initialize worker pool.
+
+        Args:
+            orchestrator: Orchestrator used to process tickets
+            queue: Job queue (created from JOB_QUEUE_BACKEND if omitted)
+            size: Number of workers (defaults to WORKER_POOL_SIZE)
+        """
+        self.orchestrator = orchestrator
+        self._queue = queue
+        self.size = size if size is not None else int(os.getenv("WORKER_POOL_SIZE", "4"))
+        self.metrics = get_metrics_collector()
+        self._workers: List[asyncio.Task] = []
+        self._running = False
+        self._busy = 0
+
+    @property
+    def queue(self) -> JobQueue:
+        """Job queue, created lazily so importing doesn't need Redis."""
+        if self._queue is None:
+            self._queue = create_job_queue()
+        return self._queue
+
+    async def submit(self, job: Dict[str, Any]) -> str:
+        """
+        Queue a persisted ticket for processing.
+
+        Args:
+            job: Dict with ticket_id, customer_id, subject and body
+
+        Returns:
+            Job ID
+        """
+        job_id = await self.queue.enqueue(job)
+        self.metrics.increment_counter("ticket_jobs_enqueued")
+        return job_id
+
+    async def start(self):
+        """Start the workers (no-op when size is 0, e.g. ingest-only nodes)."""
+        if self._running or self.size <= 0:
+            return
+        self._running = True
+        self._workers = [
+            asyncio.create_task(self._worker(f"worker-{i}"))
+            for i in range(self.size)
+        ]
+        logger.info("Ticket worker pool started", workers=self.size)
+
+    async def stop(self):
+        """Stop the workers; unacknowledged jobs are redelivered later."""
+        self._running = False
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.queue.close()
+
+    async def _worker(self, name: str):
+        """Worker loop: take a job, process it, acknowledge it."""
+        while self._running:
+            try:
+                item = await self.queue.dequeue(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Failed to read job queue", worker=name, error=str(e))
+                await asyncio.sleep(1.0)
+                continue
+
+            if item is None:
+                continue
+
+            job_id, job = item
+            self._busy += 1
+            self.metrics.set_gauge("ticket_workers_busy", self._busy)
+            try:
+                await self.orchestrator.process_ticket(
+                    customer_id=job["customer_id"],
+                    subject=job["subject"],
+                    body=job["body"],
+                    ticket_id=job["ticket_id"]
+                )
+                self.metrics.increment_counter("ticket_jobs_completed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # process_ticket already retried agents and reset the ticket status
+                logger.error("Ticket job failed", job_id=job_id, ticket_id=job.get("ticket_id"), error=str(e))
+                self.metrics.increment_counter("ticket_jobs_failed")
+            finally:
+                self._busy -= 1
+                self.metrics.set_gauge("ticket_workers_busy", self._busy)
+
+            try:
+                await self.queue.ack(job_id)
+            except Exception as e:
+                logger.error("Failed to acknowledge job", job_id=job_id, error=str(e))
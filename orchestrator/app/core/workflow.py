@@ -16,6 +16,15 @@ class WorkflowState(str, Enum):
     ERROR = "ERROR"
 
 
+# Workflow state a ticket enters when a DAG stage completes
+STAGE_STATES = {
+    "router": WorkflowState.ROUTING,
+    "knowledge": WorkflowState.KNOWLEDGE_SEARCH,
+    "sentiment": WorkflowState.SENTIMENT_ANALYSIS,
+    "decision": WorkflowState.DECISION,
+}
+
+
 def get_next_state(current_state: WorkflowState) -> Optional[WorkflowState]:
     """Get next state in workflow."""
     state_flow = {
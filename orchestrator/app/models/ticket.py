@@ -1,6 +1,6 @@
 """Ticket models for Orchestrator."""
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -11,6 +11,12 @@ class TicketCreateRequest(BaseModel):
     body: str = Field(..., min_length=1)
 
 
+class TicketBatchCreateRequest(BaseModel):
+    """Request model for creating tickets in bulk."""
+    tickets: List[TicketCreateRequest] = Field(..., min_length=1)
+    max_concurrency: Optional[int] = Field(None, ge=1)
+
+
 class TicketResponse(BaseModel):
     """Response model for ticket."""
     ticket_id: str
@@ -34,3 +40,13 @@ class TicketProcessingResponse(BaseModel):
     workflow: Optional[Dict[str, Any]] = None
 
 
+class TicketBatchItemResponse(TicketProcessingResponse):
+    """Per-ticket result streamed back from a batch request."""
+    index: int
+
+
+class TicketAcceptedResponse(BaseModel):
+    """Response model for a ticket queued for asynchronous processing."""
+    ticket_id: str
+    status: str
+    message: str
@@ -15,8 +15,9 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from orchestrator.app.api.routes import router
+from orchestrator.app.api.routes import router, worker_pool
 from orchestrator.app.api.health import router as health_router
+from orchestrator.app.core.http_pool import get_agent_pool
 from tools.monitoring.logger import setup_logging
 
 # Setup logging
@@ -42,6 +43,20 @@ app.include_router(router, prefix="/api", tags=["tickets"])
 app.include_router(health_router, prefix="/api", tags=["health"])
 
 
+@app.on_event("startup")
+async def startup():
+    """Open pooled connections to the agents and start ticket workers."""
+    await get_agent_pool().start()
+    await worker_pool.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop ticket workers and close pooled agent connections."""
+    await worker_pool.stop()
+    await get_agent_pool().close()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,92 @@
+"""Measure how often the sentiment lexicon pre-screen agrees with stored LLM labels."""
+import asyncio
+import sys
+import argparse
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+# Add project root and sentiment agent to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "agents" / "sentiment-agent"))
+
+from sqlalchemy import select
+from tools.database.postgres import get_db_session
+from tools.database.models.ticket import Ticket
+from tools.database.models.sentiment import Sentiment
+from app.analyzers.lexicon_sentiment import analyze_sentiment_lexicon
+
+
+async def load_labels(before=None, limit=None):
+    """Load (ticket text, stored sentiment) pairs."""
+    rows = []
+    async for session in get_db_session():
+        query = (
+            select(Ticket.subject, Ticket.body, Sentiment.level, Sentiment.churn_risk, Sentiment.requires_human)
+            .join(Sentiment, Sentiment.ticket_id == Ticket.ticket_id)
+            .order_by(Sentiment.created_at.desc())
+        )
+        if before:
+            query = query.where(Sentiment.created_at < before)
+        if limit:
+            query = query.limit(limit)
+        result = await session.execute(query)
+        for subject, body, level, churn_risk, requires_human in result:
+            rows.append((f"{subject}\n\n{body}", level.value, churn_risk, requires_human))
+        break
+    return rows
+
+
+async def benchmark(args):
+    """Run the pre-screen over stored labels and print agreement."""
+    print("=" * 60)
+    print("Sentiment lexicon pre-screen benchmark")
+    print("=" * 60)
+
+    before = datetime.fromisoformat(args.before) if args.before else None
+    rows = await load_labels(before, args.limit)
+    if not rows:
+        print("[ERROR] No stored sentiment analyses found")
+        return False
+
+    answered = Counter()
+    level_agree = Counter()
+    human_agree = Counter()
+    confusion = Counter()
+    for text, level, churn_risk, requires_human in rows:
+        result = analyze_sentiment_lexicon(text)
+        if result is None:
+            continue
+        predicted = result["level"]
+        answered[predicted] += 1
+        level_agree[predicted] += predicted == level
+        human_agree[predicted] += result["requires_human"] == requires_human
+        confusion[(predicted, level)] += 1
+
+    total_answered = sum(answered.values())
+    print(f"Tickets: {len(rows)}")
+    print(f"Answered by fast path: {total_answered} ({total_answered / len(rows):.1%})")
+    for predicted in ("CALM", "ANGRY"):
+        if not answered[predicted]:
+            continue
+        print(f"  {predicted}: {answered[predicted]} tickets, "
+              f"level agreement {level_agree[predicted] / answered[predicted]:.1%}, "
+              f"requires_human agreement {human_agree[predicted] / answered[predicted]:.1%}")
+    if confusion:
+        print("Fast path level -> stored level:")
+        for (predicted, level), count in sorted(confusion.items()):
+            print(f"  {predicted} -> {level}: {count}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--before",
+        help="Only use analyses created before this ISO timestamp "
+             "(e.g. when SENTIMENT_LEXICON_ENABLED was turned on, so fast path answers aren't scored against themselves)"
+    )
+    parser.add_argument("--limit", type=int, help="Only use the most recent N analyses")
+    success = asyncio.run(benchmark(parser.parse_args()))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,80 @@
+"""Build the in-process vector index snapshot (VECTOR_BACKEND=local)."""
+import asyncio
+import sys
+import os
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from sqlalchemy import select
+from tools.vector_db.chroma_client import get_collection
+from tools.vector_db.embeddings import get_embedding_service, CHROMA_DEFAULT_MODEL
+from tools.vector_db.local_index import LocalVectorIndex
+from tools.database.postgres import get_db_session
+from tools.database.models.similar_case import SimilarCase
+
+
+def build_from_chroma(collection_name: str) -> LocalVectorIndex:
+    """Export every entry (with its stored embedding) from a Chroma collection."""
+    return LocalVectorIndex.from_chroma(get_collection(collection_name))
+
+
+async def build_from_postgres() -> LocalVectorIndex:
+    """Embed the cases in the similar_cases table."""
+    cases = []
+    async for session in get_db_session():
+        result = await session.execute(select(SimilarCase))
+        cases = list(result.scalars())
+        break
+
+    ids, documents, metadatas = [], [], []
+    for case in cases:
+        case_id = case.vector_id or str(case.case_id)
+        ids.append(case_id)
+        # Same text and metadata layout as scripts/seed_knowledge_base.py
+        documents.append(f"{case.issue_description}\n\nResolution: {case.resolution}")
+        metadatas.append({
+            "case_id": case_id,
+            "category": case.category,
+            "subcategory": case.subcategory,
+            "issue": case.issue_description,
+            "resolution": case.resolution,
+            "satisfaction": case.customer_satisfaction
+        })
+
+    vectors = await get_embedding_service().embed_many(documents)
+    return LocalVectorIndex(ids, documents, metadatas, np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1))
+
+
+async def build(args):
+    """Build and save the snapshot."""
+    print("=" * 60)
+    print(f"Building local vector index from {args.source}")
+    print("=" * 60)
+
+    if args.source == "chroma":
+        index = build_from_chroma(args.collection)
+    else:
+        index = await build_from_postgres()
+
+    if not len(index):
+        print("[ERROR] No cases found")
+        return False
+
+    index.save(args.output, embedding_model=CHROMA_DEFAULT_MODEL)
+    print(f"[OK] Saved {len(index)} cases ({index.dimension} dimensions) to {args.output}")
+    print(f"Set VECTOR_BACKEND=local and VECTOR_INDEX_PATH={args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", choices=["chroma", "postgres"], default="chroma", help="Export Chroma or embed the similar_cases table")
+    parser.add_argument("--collection", default=os.getenv("CHROMA_COLLECTION_NAME", "support_cases"), help="Chroma collection to export")
+    parser.add_argument("--output", default=os.getenv("VECTOR_INDEX_PATH", "./data/vector_index"), help="Snapshot directory")
+    success = asyncio.run(build(parser.parse_args()))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,59 @@
+"""Copy knowledge base cases into per-category partition collections (VECTOR_PARTITIONED=true)."""
+import asyncio
+import sys
+import os
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.vector_db.chroma_client import get_collection, partition_collection_name
+
+
+async def partition_knowledge_base(args):
+    """Group the full collection by category and upsert each group into its partition."""
+    print("=" * 60)
+    print(f"Partitioning collection '{args.collection}' by category")
+    print("=" * 60)
+
+    data = get_collection(args.collection).get(include=["embeddings", "documents", "metadatas"])
+    if not data["ids"]:
+        print("[ERROR] Collection is empty")
+        return False
+
+    groups = defaultdict(list)
+    skipped = 0
+    for row, metadata in enumerate(data["metadatas"]):
+        category = (metadata or {}).get("category")
+        if category:
+            groups[category].append(row)
+        else:
+            skipped += 1
+
+    for category, rows in sorted(groups.items()):
+        name = partition_collection_name(category, args.collection)
+        for start in range(0, len(rows), args.batch_size):
+            batch = rows[start:start + args.batch_size]
+            get_collection(name).upsert(
+                ids=[data["ids"][row] for row in batch],
+                embeddings=[data["embeddings"][row] for row in batch],
+                documents=[data["documents"][row] for row in batch],
+                metadatas=[data["metadatas"][row] for row in batch]
+            )
+        print(f"[OK] {category}: {len(rows)} cases -> {name}")
+
+    if skipped:
+        print(f"[WARN] {skipped} cases have no category and stay only in '{args.collection}'")
+    print("Set VECTOR_PARTITIONED=true to search partitions")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--collection", default=os.getenv("CHROMA_COLLECTION_NAME", "support_cases"), help="Full collection to partition")
+    parser.add_argument("--batch-size", type=int, default=256, help="Cases per upsert")
+    success = asyncio.run(partition_knowledge_base(parser.parse_args()))
+    sys.exit(0 if success else 1)
@@ -13,6 +13,7 @@ sys.path.insert(0, str(project_root))
 from tools.vector_db.chroma_client import add_case
 from tools.database.postgres import get_db_session
 from tools.database.models.similar_case import SimilarCase
+from orchestrator.app.core.result_cache import invalidate_pipeline_cache
 
 
 # Comprehensive sample cases covering all categories and scenarios
@@ -250,6 +251,13 @@ async def seed_knowledge_base():
                 import traceback
                 traceback.print_exc()
         
+        # Cached pipeline results were computed against the old knowledge base
+        if success_count > 0:
+            try:
+                await invalidate_pipeline_cache()
+            except Exception as e:
+                print(f"[WARN] Could not invalidate pipeline cache: {e}")
+        
         print()
         print("=" * 60)
         print(f"Knowledge Base Seeding Complete!")
@@ -0,0 +1,104 @@
+"""Train the router agent's local classifier from stored classifications."""
+import asyncio
+import sys
+import random
+import argparse
+from pathlib import Path
+
+# Add project root and router agent to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "agents" / "router-agent"))
+
+from sqlalchemy import select
+from tools.database.postgres import get_db_session
+from tools.database.models.ticket import Ticket
+from tools.database.models.classification import Classification
+from tools.llm.prompts.router_prompts import CATEGORIES
+from app.classifiers.local_classifier import LocalTicketClassifier
+
+LOCAL_MODEL_REASON = "Classified by local model"
+
+
+async def load_examples(min_confidence: float):
+    """Load (ticket text, category) pairs labelled by the LLM."""
+    examples = []
+    async for session in get_db_session():
+        result = await session.execute(
+            select(Ticket.subject, Ticket.body, Classification.category)
+            .join(Classification, Classification.ticket_id == Ticket.ticket_id)
+            .where(Classification.confidence >= min_confidence)
+            # Don't learn from the local model's own answers
+            .where((Classification.reason.is_(None)) | (Classification.reason != LOCAL_MODEL_REASON))
+        )
+        for subject, body, category in result:
+            if category in CATEGORIES:
+                examples.append((f"{subject}\n\n{body}", category))
+        break
+    return examples
+
+
+def seed_examples():
+    """Sample knowledge base cases, useful before many tickets are classified."""
+    from scripts.seed_knowledge_base import SAMPLE_CASES
+    return [(case["issue"], case["category"]) for case in SAMPLE_CASES]
+
+
+def evaluate(model: LocalTicketClassifier, examples, threshold: float):
+    """Accuracy and coverage of confident predictions."""
+    answered = correct = 0
+    for text, category in examples:
+        predicted, confidence = model.predict(text)
+        if predicted is not None and confidence >= threshold:
+            answered += 1
+            correct += predicted == category
+    coverage = answered / len(examples) if examples else 0.0
+    accuracy = correct / answered if answered else 0.0
+    return coverage, accuracy
+
+
+async def train(args):
+    """Train, evaluate and save the classifier."""
+    print("=" * 60)
+    print("Training router local classifier")
+    print("=" * 60)
+
+    examples = await load_examples(args.min_confidence)
+    print(f"Loaded {len(examples)} classified tickets (confidence >= {args.min_confidence})")
+    if args.include_seed_cases:
+        examples += seed_examples()
+        print(f"Added seed cases, {len(examples)} examples total")
+
+    if len(examples) < 10:
+        print("[ERROR] Not enough examples to train")
+        return False
+
+    random.Random(42).shuffle(examples)
+    split = int(len(examples) * (1 - args.holdout))
+    train_set, holdout = examples[:split], examples[split:]
+
+    model = LocalTicketClassifier(temperature=args.temperature)
+    model.fit([text for text, _ in train_set], [category for _, category in train_set])
+    coverage, accuracy = evaluate(model, holdout, args.threshold)
+    print(f"Holdout ({len(holdout)} tickets) at threshold {args.threshold}: "
+          f"answers {coverage:.0%} locally with {accuracy:.1%} accuracy")
+
+    # Final model uses every example
+    model.fit([text for text, _ in examples], [category for _, category in examples])
+    model.save(args.output)
+    print(f"[OK] Saved model to {args.output}")
+    print(f"Set ROUTER_LOCAL_CLASSIFIER_PATH={args.output} "
+          f"and ROUTER_LOCAL_CONFIDENCE_THRESHOLD={args.threshold}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default="data/router_classifier.json", help="Model file to write")
+    parser.add_argument("--min-confidence", type=float, default=0.8, help="Only train on LLM labels at least this confident")
+    parser.add_argument("--threshold", type=float, default=0.9, help="Confidence threshold to evaluate")
+    parser.add_argument("--temperature", type=float, default=0.05, help="Softmax temperature for confidences")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of examples held out for evaluation")
+    parser.add_argument("--include-seed-cases", action="store_true", help="Also train on the knowledge base seed cases")
+    success = asyncio.run(train(parser.parse_args()))
+    sys.exit(0 if success else 1)
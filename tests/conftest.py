@@ -0,0 +1,31 @@
+"""Pytest configuration."""
+import sys
+import importlib.util
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def load_agent_module():
+    """
+    Import an agent module by file path.
+    
+    Every agent has its own top-level `app` package, so agent modules are
+    loaded under a per-agent name instead of through sys.path.
+    
+    Returns:
+        Loader taking the agent directory and a path inside it
+    """
+    def load(agent: str, relative_path: str):
+        path = PROJECT_ROOT / "agents" / agent / relative_path
+        name = f"{agent.replace('-', '_')}_{path.stem}"
+        if name not in sys.modules:
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+        return sys.modules[name]
+    return load
@@ -0,0 +1,77 @@
+"""Tests for BM25 lexical search over knowledge base cases."""
+import pytest
+
+CASES = [
+    {"id": "1", "text": "Charged twice for order #12345, need a refund", "metadata": {"category": "BILLING"}},
+    {"id": "2", "text": "App crashes with err-502 after updating to v2.1.2", "metadata": {"category": "TECHNICAL"}},
+    {"id": "3", "text": "How do I update my billing address", "metadata": {"category": "BILLING"}},
+    {"id": "4", "text": "Where is my order, tracking has not updated", "metadata": {"category": "SHIPPING"}},
+]
+
+
+@pytest.fixture
+def lexical(load_agent_module, monkeypatch):
+    module = load_agent_module("knowledge-agent", "app/search/lexical_search.py")
+    monkeypatch.setattr(module, "_index", None)
+    monkeypatch.setattr(module, "_build_lock", None)
+    return module
+
+
+def test_tokenize_keeps_identifiers(lexical):
+    assert lexical.tokenize("Error err-502 on v2.1.2 for #12345") == ["error", "err-502", "on", "v2.1.2", "for", "12345"]
+
+
+def test_exact_identifier_ranks_first(lexical):
+    index = lexical.BM25Index().build(CASES)
+    
+    results = index.search("getting err-502 again", top_k=2)
+    
+    assert results[0]["id"] == "2"
+    assert results[0]["bm25_score"] > 0
+
+
+def test_rare_terms_outweigh_common_ones(lexical):
+    index = lexical.BM25Index().build(CASES)
+    
+    results = index.search("refund my order")
+    
+    assert results[0]["id"] == "1"
+
+
+def test_only_matching_cases_are_returned(lexical):
+    index = lexical.BM25Index().build(CASES)
+    
+    assert [case["id"] for case in index.search("tracking")] == ["4"]
+    assert index.search("unrelated words") == []
+
+
+def test_metadata_filter(lexical):
+    index = lexical.BM25Index().build(CASES)
+    
+    results = index.search("update", filter_dict={"category": "BILLING"})
+    
+    assert [case["id"] for case in results] == ["3"]
+
+
+def test_empty_index(lexical):
+    assert lexical.BM25Index().build([]).search("refund") == []
+
+
+@pytest.mark.asyncio
+async def test_index_is_built_once_and_refreshed(lexical, monkeypatch):
+    loads = []
+    
+    async def get_all_cases():
+        loads.append(1)
+        return CASES
+    
+    monkeypatch.setattr(lexical, "get_all_cases", get_all_cases)
+    
+    first = await lexical.get_bm25_index()
+    assert await lexical.get_bm25_index() is first
+    assert len(first) == len(CASES)
+    assert len(loads) == 1
+    
+    monkeypatch.setenv("KNOWLEDGE_BM25_REFRESH_SECONDS", "0")
+    await lexical.get_bm25_index()
+    assert len(loads) == 2
@@ -0,0 +1,59 @@
+"""Tests for the sentiment lexicon pre-screen."""
+import pytest
+
+# (ticket text, expected level or None when the LLM has to decide)
+LABELLED_TICKETS = [
+    ("Hi, could you please tell me how to change my email address? Thanks", "CALM"),
+    ("Quick question: where can I find the dark mode setting? Thank you", "CALM"),
+    ("No rush, but would you let me know when the new plans launch? Kind regards", "CALM"),
+    ("This is ridiculous, I want to cancel my account right now", "ANGRY"),
+    ("This is the worst, most useless, pathetic service I have ever used", "ANGRY"),
+    ("WTF, this is a scam. I'm going to a competitor", "ANGRY"),
+    # Polite, but urgent, about money, an outage or a repeat contact
+    ("Please help ASAP, I was charged twice and my account is overdrawn. Thanks", None),
+    ("Thanks for nothing. This is the third time I have asked.", None),
+    ("My production server is down and we are losing money...please help", None),
+    ("Could you please look into the $49 invoice? Thanks", None),
+    ("Thank you, but the export is still not working", None),
+    # Cancelling and exclamation marks are not anger
+    ("Hi, could you please cancel my order? Thanks!!", None),
+    ("I WANT TO CANCEL MY SUBSCRIPTION!!!", None),
+    ("The export button is broken", None),
+]
+
+
+@pytest.fixture(scope="module")
+def lexicon(load_agent_module):
+    return load_agent_module("sentiment-agent", "app/analyzers/lexicon_sentiment.py")
+
+
+@pytest.mark.parametrize("text,expected", LABELLED_TICKETS)
+def test_labelled_tickets(lexicon, text, expected):
+    result = lexicon.analyze_sentiment_lexicon(text)
+    assert (result["level"] if result else None) == expected
+
+
+def test_calm_result_goes_to_bot(lexicon):
+    result = lexicon.analyze_sentiment_lexicon("Could you please resend the welcome email? Thanks")
+    assert result["churn_risk"] is False
+    assert result["requires_human"] is False
+    assert result["recommended_handler"] == "BOT"
+
+
+def test_angry_churn_goes_to_manager(lexicon):
+    result = lexicon.analyze_sentiment_lexicon("Unacceptable. Cancel my subscription, I'm done with this crap")
+    assert result["level"] == "ANGRY"
+    assert result["churn_risk"] is True
+    assert result["recommended_handler"] == "MANAGER"
+
+
+def test_angry_without_churn_goes_to_human(lexicon):
+    result = lexicon.analyze_sentiment_lexicon("Terrible, horrible, useless app")
+    assert result["churn_risk"] is False
+    assert result["recommended_handler"] == "HUMAN"
+
+
+def test_terms_match_whole_words(lexicon):
+    features = lexicon.score_lexicon("Hello, shell scripts are downloading fine")
+    assert features["profanity"] == 0
+    assert features["concerns"] == 0
@@ -0,0 +1,145 @@
+"""Tests for the workflow DAG engine."""
+import time
+import asyncio
+import pytest
+from orchestrator.app.core.dag import StageNode, WorkflowDAG
+
+
+def stage(value=None, delay: float = 0.0, calls=None, error: Exception = None):
+    """Stage function returning value (or raising) after delay."""
+    async def func(**kwargs):
+        if calls is not None:
+            calls.append(kwargs)
+        if delay:
+            await asyncio.sleep(delay)
+        if error:
+            raise error
+        return value
+    return func
+
+
+def test_rejects_missing_input():
+    with pytest.raises(ValueError, match="nothing provides"):
+        WorkflowDAG([StageNode("a", stage(), inputs=["missing"], outputs=["a_result"])])
+
+
+def test_rejects_duplicate_output():
+    with pytest.raises(ValueError, match="produced more than once"):
+        WorkflowDAG([
+            StageNode("a", stage(), outputs=["result"]),
+            StageNode("b", stage(), outputs=["result"])
+        ])
+
+
+def test_rejects_cycle():
+    with pytest.raises(ValueError, match="cycle"):
+        WorkflowDAG([
+            StageNode("a", stage(), inputs=["b_result"], outputs=["a_result"]),
+            StageNode("b", stage(), inputs=["a_result"], outputs=["b_result"])
+        ])
+
+
+@pytest.mark.asyncio
+async def test_passes_outputs_to_dependent_stages():
+    calls = []
+    dag = WorkflowDAG([
+        StageNode("a", stage("A"), inputs=["text"], outputs=["a_result"]),
+        StageNode("b", stage("B", calls=calls), inputs=["text", "a_result"], outputs=["b_result"])
+    ], initial_inputs=["text"])
+    
+    run = await dag.run({"text": "hello"})
+    
+    assert calls == [{"text": "hello", "a_result": "A"}]
+    assert run.values["b_result"] == "B"
+    assert run.critical_path() == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_multiple_outputs_are_split():
+    dag = WorkflowDAG([StageNode("a", stage({"x": 1, "y": 2}), outputs=["x", "y"])])
+    
+    run = await dag.run({})
+    
+    assert (run.values["x"], run.values["y"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently():
+    dag = WorkflowDAG([
+        StageNode("a", stage("A", delay=0.05), outputs=["a_result"]),
+        StageNode("b", stage("B", delay=0.05), outputs=["b_result"])
+    ])
+    
+    start = time.perf_counter()
+    await dag.run({})
+    
+    assert time.perf_counter() - start < 0.09
+
+
+@pytest.mark.asyncio
+async def test_condition_skips_stage_with_defaults():
+    calls = []
+    dag = WorkflowDAG([
+        StageNode(
+            "a",
+            stage("A", calls=calls),
+            outputs=["a_result"],
+            condition=lambda values: False,
+            defaults={"a_result": "default"}
+        ),
+        StageNode("b", stage("B"), inputs=["a_result"], outputs=["b_result"])
+    ])
+    
+    run = await dag.run({})
+    
+    assert calls == []
+    assert run.nodes["a"].status == "skipped"
+    assert run.values["a_result"] == "default"
+    assert run.nodes["b"].status == "done"
+
+
+@pytest.mark.asyncio
+async def test_completion_hook_can_skip_running_stage():
+    async def on_node_complete(run, name):
+        if name == "fast":
+            run.skip("slow", {"slow_result": "skipped"})
+    
+    dag = WorkflowDAG([
+        StageNode("fast", stage("F"), outputs=["fast_result"]),
+        StageNode("slow", stage("S", delay=1.0), outputs=["slow_result"])
+    ])
+    
+    start = time.perf_counter()
+    run = await dag.run({}, on_node_complete=on_node_complete)
+    
+    assert time.perf_counter() - start < 0.5
+    assert run.nodes["slow"].status == "skipped"
+    assert run.values["slow_result"] == "skipped"
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_after_retries():
+    calls = []
+    dag = WorkflowDAG([
+        StageNode("a", stage(calls=calls, error=RuntimeError("boom")), outputs=["a_result"], max_retries=2, retry_delay=0)
+    ])
+    
+    with pytest.raises(RuntimeError, match="boom"):
+        await dag.run({})
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_finish_time_is_not_delayed_by_completion_hooks():
+    async def on_node_complete(run, name):
+        # Holds the loop in run() while the other stage finishes
+        await asyncio.sleep(0.1)
+    
+    dag = WorkflowDAG([
+        StageNode("a", stage("A"), outputs=["a_result"]),
+        StageNode("b", stage("B", delay=0.01), outputs=["b_result"])
+    ])
+    
+    run = await dag.run({}, on_node_complete=on_node_complete)
+    
+    assert run.nodes["b"].duration < 0.05
@@ -0,0 +1,38 @@
+"""Fake LLM providers for unit tests."""
+import asyncio
+from typing import Dict, Any, List, Optional
+from tools.llm.base import BaseLLMProvider
+
+
+class FakeLLMProvider(BaseLLMProvider):
+    """Provider returning a canned answer after an optional delay, or raising."""
+    
+    def __init__(self, result=None, delay: float = 0.0, error: Optional[Exception] = None, model_name: str = "fake-1"):
+        self.result = result if result is not None else {"answer": "ok"}
+        self.delay = delay
+        self.error = error
+        self.model_name = model_name
+        self.calls = 0
+    
+    async def _respond(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+    
+    async def generate(self, prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None, **kwargs) -> str:
+        return await self._respond()
+    
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> Dict[str, Any]:
+        return await self._respond()
+    
+    async def get_embeddings(self, text: str) -> List[float]:
+        return [0.0]
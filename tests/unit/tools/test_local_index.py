@@ -0,0 +1,86 @@
+"""Tests for the in-process vector index and its Chroma fallback."""
+import numpy as np
+import pytest
+from tools.utils.exceptions import VectorDBException
+from tools.vector_db import chroma_client, local_index
+from tools.vector_db.local_index import LocalVectorIndex
+
+
+def build_index(count: int = 100) -> LocalVectorIndex:
+    vectors = np.full((count, 4), 0.5, dtype=np.float32)
+    vectors[count - 1] = [3.0, 0.0, 0.0, 0.0]  # Not normalized, past the first rows
+    return LocalVectorIndex(
+        [str(row) for row in range(count)],
+        [f"case {row}" for row in range(count)],
+        [{"category": "BILLING" if row % 2 else "SHIPPING"} for row in range(count)],
+        vectors
+    )
+
+
+@pytest.fixture
+def snapshot_env(monkeypatch, tmp_path):
+    """VECTOR_BACKEND=local with a fresh index singleton at tmp_path."""
+    monkeypatch.setenv("VECTOR_BACKEND", "local")
+    monkeypatch.setenv("VECTOR_INDEX_PATH", str(tmp_path / "index"))
+    monkeypatch.setattr(local_index, "_local_index", None)
+    monkeypatch.setattr(local_index, "_load_error", None)
+    monkeypatch.setattr(chroma_client, "_local_index_warned", False)
+    return tmp_path / "index"
+
+
+def test_every_row_is_normalized():
+    index = build_index()
+    
+    assert np.allclose(np.linalg.norm(index.vectors, axis=1), 1.0, atol=1e-3)
+
+
+def test_query_with_category_filter():
+    index = build_index()
+    
+    results = index.query([1.0, 0.0, 0.0, 0.0], top_k=3, filter_dict={"category": "BILLING"})
+    
+    assert results["ids"][0][0] == "99"
+    assert all(metadata["category"] == "BILLING" for metadata in results["metadatas"][0])
+    assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    build_index().save(str(tmp_path), embedding_model="model-a")
+    
+    loaded = LocalVectorIndex.load(str(tmp_path), embedding_model="model-a")
+    
+    assert len(loaded) == 100
+    assert loaded.embedding_model == "model-a"
+
+
+def test_load_refuses_other_embedding_model(tmp_path):
+    build_index().save(str(tmp_path), embedding_model="model-a")
+    
+    with pytest.raises(VectorDBException, match="model-a"):
+        LocalVectorIndex.load(str(tmp_path), embedding_model="model-b")
+
+
+def test_mismatched_snapshot_falls_back_to_chroma(snapshot_env):
+    build_index().save(str(snapshot_env), embedding_model="another-model")
+    
+    assert chroma_client._use_local_index() is False
+    assert chroma_client._use_local_index() is False
+    with pytest.raises(VectorDBException):
+        local_index.get_local_index(chroma_client.get_embedding_service().model_name)
+
+
+def test_missing_snapshot_falls_back_to_chroma(snapshot_env):
+    assert chroma_client._use_local_index() is False
+    chroma_client.warm_local_index()  # Startup does not fail either
+    with pytest.raises(VectorDBException, match="could not be loaded"):
+        local_index.get_local_index()
+
+
+def test_matching_snapshot_is_used_after_reload(snapshot_env):
+    model = chroma_client.get_embedding_service().model_name
+    assert chroma_client._use_local_index() is False
+    
+    build_index().save(str(snapshot_env), embedding_model=model)
+    local_index.reload_local_index(model)
+    
+    assert chroma_client._use_local_index() is True
@@ -0,0 +1,91 @@
+"""Tests for LLM token-bucket rate limiting."""
+import time
+import asyncio
+import pytest
+from tools.llm.rate_limiter import TokenBucket, LLMRateLimiter, estimate_tokens
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("x" * 400) == 100
+
+
+@pytest.mark.asyncio
+async def test_bucket_serves_budget_without_waiting():
+    bucket = TokenBucket(per_minute=600)
+    
+    start = time.perf_counter()
+    await bucket.acquire(600)
+    
+    assert time.perf_counter() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=600)  # 10 tokens per second
+    await bucket.acquire(600)
+    
+    start = time.perf_counter()
+    await bucket.acquire(1)
+    
+    assert 0.08 < time.perf_counter() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_takes_whole_bucket():
+    bucket = TokenBucket(per_minute=60)
+    
+    await asyncio.wait_for(bucket.acquire(10_000), timeout=0.5)
+    
+    assert bucket.tokens < 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    limiter = LLMRateLimiter("test", max_concurrency=2)
+    running = []
+    peak = []
+    
+    async def call():
+        async with limiter.limit():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.02)
+            running.pop()
+    
+    await asyncio.gather(*(call() for _ in range(6)))
+    
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_throttled_call_does_not_hold_concurrency_slot():
+    limiter = LLMRateLimiter("test", tokens_per_minute=6000, max_concurrency=1)
+    await limiter.tokens.acquire(6000)
+    
+    async def throttled():
+        async with limiter.limit(tokens=100):
+            pass
+    
+    task = asyncio.create_task(throttled())
+    await asyncio.sleep(0.05)
+    
+    assert limiter.waiting == 1
+    assert not limiter.concurrency.locked()
+    
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.waiting == 0
+    assert not limiter.concurrency.locked()
+
+
+@pytest.mark.asyncio
+async def test_slot_is_released_when_call_fails():
+    limiter = LLMRateLimiter("test", max_concurrency=1)
+    
+    with pytest.raises(RuntimeError):
+        async with limiter.limit():
+            raise RuntimeError("boom")
+    
+    assert not limiter.concurrency.locked()
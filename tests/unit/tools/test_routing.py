@@ -0,0 +1,122 @@
+"""Tests for latency-aware LLM provider routing."""
+import pytest
+from tools.llm.providers.routing import RoutingLLMProvider, ProviderHealth, is_quota_error
+from tests.unit.tools.fakes import FakeLLMProvider
+
+
+def router(timeout: float = 1.0, hedge: bool = False, **providers) -> RoutingLLMProvider:
+    return RoutingLLMProvider(providers, timeout=timeout, hedge=hedge)
+
+
+def test_is_quota_error():
+    assert is_quota_error(RuntimeError("429 Too Many Requests"))
+    assert is_quota_error(RuntimeError("Quota exceeded for model"))
+    assert not is_quota_error(RuntimeError("connection reset"))
+
+
+def test_untried_provider_scores_zero():
+    assert ProviderHealth().score(min_samples=5, failure_penalty=30) == 0.0
+
+
+def test_failing_provider_scores_worse_than_untried_before_min_samples():
+    health = ProviderHealth()
+    health.record_failure()
+    
+    assert health.score(min_samples=5, failure_penalty=30) > 0.0
+
+
+def test_failing_fast_provider_ranks_behind_slow_healthy_one():
+    failing, healthy = ProviderHealth(), ProviderHealth()
+    for _ in range(10):
+        failing.record_success(1.0)
+        healthy.record_success(6.0)
+    for _ in range(40):
+        failing.record_failure()
+    
+    assert failing.score(5, 30) > healthy.score(5, 30)
+
+
+def test_all_failures_score_without_latency_samples():
+    health = ProviderHealth()
+    for _ in range(5):
+        health.record_failure()
+    
+    assert health.score(min_samples=5, failure_penalty=30) == 30
+
+
+@pytest.mark.asyncio
+async def test_fails_over_to_next_provider():
+    routing = router(
+        a=FakeLLMProvider(error=RuntimeError("boom")),
+        b=FakeLLMProvider(result={"from": "b"})
+    )
+    
+    assert await routing.generate_json("prompt") == {"from": "b"}
+    assert routing.ranked() == ["b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_timeout_fails_over():
+    routing = router(
+        timeout=0.02,
+        a=FakeLLMProvider(result={"from": "a"}, delay=0.5),
+        b=FakeLLMProvider(result={"from": "b"})
+    )
+    
+    assert await routing.generate_json("prompt") == {"from": "b"}
+    assert routing.health["a"].error_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_quota_error_puts_provider_on_cooldown():
+    routing = router(
+        a=FakeLLMProvider(error=RuntimeError("429 quota exceeded")),
+        b=FakeLLMProvider(result={"from": "b"})
+    )
+    
+    await routing.generate_json("prompt")
+    
+    assert routing.health["a"].cooling_down
+    assert routing.ranked()[-1] == "a"
+
+
+@pytest.mark.asyncio
+async def test_consecutive_failures_put_provider_on_cooldown(monkeypatch):
+    monkeypatch.setenv("LLM_ROUTING_FAILURE_THRESHOLD", "2")
+    routing = router(a=FakeLLMProvider(error=RuntimeError("boom")))
+    
+    for _ in range(2):
+        with pytest.raises(ValueError, match="All LLM providers failed"):
+            await routing.generate_json("prompt")
+    
+    assert routing.health["a"].cooling_down
+
+
+@pytest.mark.asyncio
+async def test_success_resets_consecutive_failures():
+    provider = FakeLLMProvider(error=RuntimeError("boom"))
+    routing = router(a=provider)
+    
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await routing.generate_json("prompt")
+    provider.error = None
+    await routing.generate_json("prompt")
+    
+    assert routing.health["a"].consecutive_failures == 0
+    assert not routing.health["a"].cooling_down
+
+
+@pytest.mark.asyncio
+async def test_hedge_loser_latency_is_not_recorded():
+    routing = router(
+        hedge=True,
+        a=FakeLLMProvider(result={"from": "a"}, delay=0.3),
+        b=FakeLLMProvider(result={"from": "b"})
+    )
+    for _ in range(20):
+        routing.health["a"].record_success(0.01)
+    
+    assert await routing.generate_json("prompt") == {"from": "b"}
+    assert len(routing.health["a"].latencies) == 20
+    assert routing.health["a"].percentile(0.5) == 0.01
@@ -0,0 +1,78 @@
+"""Tests for the single-flight LLM provider wrapper."""
+import asyncio
+import pytest
+from tools.llm.providers.single_flight import SingleFlightLLMProvider
+from tests.unit.tools.fakes import FakeLLMProvider
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call():
+    provider = FakeLLMProvider(delay=0.01)
+    single_flight = SingleFlightLLMProvider(provider)
+    
+    results = await asyncio.gather(*(single_flight.generate_json("same prompt") for _ in range(5)))
+    
+    assert provider.calls == 1
+    assert all(result == {"answer": "ok"} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_shared():
+    provider = FakeLLMProvider(delay=0.01)
+    single_flight = SingleFlightLLMProvider(provider)
+    
+    await asyncio.gather(single_flight.generate_json("one"), single_flight.generate_json("two"))
+    
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_every_caller_gets_its_own_copy():
+    provider = FakeLLMProvider(result={"answer": "ok", "tags": ["a"]}, delay=0.01)
+    single_flight = SingleFlightLLMProvider(provider)
+    
+    async def leader():
+        result = await single_flight.generate_json("same prompt")
+        # Mutates before the followers resume
+        result["answer"] = "changed"
+        result["tags"].append("b")
+        return result
+    
+    first, *others = await asyncio.gather(leader(), *(single_flight.generate_json("same prompt") for _ in range(3)))
+    
+    assert first["answer"] == "changed"
+    assert all(other == {"answer": "ok", "tags": ["a"]} for other in others)
+    assert provider.result == {"answer": "ok", "tags": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_caller_and_is_not_kept():
+    provider = FakeLLMProvider(delay=0.01, error=RuntimeError("boom"))
+    single_flight = SingleFlightLLMProvider(provider)
+    
+    results = await asyncio.gather(
+        *(single_flight.generate_json("same prompt") for _ in range(3)),
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert provider.calls == 1
+    
+    provider.error = None
+    assert await single_flight.generate_json("same prompt") == {"answer": "ok"}
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_leader_does_not_fail_followers():
+    provider = FakeLLMProvider(delay=0.05)
+    single_flight = SingleFlightLLMProvider(provider)
+    
+    leader = asyncio.create_task(single_flight.generate_json("same prompt"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.generate_json("same prompt"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    
+    assert await follower == {"answer": "ok"}
+    assert provider.calls == 1
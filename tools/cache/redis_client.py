@@ -1,7 +1,7 @@
 """Redis cache client."""
 import os
 import json
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Tuple
 import redis.asyncio as redis
 
 
@@ -58,12 +58,96 @@ async def delete(key: str):
     await client.delete(key)
 
 
+async def incr(key: str) -> int:
+    """Increment an integer key and return the new value."""
+    client = await get_redis_client()
+    return await client.incr(key)
+
+
 async def exists(key: str) -> bool:
     """Check if key exists."""
     client = await get_redis_client()
     return await client.exists(key) > 0
 
 
+async def stream_add(stream: str, fields: Dict[str, str], maxlen: Optional[int] = None) -> str:
+    """Append an entry to a Redis stream and return its ID."""
+    client = await get_redis_client()
+    return await client.xadd(stream, fields, maxlen=maxlen, approximate=True)
+
+
+async def stream_create_group(stream: str, group: str):
+    """Create a consumer group (and the stream) if it does not exist yet."""
+    client = await get_redis_client()
+    try:
+        await client.xgroup_create(stream, group, id="0", mkstream=True)
+    except redis.ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+async def stream_read_group(
+    stream: str,
+    group: str,
+    consumer: str,
+    count: int = 1,
+    block_ms: Optional[int] = None
+) -> List[Tuple[str, Dict[str, str]]]:
+    """Read new entries for a consumer in a group."""
+    client = await get_redis_client()
+    response = await client.xreadgroup(group, consumer, {stream: ">"}, count=count, block=block_ms)
+    if not response:
+        return []
+    return response[0][1]
+
+
+async def stream_claim_stale(
+    stream: str,
+    group: str,
+    consumer: str,
+    min_idle_ms: int,
+    count: int = 1
+) -> List[Tuple[str, Dict[str, str]]]:
+    """Claim entries left unacknowledged by other consumers for too long."""
+    client = await get_redis_client()
+    response = await client.xautoclaim(stream, group, consumer, min_idle_ms, start_id="0-0", count=count)
+    # Reply is [next_start_id, entries, (deleted_ids on Redis 7+)]
+    return [entry for entry in response[1] if entry and entry[1]]
+
+
+async def stream_read(
+    stream: str,
+    last_id: str = "0",
+    count: Optional[int] = None,
+    block_ms: Optional[int] = None
+) -> List[Tuple[str, Dict[str, str]]]:
+    """Read entries after last_id from a stream (without a consumer group)."""
+    client = await get_redis_client()
+    response = await client.xread({stream: last_id}, count=count, block=block_ms)
+    if not response:
+        return []
+    return response[0][1]
+
+
+async def expire(key: str, ttl: int):
+    """Set a key's time to live in seconds."""
+    client = await get_redis_client()
+    await client.expire(key, ttl)
+
+
+async def stream_ack(stream: str, group: str, entry_id: str):
+    """Acknowledge a processed stream entry and drop it from the stream."""
+    client = await get_redis_client()
+    await client.xack(stream, group, entry_id)
+    await client.xdel(stream, entry_id)
+
+
+async def eval_script(script: str, keys: List[str], args: List[Any]) -> Any:
+    """Run a Lua script atomically."""
+    client = await get_redis_client()
+    return await client.eval(script, len(keys), *keys, *args)
+
+
 async def close_redis():
     """Close Redis connection."""
     global _redis_client
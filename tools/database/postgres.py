@@ -1,9 +1,12 @@
 """PostgreSQL database connection and session management."""
 import os
-from typing import AsyncGenerator
+import time
+from typing import AsyncGenerator, Dict, Any
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
+from tools.monitoring.metrics import get_metrics_collector
 
 # Database URL from environment
 DATABASE_URL = (
@@ -15,13 +18,48 @@ DATABASE_URL = (
     f"{os.getenv('POSTGRES_DB', 'support_system')}"
 )
 
+# "queue" keeps a pool of open connections; "null" opens one per session
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "queue").lower()
+
+# PgBouncer in transaction mode can't keep prepared statements between transactions
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+
+def _engine_options() -> Dict[str, Any]:
+    """Build engine options from environment."""
+    options: Dict[str, Any] = {
+        "echo": os.getenv("LOG_LEVEL", "INFO") == "DEBUG",
+        "future": True,
+    }
+
+    if DB_POOL_MODE == "null":
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        )
+
+    if DB_PGBOUNCER:
+        options["connect_args"] = {
+            "statement_cache_size": 0,  # asyncpg statement cache
+            "prepared_statement_cache_size": 0,  # SQLAlchemy dialect cache
+        }
+
+    return options
+
+
 # Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=os.getenv("LOG_LEVEL", "INFO") == "DEBUG",
-    poolclass=NullPool,  # Use NullPool for async
-    future=True,
-)
+engine = create_async_engine(DATABASE_URL, **_engine_options())
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    """Count physical connections opened (stays flat once the pool is warm)."""
+    get_metrics_collector().increment_counter("db_pool.connections_opened")
 
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -40,6 +78,14 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
     async with AsyncSessionLocal() as session:
         try:
+            # Check out the connection up front to measure pool wait time
+            start_time = time.perf_counter()
+            await session.connection()
+            get_metrics_collector().record_timing(
+                "db_pool.checkout_wait",
+                time.perf_counter() - start_time
+            )
+
             yield session
             await session.commit()
         except Exception:
@@ -55,6 +101,21 @@ async def init_db():
         await conn.run_sync(Base.metadata.create_all)
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Get connection pool usage."""
+    pool = engine.pool
+    if DB_POOL_MODE == "null":
+        return {"mode": "null"}
+    return {
+        "mode": DB_POOL_MODE,
+        "pgbouncer": DB_PGBOUNCER,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
 async def close_db():
     """Close database connections."""
     await engine.dispose()
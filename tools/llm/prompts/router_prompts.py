@@ -47,6 +47,55 @@ Example response:
 }}"""
 
 
+def get_batch_classification_prompt(ticket_texts: List[str]) -> str:
+    """
+    Get prompt that classifies several tickets in one call.
+    
+    Args:
+        ticket_texts: Customer ticket texts
+        
+    Returns:
+        Formatted prompt
+    """
+    tickets = "\n\n".join(
+        f"[Ticket {index}]\n{text}" for index, text in enumerate(ticket_texts)
+    )
+    return f"""Classify each of these {len(ticket_texts)} support tickets into ONE category.
+
+{tickets}
+
+Categories:
+{', '.join(CATEGORIES)}
+
+Return a JSON object with a "results" array holding one entry per ticket.
+Each entry has:
+- index: The ticket number from its [Ticket N] header
+- category: The category (one of the categories above)
+- subcategory: A more specific subcategory (e.g., "DUPLICATE_CHARGE" for BILLING)
+- confidence: A confidence score between 0.0 and 1.0
+- reason: A brief explanation of why this category was chosen
+
+Classify every ticket independently. Example response for two tickets:
+{{
+    "results": [
+        {{
+            "index": 0,
+            "category": "BILLING",
+            "subcategory": "DUPLICATE_CHARGE",
+            "confidence": 0.98,
+            "reason": "Customer states charged twice, requests refund"
+        }},
+        {{
+            "index": 1,
+            "category": "SHIPPING",
+            "subcategory": "LATE_DELIVERY",
+            "confidence": 0.9,
+            "reason": "Order has not arrived after two weeks"
+        }}
+    ]
+}}"""
+
+
 def get_classification_schema() -> dict:
     """Get JSON schema for classification response."""
     return {
@@ -72,4 +121,20 @@ def get_classification_schema() -> dict:
     }
 
 
+def get_batch_classification_schema() -> dict:
+    """Get JSON schema for batch classification response."""
+    item = get_classification_schema()
+    item["properties"]["index"] = {"type": "integer", "minimum": 0}
+    item["required"] = ["index", "category", "confidence"]
+    return {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": item
+            }
+        },
+        "required": ["results"]
+    }
+
 
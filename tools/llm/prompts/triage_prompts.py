@@ -0,0 +1,68 @@
+"""Prompt templates for combined classification and sentiment (triage)."""
+from tools.llm.prompts.router_prompts import CATEGORIES, get_classification_schema
+from tools.llm.prompts.sentiment_prompts import get_sentiment_schema
+
+
+def get_triage_prompt(ticket_text: str) -> str:
+    """
+    Get prompt that classifies a ticket and analyzes its sentiment in one call.
+
+    Args:
+        ticket_text: Customer ticket text
+
+    Returns:
+        Formatted prompt
+    """
+    return f"""Triage this support ticket: classify it into ONE category and analyze the customer's sentiment.
+
+Ticket text:
+{ticket_text}
+
+Categories:
+{', '.join(CATEGORIES)}
+
+Return a JSON object with two parts.
+
+classification:
+- category: The category (one of the categories above)
+- subcategory: A more specific subcategory (e.g., "DUPLICATE_CHARGE" for BILLING)
+- confidence: A confidence score between 0.0 and 1.0
+- reason: A brief explanation of why this category was chosen
+
+sentiment:
+- score: Sentiment score (0.0 = very calm, 1.0 = extremely angry)
+- level: Emotional level (CALM, NEUTRAL, UPSET, ANGRY)
+- urgency: Urgency level (LOW, MEDIUM, HIGH)
+- churn_risk: true if customer is at risk of leaving
+- requires_human: true if human empathy is needed rather than a bot
+- recommended_handler: BOT, HUMAN, or MANAGER
+
+Example response:
+{{
+    "classification": {{
+        "category": "BILLING",
+        "subcategory": "DUPLICATE_CHARGE",
+        "confidence": 0.98,
+        "reason": "Customer states charged twice, requests refund"
+    }},
+    "sentiment": {{
+        "score": 0.92,
+        "level": "ANGRY",
+        "urgency": "HIGH",
+        "churn_risk": true,
+        "requires_human": true,
+        "recommended_handler": "HUMAN"
+    }}
+}}"""
+
+
+def get_triage_schema() -> dict:
+    """Get JSON schema for triage response."""
+    return {
+        "type": "object",
+        "properties": {
+            "classification": get_classification_schema(),
+            "sentiment": get_sentiment_schema()
+        },
+        "required": ["classification", "sentiment"]
+    }
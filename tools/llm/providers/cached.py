@@ -0,0 +1,159 @@
+"""Response-caching wrapper for LLM providers."""
+import os
+import copy
+from typing import Dict, Any, List, Optional
+from tools.llm.base import BaseLLMProvider
+from tools.llm.request_key import build_request_key
+from tools.cache import redis_client
+from tools.cache.lru import LRUCache
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def cache_ttl(agent_name: Optional[str] = None) -> int:
+    """
+    Cache TTL for an agent.
+
+    Args:
+        agent_name: Agent name, e.g. "router"
+
+    Returns:
+        LLM_CACHE_TTL_<AGENT> if set, else LLM_CACHE_TTL (default 3600)
+    """
+    if agent_name:
+        value = os.getenv(f"LLM_CACHE_TTL_{agent_name.upper()}")
+        if value:
+            return int(value)
+    return int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+
+class CachedLLMProvider(BaseLLMProvider):
+    """
+    Caches generate_json responses of another provider.
+
+    Requests are keyed on provider, model, prompt, schema, temperature and
+    extra parameters. Lookups go to an in-process LRU first, then (if
+    enabled) Redis, so identical requests from other replicas are shared
+    too. Free-text generate() and high-temperature requests are not cached.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+        max_temperature: Optional[float] = None
+    ):
+        """
+        Initialize cache wrapper.
+
+        Args:
+            provider: Provider to call on a miss
+            ttl: Seconds a response is kept (defaults to LLM_CACHE_TTL; see cache_ttl)
+            max_entries: In-process LRU size (defaults to LLM_CACHE_MAX_ENTRIES)
+            use_redis: Share responses through Redis (defaults to LLM_CACHE_REDIS)
+            max_temperature: Requests above this temperature bypass the cache
+                (defaults to LLM_CACHE_MAX_TEMPERATURE)
+        """
+        self.provider = provider
+        self.ttl = ttl if ttl is not None else cache_ttl()
+        max_entries = max_entries if max_entries is not None else int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+        self.use_redis = use_redis if use_redis is not None else os.getenv("LLM_CACHE_REDIS", "false").lower() == "true"
+        self.max_temperature = (
+            max_temperature if max_temperature is not None
+            else float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.5"))
+        )
+        self.local = LRUCache(max_entries=max_entries, ttl=self.ttl)
+        self.metrics = get_metrics_collector()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model_name(self) -> Optional[str]:
+        """Model of the wrapped provider."""
+        return getattr(self.provider, "model_name", None)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Generate text completion (not cached)."""
+        return await self.provider.generate(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured JSON response, reusing a cached response if any."""
+        if temperature > self.max_temperature:
+            return await self.provider.generate_json(prompt, schema=schema, temperature=temperature, **kwargs)
+
+        key = build_request_key(self.provider, "generate_json", prompt, schema, temperature, **kwargs)
+
+        result = self.local.get(key)
+        if result is not None:
+            self._record("hit", "memory")
+            return copy.deepcopy(result)
+
+        if self.use_redis:
+            try:
+                result = await redis_client.get_json(self._redis_key(key))
+            except Exception as e:
+                self.metrics.increment_counter("llm_cache.error")
+                logger.warning("LLM cache lookup failed", error=str(e))
+            if result is not None:
+                self.local.set(key, result)
+                self._record("hit", "redis")
+                return copy.deepcopy(result)
+
+        self._record("miss")
+        result = await self.provider.generate_json(prompt, schema=schema, temperature=temperature, **kwargs)
+
+        self.local.set(key, copy.deepcopy(result))
+        if self.use_redis:
+            try:
+                await redis_client.set_json(self._redis_key(key), result, ttl=self.ttl)
+            except Exception as e:
+                self.metrics.increment_counter("llm_cache.error")
+                logger.warning("LLM cache store failed", error=str(e))
+
+        return result
+
+    async def get_embeddings(self, text: str) -> List[float]:
+        """Generate embeddings (not cached)."""
+        return await self.provider.get_embeddings(text)
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"llm_cache:{key}"
+
+    def _record(self, outcome: str, tier: Optional[str] = None):
+        """Update hit/miss counters and the hit-rate gauge."""
+        if outcome == "hit":
+            self.hits += 1
+            self.metrics.increment_counter(f"llm_cache.hit.{tier}")
+        else:
+            self.misses += 1
+            self.metrics.increment_counter("llm_cache.miss")
+        self.metrics.set_gauge("llm_cache.hit_rate", self.hits / (self.hits + self.misses))
+        self.metrics.set_gauge("llm_cache.entries", len(self.local))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.local),
+            "evictions": self.local.evictions
+        }
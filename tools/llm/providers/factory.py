@@ -1,18 +1,91 @@
 """LLM provider factory."""
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from tools.llm.base import BaseLLMProvider
 from tools.llm.providers.gemini import GeminiProvider
 from tools.llm.providers.deepseek import DeepSeekProvider
+from tools.llm.providers.cached import CachedLLMProvider, cache_ttl
+from tools.llm.providers.single_flight import SingleFlightLLMProvider
+from tools.llm.providers.rate_limited import RateLimitedLLMProvider
+from tools.llm.providers.routing import RoutingLLMProvider
+from tools.llm.rate_limiter import create_rate_limiter, rate_limits_configured
+from tools.llm.request_key import provider_identity
+from tools.monitoring.logger import get_logger
 
+logger = get_logger(__name__)
+
+PROVIDERS = {
+    "gemini": GeminiProvider,
+    "deepseek": DeepSeekProvider,
+}
 
 _provider_instance: Optional[BaseLLMProvider] = None
+_agent_instances: Dict[str, BaseLLMProvider] = {}
 
 
-def get_llm_provider() -> BaseLLMProvider:
+def create_provider(provider_name: str) -> BaseLLMProvider:
+    """
+    Create one provider, rate limited if limits are configured.
+    
+    Args:
+        provider_name: "gemini" or "deepseek"
+        
+    Returns:
+        LLM provider instance
+        
+    Raises:
+        ValueError: If provider is unknown or not configured
+    """
+    if provider_name not in PROVIDERS:
+        raise ValueError(
+            f"Unknown LLM provider: {provider_name}. "
+            f"Supported providers: {', '.join(PROVIDERS)}"
+        )
+    provider = PROVIDERS[provider_name]()
+    
+    # Queue calls within the provider's request, token and concurrency budget
+    if rate_limits_configured():
+        limiter = create_rate_limiter(provider_identity(provider))
+        provider = RateLimitedLLMProvider(provider, limiter)
+    
+    return provider
+
+
+def _create_routing_provider(provider_names: List[str]) -> BaseLLMProvider:
+    """Create a router over every listed provider that is configured."""
+    unknown = [name for name in provider_names if name not in PROVIDERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown LLM providers: {', '.join(unknown)}. "
+            f"Supported providers: {', '.join(PROVIDERS)}"
+        )
+    
+    providers: Dict[str, BaseLLMProvider] = {}
+    for name in provider_names:
+        try:
+            providers[name] = create_provider(name)
+        except ValueError as e:
+            # e.g. missing API key; route over the remaining providers
+            logger.warning("Skipping LLM provider", provider=name, error=str(e))
+    
+    if not providers:
+        raise ValueError(f"None of the LLM providers could be configured: {', '.join(provider_names)}")
+    if len(providers) == 1:
+        return next(iter(providers.values()))
+    return RoutingLLMProvider(providers)
+
+
+def get_llm_provider(agent_name: Optional[str] = None) -> BaseLLMProvider:
     """
     Get configured LLM provider instance.
     
+    Agents share one underlying provider; with LLM_CACHE_ENABLED=true each
+    agent gets its own response cache in front of it, with the TTL from
+    LLM_CACHE_TTL_<AGENT> (falling back to LLM_CACHE_TTL).
+    
+    Args:
+        agent_name: Calling agent, e.g. "router" or "decision"
+    
     Returns:
         LLM provider instance
         
@@ -21,28 +94,43 @@ def get_llm_provider() -> BaseLLMProvider:
     """
     global _provider_instance
     
-    if _provider_instance is not None:
-        return _provider_instance
+    key = (agent_name or "").lower()
+    if key in _agent_instances:
+        return _agent_instances[key]
     
-    provider_name = os.getenv("LLM_PROVIDER", "gemini").lower()
+    if _provider_instance is None:
+        # LLM_PROVIDERS lists several providers to route between;
+        # otherwise LLM_PROVIDER selects a single one
+        provider_names = [
+            name.strip().lower()
+            for name in os.getenv("LLM_PROVIDERS", "").split(",")
+            if name.strip()
+        ]
+        
+        if len(provider_names) > 1:
+            _provider_instance = _create_routing_provider(provider_names)
+        else:
+            provider_name = provider_names[0] if provider_names else os.getenv("LLM_PROVIDER", "gemini").lower()
+            _provider_instance = create_provider(provider_name)
+        
+        # Share one call between concurrent identical requests
+        if os.getenv("LLM_SINGLE_FLIGHT_ENABLED", "true").lower() == "true":
+            _provider_instance = SingleFlightLLMProvider(_provider_instance)
     
-    if provider_name == "gemini":
-        _provider_instance = GeminiProvider()
-    elif provider_name == "deepseek":
-        _provider_instance = DeepSeekProvider()
-    else:
-        raise ValueError(
-            f"Unknown LLM provider: {provider_name}. "
-            f"Supported providers: gemini, deepseek"
-        )
+    provider = _provider_instance
+    # Reuse responses to identical deterministic requests
+    if os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true":
+        provider = CachedLLMProvider(provider, ttl=cache_ttl(key))
     
-    return _provider_instance
+    _agent_instances[key] = provider
+    return provider
 
 
 def reset_provider():
     """Reset provider instance (useful for testing)."""
     global _provider_instance
     _provider_instance = None
+    _agent_instances.clear()
 
 
 
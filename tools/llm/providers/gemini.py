@@ -2,9 +2,12 @@
 import os
 import json
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import google.generativeai as genai
 from typing import Dict, Any, Optional, List
 from tools.llm.base import BaseLLMProvider
+from tools.monitoring.metrics import get_metrics_collector
 
 
 class GeminiProvider(BaseLLMProvider):
@@ -20,6 +23,69 @@ class GeminiProvider(BaseLLMProvider):
         # Use gemini-2.5-flash as default (latest, faster) or gemini-1.5-pro for better quality
         self.model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
         self.model = genai.GenerativeModel(self.model_name)
+        self.metrics = get_metrics_collector()
+        
+        # "async" uses the SDK's native async client; "executor" runs the
+        # blocking client on a dedicated thread pool of GEMINI_MAX_WORKERS
+        self.client_mode = os.getenv("GEMINI_CLIENT_MODE", "async").lower()
+        self.max_workers = int(os.getenv("GEMINI_MAX_WORKERS", "32"))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.client_mode == "executor":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="gemini"
+            )
+        self._queued = 0  # Submitted to the executor, waiting for a thread
+        self._active = 0  # Calls in progress
+        self._lock = threading.Lock()  # Counters are updated from executor threads
+    
+    async def _generate_content(self, prompt: str, generation_config: Dict[str, Any], **kwargs):
+        """Call generate_content without blocking the event loop."""
+        if self._executor is None:
+            self._active += 1
+            self.metrics.set_gauge("gemini.active", self._active)
+            try:
+                return await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    **kwargs
+                )
+            finally:
+                self._active -= 1
+                self.metrics.set_gauge("gemini.active", self._active)
+        
+        def call():
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            try:
+                return self.model.generate_content(
+                    prompt,
+                    generation_config=generation_config,
+                    **kwargs
+                )
+            finally:
+                with self._lock:
+                    self._active -= 1
+        
+        with self._lock:
+            self._queued += 1
+        self.metrics.set_gauge("gemini.executor_queue_depth", self._queued)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, call)
+        finally:
+            self.metrics.set_gauge("gemini.executor_queue_depth", self._queued)
+            self.metrics.set_gauge("gemini.active", self._active)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call concurrency statistics."""
+        return {
+            "client_mode": "executor" if self._executor is not None else "async",
+            "max_workers": self.max_workers if self._executor is not None else None,
+            "queued": self._queued,
+            "active": self._active
+        }
     
     async def generate(
         self,
@@ -35,16 +101,7 @@ class GeminiProvider(BaseLLMProvider):
         if max_tokens:
             generation_config["max_output_tokens"] = max_tokens
         
-        # Run synchronous generate_content in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.model.generate_content(
-                prompt,
-                generation_config=generation_config,
-                **kwargs
-            )
-        )
+        response = await self._generate_content(prompt, generation_config, **kwargs)
         
         return response.text
     
@@ -68,17 +125,8 @@ Please respond with valid JSON only. Do not include any text before or after the
             "temperature": temperature,
         }
         
-        # Run synchronous generate_content in thread pool to avoid blocking
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(
-                    json_prompt,
-                    generation_config=generation_config,
-                    **kwargs
-                )
-            )
+            response = await self._generate_content(json_prompt, generation_config, **kwargs)
         except Exception as e:
             error_msg = str(e)
             # Check for quota/rate limit errors
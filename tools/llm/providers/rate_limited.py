@@ -0,0 +1,67 @@
+"""Rate-limiting wrapper for LLM providers."""
+import os
+from typing import Dict, Any, List, Optional
+from tools.llm.base import BaseLLMProvider
+from tools.llm.rate_limiter import LLMRateLimiter, estimate_tokens
+
+
+class RateLimitedLLMProvider(BaseLLMProvider):
+    """
+    Holds every call to another provider until its rate limiter has budget.
+
+    Bursts queue here instead of failing with quota errors and being
+    retried by the orchestrator.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        limiter: LLMRateLimiter,
+        output_tokens: Optional[int] = None
+    ):
+        """
+        Initialize wrapper.
+
+        Args:
+            provider: Provider to call
+            limiter: Budget for the provider
+            output_tokens: Completion size assumed when the caller doesn't set
+                max_tokens (defaults to LLM_RATE_LIMIT_OUTPUT_TOKENS)
+        """
+        self.provider = provider
+        self.limiter = limiter
+        self.output_tokens = output_tokens or int(os.getenv("LLM_RATE_LIMIT_OUTPUT_TOKENS", "512"))
+
+    @property
+    def model_name(self) -> Optional[str]:
+        """Model of the wrapped provider."""
+        return getattr(self.provider, "model_name", None)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Generate text completion within the rate limit."""
+        tokens = estimate_tokens(prompt) + (max_tokens or self.output_tokens)
+        async with self.limiter.limit(tokens):
+            return await self.provider.generate(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured JSON response within the rate limit."""
+        tokens = estimate_tokens(prompt) + (kwargs.get("max_tokens") or self.output_tokens)
+        async with self.limiter.limit(tokens):
+            return await self.provider.generate_json(prompt, schema=schema, temperature=temperature, **kwargs)
+
+    async def get_embeddings(self, text: str) -> List[float]:
+        """Generate embeddings within the rate limit."""
+        async with self.limiter.limit(estimate_tokens(text)):
+            return await self.provider.get_embeddings(text)
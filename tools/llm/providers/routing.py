@@ -0,0 +1,247 @@
+"""Latency-aware routing and failover across LLM providers."""
+import os
+import time
+import asyncio
+from collections import deque
+from typing import Dict, Any, List, Optional, Deque
+from tools.llm.base import BaseLLMProvider
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Whether an error means the provider is out of quota or rate limited."""
+    message = f"{type(error).__name__}: {error}".lower()
+    return any(marker in message for marker in ("quota", "429", "resourceexhausted", "rate limit", "ratelimit"))
+
+
+class ProviderHealth:
+    """Rolling latency and error rate of one provider."""
+
+    def __init__(self, window: int = 50):
+        """Initialize with a window of the last `window` calls."""
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record_success(self, latency: float):
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+
+    def record_failure(self, cooldown: float = 0.0):
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        if cooldown:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + cooldown)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency percentile of successful calls, None without samples."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(fraction * (len(ordered) - 1))]
+
+    def score(self, min_samples: int, failure_penalty: float) -> float:
+        """
+        Lower is better.
+
+        Providers with few calls score only their failures, so untried
+        providers (0) get tried but one failing from the start does not.
+        Failures count as calls that took `failure_penalty` (the routing
+        timeout) on top of the latency term, so a provider that keeps
+        failing ranks behind a slow but healthy one however fast its
+        successful calls were.
+
+        Args:
+            min_samples: Calls needed before latency counts
+            failure_penalty: Seconds a failed call is worth
+        """
+        penalty = self.error_rate * failure_penalty
+        if len(self.outcomes) < min_samples:
+            return penalty
+        # All failures leaves no latency sample; the penalty alone ranks it
+        return (self.percentile(0.5) or 0.0) * (1 + 4 * self.error_rate) + penalty
+
+
+class RoutingLLMProvider(BaseLLMProvider):
+    """
+    Sends each call to the healthiest provider and fails over to the others.
+
+    Providers are ranked by median latency weighted by error rate; providers
+    that hit a quota error sit out a cooldown. A failed or timed-out call is
+    retried on the next provider. With hedging enabled, a call still running
+    after the provider's p95 latency is duplicated on the next provider and
+    whichever answers first wins.
+    """
+
+    def __init__(
+        self,
+        providers: Dict[str, BaseLLMProvider],
+        timeout: Optional[float] = None,
+        hedge: Optional[bool] = None
+    ):
+        """
+        Initialize router.
+
+        Args:
+            providers: Providers by name, in preference order for ties
+            timeout: Seconds before a call counts as failed (defaults to LLM_ROUTING_TIMEOUT)
+            hedge: Send hedged duplicate requests (defaults to LLM_ROUTING_HEDGE)
+        """
+        self.providers = providers
+        self.timeout = timeout if timeout is not None else float(os.getenv("LLM_ROUTING_TIMEOUT", "30"))
+        self.hedge = hedge if hedge is not None else os.getenv("LLM_ROUTING_HEDGE", "false").lower() == "true"
+        self.cooldown = float(os.getenv("LLM_ROUTING_QUOTA_COOLDOWN", "60"))
+        # Timeouts and other errors in a row before a provider sits out
+        self.failure_threshold = int(os.getenv("LLM_ROUTING_FAILURE_THRESHOLD", "3"))
+        self.failure_cooldown = float(os.getenv("LLM_ROUTING_FAILURE_COOLDOWN", "30"))
+        self.min_samples = int(os.getenv("LLM_ROUTING_MIN_SAMPLES", "5"))
+        window = int(os.getenv("LLM_ROUTING_WINDOW", "50"))
+        self.health = {name: ProviderHealth(window) for name in providers}
+        self.metrics = get_metrics_collector()
+
+    @property
+    def model_name(self) -> str:
+        """Names of the routed providers."""
+        return "+".join(self.providers)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Generate text completion on the best available provider."""
+        return await self._route("generate", prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured JSON response on the best available provider."""
+        return await self._route("generate_json", prompt, schema=schema, temperature=temperature, **kwargs)
+
+    async def get_embeddings(self, text: str) -> List[float]:
+        """Generate embeddings with the first provider that supports them."""
+        for provider in self.providers.values():
+            try:
+                return await provider.get_embeddings(text)
+            except NotImplementedError:
+                continue
+        raise NotImplementedError("No configured provider supports embeddings")
+
+    def ranked(self) -> List[str]:
+        """Provider names, best first; providers cooling down go last."""
+        order = list(self.providers)
+        return sorted(
+            order,
+            key=lambda name: (
+                self.health[name].cooling_down,
+                self.health[name].score(self.min_samples, self.timeout),
+                order.index(name)
+            )
+        )
+
+    def _hedge_delay(self, name: str) -> Optional[float]:
+        """Seconds to wait before hedging a call to name (None to not hedge)."""
+        health = self.health[name]
+        if not self.hedge or len(health.latencies) < max(self.min_samples, 20):
+            return None
+        return health.percentile(0.95)
+
+    async def _attempt(self, name: str, method: str, *args, **kwargs) -> Any:
+        """Call one provider, recording its latency or failure."""
+        health = self.health[name]
+        start_time = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                getattr(self.providers[name], method)(*args, **kwargs),
+                timeout=self.timeout
+            )
+        except asyncio.CancelledError:
+            # Lost a hedge race: its elapsed time is truncated, so not a sample
+            raise
+        except Exception as e:
+            cooldown = 0.0
+            if is_quota_error(e):
+                cooldown = self.cooldown
+            elif health.consecutive_failures + 1 >= self.failure_threshold:
+                # Brownout: stop waiting out timeouts on every request
+                cooldown = self.failure_cooldown
+            health.record_failure(cooldown)
+            self.metrics.increment_counter(f"llm_routing.error.{name}")
+            raise
+        latency = time.perf_counter() - start_time
+        health.record_success(latency)
+        self.metrics.record_timing(f"llm_routing.latency.{name}", latency)
+        return result
+
+    async def _route(self, method: str, *args, **kwargs) -> Any:
+        """Run a call on ranked providers until one succeeds."""
+        remaining = self.ranked()
+        pending: Dict[asyncio.Task, str] = {}
+        errors = []
+
+        try:
+            while remaining or pending:
+                if not pending:
+                    name = remaining.pop(0)
+                    if errors:
+                        self.metrics.increment_counter(f"llm_routing.failover.{name}")
+                    pending[asyncio.create_task(self._attempt(name, method, *args, **kwargs))] = name
+
+                delay = None
+                if remaining and len(pending) == 1 and not self.health[remaining[0]].cooling_down:
+                    delay = self._hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(set(pending), timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Slower than this provider's p95, race the next one
+                    name = remaining.pop(0)
+                    self.metrics.increment_counter(f"llm_routing.hedge.{name}")
+                    pending[asyncio.create_task(self._attempt(name, method, *args, **kwargs))] = name
+                    continue
+
+                for task in done:
+                    name = pending.pop(task)
+                    if task.exception() is None:
+                        self.metrics.increment_counter(f"llm_routing.served.{name}")
+                        return task.result()
+                    error = task.exception()
+                    errors.append(f"{name}: {type(error).__name__}: {error}")
+                    logger.warning("LLM provider call failed", provider=name, error=str(error))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise ValueError(f"All LLM providers failed. {'; '.join(errors)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider routing health."""
+        return {
+            name: {
+                "p50_latency": health.percentile(0.5),
+                "p95_latency": health.percentile(0.95),
+                "error_rate": health.error_rate,
+                "cooling_down": health.cooling_down
+            }
+            for name, health in self.health.items()
+        }
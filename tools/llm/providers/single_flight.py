@@ -0,0 +1,94 @@
+"""Request coalescing wrapper for LLM providers."""
+import copy
+import asyncio
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+from tools.llm.base import BaseLLMProvider
+from tools.llm.request_key import build_request_key
+from tools.monitoring.metrics import get_metrics_collector
+
+
+class SingleFlightLLMProvider(BaseLLMProvider):
+    """
+    Coalesces concurrent identical requests into one provider call.
+
+    The first request for a key starts the call; identical requests that
+    arrive while it is in flight await the same call. Every caller, the
+    one that started it included, gets its own copy of the result (or the
+    exception). The call runs in its own task, so cancelling the request
+    that started it does not fail the others.
+    """
+
+    def __init__(self, provider: BaseLLMProvider):
+        """
+        Initialize wrapper.
+
+        Args:
+            provider: Provider to call
+        """
+        self.provider = provider
+        self.metrics = get_metrics_collector()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def model_name(self) -> Optional[str]:
+        """Model of the wrapped provider."""
+        return getattr(self.provider, "model_name", None)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Generate text completion, sharing an identical in-flight call."""
+        key = build_request_key(self.provider, "generate", prompt, None, temperature, max_tokens=max_tokens, **kwargs)
+        return await self._coalesce(
+            key,
+            lambda: self.provider.generate(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+        )
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured JSON response, sharing an identical in-flight call."""
+        key = build_request_key(self.provider, "generate_json", prompt, schema, temperature, **kwargs)
+        return await self._coalesce(
+            key,
+            lambda: self.provider.generate_json(prompt, schema=schema, temperature=temperature, **kwargs)
+        )
+
+    async def get_embeddings(self, text: str) -> List[float]:
+        """Generate embeddings (not coalesced)."""
+        return await self.provider.get_embeddings(text)
+
+    async def _coalesce(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the in-flight call for key, starting it if there is none."""
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if shared:
+            self.metrics.increment_counter("llm_single_flight.shared")
+        else:
+            task = asyncio.create_task(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.metrics.increment_counter("llm_single_flight.started")
+        self.metrics.set_gauge("llm_single_flight.inflight", len(self._inflight))
+
+        result = await asyncio.shield(task)
+        # The task keeps the pristine result; the leader may return first
+        # and mutate its copy before followers wake up
+        return copy.deepcopy(result)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        """Forget a finished call."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller was cancelled
+        self.metrics.set_gauge("llm_single_flight.inflight", len(self._inflight))
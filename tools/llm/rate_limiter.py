@@ -0,0 +1,208 @@
+"""Token-bucket rate limiting for LLM calls."""
+import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from tools.cache import redis_client
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Refill and take from a bucket stored as a hash; returns seconds to wait
+# (0 when the tokens were taken). Uses the Redis clock so hosts agree.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    Process-local token bucket refilled continuously at per_minute / 60 per second.
+
+    Callers waiting for tokens are served one at a time in arrival order,
+    so a large request can't be starved by a stream of small ones.
+    """
+
+    def __init__(self, per_minute: float):
+        """Initialize a full bucket holding one minute of budget."""
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()  # FIFO: waiters are woken in order
+
+    async def _take(self, amount: float) -> float:
+        """Take tokens if available; otherwise return seconds until they are."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until amount tokens are available and take them."""
+        amount = min(amount, self.capacity)  # Oversized requests take the whole bucket
+        async with self._lock:
+            while True:
+                wait = await self._take(amount)
+                if wait <= 0:
+                    return
+                await asyncio.sleep(wait)
+
+
+class RedisTokenBucket(TokenBucket):
+    """
+    Token bucket stored in Redis and shared by every process using the same key.
+
+    Falls back to the process-local bucket while Redis is unavailable.
+    """
+
+    def __init__(self, key: str, per_minute: float):
+        """Initialize bucket stored under key."""
+        super().__init__(per_minute)
+        self.key = key
+
+    async def _take(self, amount: float) -> float:
+        """Take tokens from the shared bucket."""
+        try:
+            wait = await redis_client.eval_script(
+                TOKEN_BUCKET_SCRIPT,
+                keys=[self.key],
+                args=[self.capacity, self.rate, amount]
+            )
+            return float(wait)
+        except Exception as e:
+            get_metrics_collector().increment_counter("llm_rate_limit.redis_error")
+            logger.warning("Shared rate limit unavailable, using local bucket", key=self.key, error=str(e))
+            return await super()._take(amount)
+
+
+class LLMRateLimiter:
+    """
+    Requests-per-minute, tokens-per-minute and concurrency budget for one provider.
+
+    A budget of 0 disables that limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_concurrency: int = 0,
+        backend: str = "local"
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Provider identity, used in Redis keys and metric names
+            requests_per_minute: Request budget
+            tokens_per_minute: Prompt + completion token budget
+            max_concurrency: Max calls in flight in this process
+            backend: "local" (per process) or "redis" (shared across processes and hosts)
+        """
+        self.name = name
+        self.metrics = get_metrics_collector()
+        self.requests = self._bucket("rpm", requests_per_minute, backend)
+        self.tokens = self._bucket("tpm", tokens_per_minute, backend)
+        self.concurrency = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self.waiting = 0
+
+    def _bucket(self, kind: str, per_minute: int, backend: str) -> Optional[TokenBucket]:
+        if per_minute <= 0:
+            return None
+        if backend == "redis":
+            return RedisTokenBucket(f"llm_rate_limit:{self.name}:{kind}", per_minute)
+        return TokenBucket(per_minute)
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 1) -> AsyncIterator[None]:
+        """
+        Wait for budget, then hold a concurrency slot for the call.
+
+        The rate budget is taken before the slot, so calls waiting out a
+        throttle don't hold slots that ready calls could use.
+
+        Args:
+            tokens: Estimated prompt + completion tokens of the call
+        """
+        start_time = time.perf_counter()
+        self.waiting += 1
+        self.metrics.set_gauge(f"llm_rate_limit.waiting.{self.name}", self.waiting)
+        try:
+            if self.requests is not None:
+                await self.requests.acquire(1)
+            if self.tokens is not None:
+                await self.tokens.acquire(tokens)
+            if self.concurrency is not None:
+                await self.concurrency.acquire()
+        finally:
+            self.waiting -= 1
+            self.metrics.set_gauge(f"llm_rate_limit.waiting.{self.name}", self.waiting)
+
+        self.metrics.record_timing(f"llm_rate_limit.wait.{self.name}", time.perf_counter() - start_time)
+        try:
+            yield
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release()
+
+
+def rate_limits_configured() -> bool:
+    """Whether any LLM rate limit is set in the environment."""
+    return any(
+        int(os.getenv(name, "0")) > 0
+        for name in ("LLM_RATE_LIMIT_RPM", "LLM_RATE_LIMIT_TPM", "LLM_MAX_CONCURRENCY")
+    )
+
+
+def create_rate_limiter(name: str) -> LLMRateLimiter:
+    """
+    Create limiter for a provider from environment.
+
+    LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM and LLM_MAX_CONCURRENCY set the
+    budgets; LLM_RATE_LIMIT_BACKEND is "local" (default) or "redis".
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    backend = os.getenv("LLM_RATE_LIMIT_BACKEND", "local").lower()
+    if backend not in ("local", "redis"):
+        raise ValueError(
+            f"Unknown rate limit backend: {backend}. "
+            f"Supported backends: local, redis"
+        )
+    return LLMRateLimiter(
+        name=name,
+        requests_per_minute=int(os.getenv("LLM_RATE_LIMIT_RPM", "0")),
+        tokens_per_minute=int(os.getenv("LLM_RATE_LIMIT_TPM", "0")),
+        max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "0")),
+        backend=backend
+    )
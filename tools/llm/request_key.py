@@ -0,0 +1,57 @@
+"""Stable keys identifying LLM requests."""
+import json
+import hashlib
+from typing import Dict, Any, Optional
+from tools.llm.base import BaseLLMProvider
+
+
+def unwrap_provider(provider: BaseLLMProvider) -> BaseLLMProvider:
+    """Innermost provider behind caching, single-flight and rate-limiting wrappers."""
+    while isinstance(getattr(provider, "provider", None), BaseLLMProvider):
+        provider = provider.provider
+    return provider
+
+
+def provider_identity(provider: BaseLLMProvider) -> str:
+    """
+    Provider name and model, e.g. "gemini:gemini-2.5-flash".
+
+    Wrappers are looked through, so keys don't change with the wrapper order.
+    """
+    provider = unwrap_provider(provider)
+    name = type(provider).__name__.replace("Provider", "").lower()
+    return f"{name}:{getattr(provider, 'model_name', 'default')}"
+
+
+def build_request_key(
+    provider: BaseLLMProvider,
+    method: str,
+    prompt: str,
+    schema: Optional[Dict[str, Any]] = None,
+    temperature: Optional[float] = None,
+    **kwargs
+) -> str:
+    """
+    Build a key that is equal for identical LLM requests.
+
+    Args:
+        provider: Provider that would serve the request
+        method: Provider method ("generate" or "generate_json")
+        prompt: Prompt text
+        schema: JSON schema (generate_json only)
+        temperature: Sampling temperature
+        **kwargs: Other request parameters
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    request = {
+        "provider": provider_identity(provider),
+        "method": method,
+        "prompt": prompt,
+        "schema": schema,
+        "temperature": temperature,
+        "params": kwargs
+    }
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
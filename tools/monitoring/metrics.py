@@ -1,5 +1,5 @@
 """Metrics collection utilities."""
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 import time
 
@@ -22,6 +22,25 @@ class MetricsCollector:
             "timestamp": datetime.utcnow().isoformat()
         })
     
+    def record_workflow_run(
+        self,
+        ticket_id: str,
+        stages: Dict[str, Any],
+        critical_path: List[str],
+        duration: float
+    ):
+        """Record per-stage timings and the critical path of a workflow run."""
+        if "workflow_runs" not in self.metrics:
+            self.metrics["workflow_runs"] = []
+        
+        self.metrics["workflow_runs"].append({
+            "ticket_id": ticket_id,
+            "stages": stages,
+            "critical_path": critical_path,
+            "duration": duration,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+    
     def record_agent_call(self, agent_name: str, success: bool, duration: float):
         """Record agent call metrics."""
         if "agent_calls" not in self.metrics:
@@ -34,6 +53,24 @@ class MetricsCollector:
             "timestamp": datetime.utcnow().isoformat()
         })
     
+    def increment_counter(self, name: str, value: int = 1):
+        """Increment a named counter."""
+        counters = self.metrics.setdefault("counters", {})
+        counters[name] = counters.get(name, 0) + value
+    
+    def set_gauge(self, name: str, value: float):
+        """Set a named gauge to its current value."""
+        gauges = self.metrics.setdefault("gauges", {})
+        gauges[name] = value
+    
+    def record_timing(self, name: str, duration: float):
+        """Record a duration into a named count/total/max summary."""
+        timings = self.metrics.setdefault("timings", {})
+        summary = timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        summary["count"] += 1
+        summary["total"] += duration
+        summary["max"] = max(summary["max"], duration)
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics."""
         return self.metrics
@@ -1,12 +1,29 @@
 """Chroma vector database client."""
 import os
-from typing import List, Dict, Any, Optional
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable
 import chromadb
 from chromadb.config import Settings
+from tools.vector_db.embeddings import get_embedding_service
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+from tools.utils.exceptions import VectorDBException
 
+logger = get_logger(__name__)
 
 _chroma_client = None
-_chroma_collection = None
+_collections: Dict[str, chromadb.Collection] = {}
+_client_lock = threading.Lock()  # Client and collections are resolved from executor threads
+
+# Chroma's client is blocking (HTTP round trip or local index access),
+# so calls run on a dedicated pool instead of the event loop
+_chroma_executor: Optional[ThreadPoolExecutor] = None
+_queued = 0  # Submitted to the executor, waiting for a thread
+_active = 0  # Calls in progress
+_counter_lock = threading.Lock()
 
 
 def get_chroma_client() -> chromadb.ClientAPI:
@@ -16,48 +33,253 @@ def get_chroma_client() -> chromadb.ClientAPI:
     if _chroma_client is not None:
         return _chroma_client
     
-    chroma_host = os.getenv("CHROMA_HOST", "localhost")
-    chroma_port = int(os.getenv("CHROMA_PORT", "8000"))
-    
-    # For persistent client (local)
-    persist_directory = os.getenv("CHROMA_PERSIST_DIR", "./chroma_data")
-    
-    # Try HTTP client first (if Chroma server is running)
-    try:
-        _chroma_client = chromadb.HttpClient(
-            host=chroma_host,
-            port=chroma_port,
-            settings=Settings(anonymized_telemetry=False)
-        )
-        # Test connection
-        _chroma_client.heartbeat()
-    except Exception:
-        # Fallback to persistent client (local)
-        _chroma_client = chromadb.PersistentClient(
-            path=persist_directory,
-            settings=Settings(anonymized_telemetry=False)
-        )
+    with _client_lock:
+        if _chroma_client is not None:
+            return _chroma_client
+        
+        chroma_host = os.getenv("CHROMA_HOST", "localhost")
+        chroma_port = int(os.getenv("CHROMA_PORT", "8000"))
+        
+        # For persistent client (local)
+        persist_directory = os.getenv("CHROMA_PERSIST_DIR", "./chroma_data")
+        
+        # Try HTTP client first (if Chroma server is running)
+        try:
+            client = chromadb.HttpClient(
+                host=chroma_host,
+                port=chroma_port,
+                settings=Settings(anonymized_telemetry=False)
+            )
+            # Test connection
+            client.heartbeat()
+        except Exception:
+            # Fallback to persistent client (local)
+            client = chromadb.PersistentClient(
+                path=persist_directory,
+                settings=Settings(anonymized_telemetry=False)
+            )
+        _chroma_client = client
     
     return _chroma_client
 
 
 def get_collection(name: Optional[str] = None) -> chromadb.Collection:
-    """Get or create Chroma collection."""
-    global _chroma_collection
-    
+    """Get or create Chroma collection (handles are cached per name)."""
     collection_name = name or os.getenv("CHROMA_COLLECTION_NAME", "support_cases")
+    
+    collection = _collections.get(collection_name)
+    if collection is not None:
+        return collection
+    
     client = get_chroma_client()
+    with _client_lock:
+        collection = _collections.get(collection_name)
+        if collection is not None:
+            return collection
+        
+        try:
+            collection = client.get_collection(name=collection_name)
+        except Exception:
+            # Collection doesn't exist, create it
+            collection = client.create_collection(
+                name=collection_name,
+                metadata={"description": "Support ticket cases"}
+            )
+        _collections[collection_name] = collection
+    
+    return collection
+
+
+def invalidate_collection(name: Optional[str] = None):
+    """Drop a cached collection handle (e.g. after the collection was recreated)."""
+    collection_name = name or os.getenv("CHROMA_COLLECTION_NAME", "support_cases")
+    with _client_lock:
+        _collections.pop(collection_name, None)
+
+
+def get_chroma_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs blocking Chroma calls."""
+    global _chroma_executor
+    if _chroma_executor is None:
+        _chroma_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CHROMA_MAX_WORKERS", "8")),
+            thread_name_prefix="chroma"
+        )
+    return _chroma_executor
+
+
+async def _run_collection_call(
+    operation: str,
+    collection_name: Optional[str],
+    call: Callable[[chromadb.Collection], Any]
+) -> Any:
+    """
+    Run a blocking collection call on the Chroma executor.
+    
+    A call that fails because the collection no longer exists is retried
+    once with a fresh handle, in case the collection was recreated.
+    
+    Args:
+        operation: Operation name for metrics
+        collection_name: Collection name (optional)
+        call: Function taking the collection
+        
+    Returns:
+        Result of call
+    """
+    global _queued
+    metrics = get_metrics_collector()
     
+    def run():
+        global _queued, _active
+        with _counter_lock:
+            _queued -= 1
+            _active += 1
+        start_time = time.perf_counter()
+        try:
+            try:
+                return call(get_collection(collection_name))
+            except Exception as e:
+                message = str(e).lower()
+                if "does not exist" not in message and "not found" not in message:
+                    raise
+                invalidate_collection(collection_name)
+                return call(get_collection(collection_name))
+        finally:
+            metrics.record_timing(f"chroma.{operation}", time.perf_counter() - start_time)
+            with _counter_lock:
+                _active -= 1
+    
+    with _counter_lock:
+        _queued += 1
+    metrics.set_gauge("chroma.executor_queue_depth", _queued)
+    loop = asyncio.get_running_loop()
     try:
-        collection = client.get_collection(name=collection_name)
+        return await loop.run_in_executor(get_chroma_executor(), run)
     except Exception:
-        # Collection doesn't exist, create it
-        collection = client.create_collection(
-            name=collection_name,
-            metadata={"description": "Support ticket cases"}
-        )
+        metrics.increment_counter(f"chroma.{operation}.error")
+        raise
+    finally:
+        metrics.set_gauge("chroma.executor_queue_depth", _queued)
+        metrics.set_gauge("chroma.active", _active)
+
+
+def get_chroma_stats() -> Dict[str, Any]:
+    """Get Chroma call concurrency statistics."""
+    return {
+        "max_workers": int(os.getenv("CHROMA_MAX_WORKERS", "8")),
+        "queued": _queued,
+        "active": _active,
+        "cached_collections": sorted(_collections)
+    }
+
+
+def get_vector_backend() -> str:
+    """Search backend: "chroma" (server or persistent client) or "local" (in-process snapshot)."""
+    return os.getenv("VECTOR_BACKEND", "chroma").lower()
+
+
+_local_index_warned = False
+
+
+def _use_local_index() -> bool:
+    """
+    Whether searches go to the in-process snapshot.
     
-    return collection
+    Requires VECTOR_BACKEND=local and a loadable snapshot built with the
+    query embedding model; a missing or mismatched snapshot is skipped in
+    favour of Chroma.
+    """
+    global _local_index_warned
+    if get_vector_backend() != "local":
+        return False
+    
+    from tools.vector_db.local_index import get_local_index
+    try:
+        get_local_index(get_embedding_service().model_name)
+        return True
+    except VectorDBException as e:
+        get_metrics_collector().increment_counter("local_index.rejected")
+        if not _local_index_warned:
+            _local_index_warned = True
+            logger.warning("Local vector index rejected, searching Chroma instead", error=str(e))
+        return False
+
+
+async def _search_local_index(
+    query_text: str,
+    top_k: int,
+    filter_dict: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Embed the query (cached) and search the in-process index."""
+    from tools.vector_db.local_index import get_local_index
+    metrics = get_metrics_collector()
+    
+    query_vector = await get_embedding_service().embed(query_text)
+    # Sub-millisecond matrix product, cheaper than a thread hop
+    start_time = time.perf_counter()
+    results = get_local_index().query(query_vector, top_k=top_k, filter_dict=filter_dict)
+    metrics.record_timing("local_index.query", time.perf_counter() - start_time)
+    return results
+
+
+def warm_local_index():
+    """Load the snapshot and the query embedding model (call at startup)."""
+    _use_local_index()
+    get_embedding_service().warm()
+
+
+def partitioning_enabled() -> bool:
+    """Whether cases are also stored in one collection per category."""
+    return os.getenv("VECTOR_PARTITIONED", "false").lower() == "true"
+
+
+def partition_collection_name(category: str, collection_name: Optional[str] = None) -> str:
+    """
+    Name of a category's partition collection.
+    
+    Args:
+        category: Case category (e.g. "BILLING")
+        collection_name: Base collection name (optional)
+        
+    Returns:
+        Partition collection name (e.g. "support_cases__billing")
+    """
+    base = collection_name or os.getenv("CHROMA_COLLECTION_NAME", "support_cases")
+    return f"{base}__{category.lower()}"
+
+
+async def _query_collection(
+    query_embedding: List[float],
+    collection_name: Optional[str],
+    top_k: int,
+    where: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Query one Chroma collection with a precomputed embedding."""
+    return await _run_collection_call(
+        "query",
+        collection_name,
+        lambda collection: collection.query(
+            query_embeddings=[query_embedding],
+            n_results=top_k,
+            where=where if where else None
+        )
+    )
+
+
+def _format_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a Chroma-format query result into a list of cases."""
+    similar_cases = []
+    if results["ids"] and len(results["ids"][0]) > 0:
+        for i in range(len(results["ids"][0])):
+            similar_cases.append({
+                "id": results["ids"][0][i],
+                "text": results["documents"][0][i] if results["documents"] else "",
+                "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
+                "distance": results["distances"][0][i] if results["distances"] else 0.0,
+                "similarity": 1.0 - results["distances"][0][i] if results["distances"] else 0.0
+            })
+    return similar_cases
 
 
 async def search_similar_cases(
@@ -69,6 +291,15 @@ async def search_similar_cases(
     """
     Search for similar cases in Chroma.
     
+    With VECTOR_BACKEND=local the search runs against the in-process
+    snapshot index instead (see tools/vector_db/local_index.py); the
+    snapshot holds one collection, so collection_name is ignored.
+    
+    With VECTOR_PARTITIONED=true a category filter searches only that
+    category's partition collection, and if it has fewer than
+    VECTOR_PARTITION_MIN_HITS matches the remaining slots are filled from
+    the whole knowledge base.
+    
     Args:
         query_text: Query text to search for
         collection_name: Collection name (optional)
@@ -78,29 +309,81 @@ async def search_similar_cases(
     Returns:
         List of similar cases with metadata
     """
-    collection = get_collection(collection_name)
+    filter_dict = dict(filter_dict) if filter_dict else {}
+    partitioned = partitioning_enabled() and "category" in filter_dict
     
-    results = collection.query(
-        query_texts=[query_text],
-        n_results=top_k,
-        where=filter_dict if filter_dict else None
-    )
+    if _use_local_index():
+        # The local index keeps rows per category already
+        results = await _search_local_index(query_text, top_k, filter_dict)
+        similar_cases = _format_results(results)
+    else:
+        # Embed here (cached, batched) rather than per query inside Chroma
+        query_embedding = await get_embedding_service().embed(query_text)
+        if partitioned:
+            where = {key: value for key, value in filter_dict.items() if key != "category"}
+            try:
+                results = await _query_collection(
+                    query_embedding,
+                    partition_collection_name(filter_dict["category"], collection_name),
+                    top_k,
+                    where
+                )
+                similar_cases = _format_results(results)
+            except Exception as e:
+                # An empty or missing partition is just a partition with no hits
+                logger.warning("Partition search failed", category=filter_dict["category"], error=str(e))
+                similar_cases = []
+        else:
+            results = await _query_collection(query_embedding, collection_name, top_k, filter_dict)
+            similar_cases = _format_results(results)
     
-    # Format results
-    similar_cases = []
-    if results["ids"] and len(results["ids"][0]) > 0:
-        for i in range(len(results["ids"][0])):
-            similar_cases.append({
-                "id": results["ids"][0][i],
-                "text": results["documents"][0][i] if results["documents"] else "",
-                "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                "distance": results["distances"][0][i] if results["distances"] else 0.0,
-                "similarity": 1.0 - results["distances"][0][i] if results["distances"] else 0.0
-            })
+    # Too few hits in the category: fill up from the other categories
+    if partitioned and len(similar_cases) < min(top_k, int(os.getenv("VECTOR_PARTITION_MIN_HITS", "2"))):
+        get_metrics_collector().increment_counter("vector_search.partition_fallback")
+        where = {key: value for key, value in filter_dict.items() if key != "category"}
+        if _use_local_index():
+            fallback = _format_results(await _search_local_index(query_text, top_k, where))
+        else:
+            fallback = _format_results(await _query_collection(query_embedding, collection_name, top_k, where))
+        seen = {case["id"] for case in similar_cases}
+        similar_cases += [case for case in fallback if case["id"] not in seen][:top_k - len(similar_cases)]
     
     return similar_cases
 
 
+async def get_all_cases(collection_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get every case in the knowledge base (e.g. to build a lexical index).
+    
+    Args:
+        collection_name: Collection name (optional, ignored with VECTOR_BACKEND=local)
+        
+    Returns:
+        Cases with id, text and metadata
+    """
+    if _use_local_index():
+        from tools.vector_db.local_index import get_local_index
+        index = get_local_index()
+        return [
+            {"id": case_id, "text": text, "metadata": metadata}
+            for case_id, text, metadata in zip(index.ids, index.documents, index.metadatas)
+        ]
+    
+    data = await _run_collection_call(
+        "get",
+        collection_name,
+        lambda collection: collection.get(include=["documents", "metadatas"])
+    )
+    return [
+        {
+            "id": case_id,
+            "text": data["documents"][i] if data["documents"] else "",
+            "metadata": data["metadatas"][i] if data["metadatas"] else {}
+        }
+        for i, case_id in enumerate(data["ids"])
+    ]
+
+
 async def add_case(
     case_id: str,
     text: str,
@@ -110,19 +393,43 @@ async def add_case(
     """
     Add a case to Chroma collection.
     
+    With VECTOR_PARTITIONED=true the case is also added to its category's
+    partition collection.
+    
     Args:
         case_id: Unique case ID
         text: Case text (will be embedded)
         metadata: Case metadata
         collection_name: Collection name (optional)
     """
-    collection = get_collection(collection_name)
+    embedding = await get_embedding_service().embed(text)
+    targets = [collection_name]
+    if partitioning_enabled() and metadata.get("category"):
+        targets.append(partition_collection_name(metadata["category"], collection_name))
     
-    collection.add(
-        documents=[text],
-        metadatas=[metadata],
-        ids=[case_id]
+    for target in targets:
+        await _run_collection_call(
+            "add",
+            target,
+            lambda collection: collection.add(
+                embeddings=[embedding],
+                documents=[text],
+                metadatas=[metadata],
+                ids=[case_id]
+            )
+        )
+
+
+async def _case_category(case_id: str, collection_name: Optional[str]) -> Optional[str]:
+    """Category of a stored case, read from the full collection."""
+    result = await _run_collection_call(
+        "get",
+        collection_name,
+        lambda collection: collection.get(ids=[case_id], include=["metadatas"])
     )
+    if result["metadatas"]:
+        return result["metadatas"][0].get("category")
+    return None
 
 
 async def update_case(
@@ -140,18 +447,54 @@ async def update_case(
         metadata: Updated metadata (optional)
         collection_name: Collection name (optional)
     """
-    collection = get_collection(collection_name)
-    
     update_data = {}
     if text is not None:
         update_data["documents"] = [text]
+        update_data["embeddings"] = [await get_embedding_service().embed(text)]
     if metadata is not None:
         update_data["metadatas"] = [metadata]
     
-    if update_data:
-        collection.update(
-            ids=[case_id],
-            **update_data
+    if not update_data:
+        return
+    
+    targets = [collection_name]
+    if partitioning_enabled():
+        old_category = await _case_category(case_id, collection_name)
+        new_category = (metadata or {}).get("category", old_category)
+        if old_category and new_category != old_category:
+            # Category changed: move the case to the new partition
+            await _run_collection_call(
+                "delete",
+                partition_collection_name(old_category, collection_name),
+                lambda collection: collection.delete(ids=[case_id])
+            )
+            if new_category:
+                stored = await _run_collection_call(
+                    "get",
+                    collection_name,
+                    lambda collection: collection.get(ids=[case_id], include=["embeddings", "documents"])
+                )
+                await _run_collection_call(
+                    "add",
+                    partition_collection_name(new_category, collection_name),
+                    lambda collection: collection.add(
+                        ids=[case_id],
+                        embeddings=update_data.get("embeddings", stored["embeddings"]),
+                        documents=update_data.get("documents", stored["documents"]),
+                        metadatas=[metadata]
+                    )
+                )
+        elif new_category:
+            targets.append(partition_collection_name(new_category, collection_name))
+    
+    for target in targets:
+        await _run_collection_call(
+            "update",
+            target,
+            lambda collection: collection.update(
+                ids=[case_id],
+                **update_data
+            )
         )
 
 
@@ -166,8 +509,20 @@ async def delete_case(
         case_id: Case ID to delete
         collection_name: Collection name (optional)
     """
-    collection = get_collection(collection_name)
-    collection.delete(ids=[case_id])
+    if partitioning_enabled():
+        category = await _case_category(case_id, collection_name)
+        if category:
+            await _run_collection_call(
+                "delete",
+                partition_collection_name(category, collection_name),
+                lambda collection: collection.delete(ids=[case_id])
+            )
+    
+    await _run_collection_call(
+        "delete",
+        collection_name,
+        lambda collection: collection.delete(ids=[case_id])
+    )
 
 
 
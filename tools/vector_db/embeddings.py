@@ -1,22 +1,284 @@
 """Embedding generation utilities."""
-from typing import List
-import chromadb
+import os
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from chromadb.utils import embedding_functions
+from tools.cache import redis_client
+from tools.cache.lru import LRUCache
+from tools.monitoring.metrics import get_metrics_collector
+from tools.monitoring.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Chroma's built-in model (ONNX all-MiniLM-L6-v2), used by collections
+# created without an explicit embedding function
+CHROMA_DEFAULT_MODEL = "chroma-default"
+
+_embedding_functions: Dict[str, Any] = {}
+_functions_lock = threading.Lock()
 
 
 def get_embedding_function(model_name: str = "all-MiniLM-L6-v2"):
     """
-    Get embedding function for Chroma.
+    Get embedding function for Chroma (loaded once per model).
     
     Args:
-        model_name: Embedding model name
-        
+        model_name: Embedding model name (CHROMA_DEFAULT_MODEL for Chroma's built-in model)
+    
     Returns:
         Embedding function
     """
-    return embedding_functions.SentenceTransformerEmbeddingFunction(
-        model_name=model_name
-    )
+    embedding_fn = _embedding_functions.get(model_name)
+    if embedding_fn is not None:
+        return embedding_fn
+    
+    with _functions_lock:
+        if model_name not in _embedding_functions:
+            if model_name == CHROMA_DEFAULT_MODEL:
+                _embedding_functions[model_name] = embedding_functions.DefaultEmbeddingFunction()
+            else:
+                _embedding_functions[model_name] = embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name=model_name
+                )
+    return _embedding_functions[model_name]
+
+
+class EmbeddingService:
+    """
+    Cached, batched embedding generation for one model.
+    
+    Vectors are cached by text hash in an in-process LRU and optionally in
+    Redis, shared by all replicas. Concurrent single-text requests are
+    coalesced: a collector waits up to EMBEDDING_BATCH_WAIT_MS after the
+    first request or until EMBEDDING_BATCH_SIZE texts arrive, then embeds
+    them in one forward pass on a dedicated thread.
+    """
+    
+    def __init__(
+        self,
+        model_name: str,
+        max_entries: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+        ttl: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_wait_ms: Optional[float] = None
+    ):
+        """
+        Initialize service.
+        
+        Args:
+            model_name: Embedding model name
+            max_entries: In-process cache size (defaults to EMBEDDING_CACHE_MAX_ENTRIES)
+            use_redis: Persist vectors in Redis (defaults to EMBEDDING_CACHE_REDIS)
+            ttl: Seconds vectors are kept in Redis (defaults to EMBEDDING_CACHE_TTL)
+            batch_size: Max texts per forward pass (defaults to EMBEDDING_BATCH_SIZE)
+            batch_wait_ms: Max wait to fill a batch (defaults to EMBEDDING_BATCH_WAIT_MS)
+        """
+        self.model_name = model_name
+        max_entries = max_entries if max_entries is not None else int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "4096"))
+        self.use_redis = use_redis if use_redis is not None else os.getenv("EMBEDDING_CACHE_REDIS", "false").lower() == "true"
+        self.ttl = ttl if ttl is not None else int(os.getenv("EMBEDDING_CACHE_TTL", "604800"))
+        self.batch_size = batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+        wait_ms = batch_wait_ms if batch_wait_ms is not None else float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+        self.batch_wait = wait_ms / 1000
+        self.cache = LRUCache(max_entries=max_entries)
+        self.metrics = get_metrics_collector()
+        # One thread: the model parallelizes inside the forward pass
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embeddings")
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}  # In-flight texts by key
+    
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\x00{text}".encode("utf-8")).hexdigest()
+    
+    def _redis_key(self, key: str) -> str:
+        return f"embedding:{key}"
+    
+    def warm(self):
+        """Load the model now instead of on the first request."""
+        get_embedding_function(self.model_name)
+    
+    async def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Cached vectors for keys (memory, then Redis)."""
+        found = {}
+        for key in keys:
+            vector = self.cache.get(key)
+            if vector is not None:
+                found[key] = vector
+        self.metrics.increment_counter("embeddings.cache_hit.memory", len(found))
+        
+        missing = [key for key in keys if key not in found]
+        if self.use_redis and missing:
+            try:
+                client = await redis_client.get_redis_client()
+                values = await client.mget([self._redis_key(key) for key in missing])
+            except Exception as e:
+                self.metrics.increment_counter("embeddings.cache_error")
+                logger.warning("Embedding cache lookup failed", error=str(e))
+                values = [None] * len(missing)
+            redis_hits = 0
+            for key, value in zip(missing, values):
+                if value:
+                    vector = json.loads(value)
+                    self.cache.set(key, vector)
+                    found[key] = vector
+                    redis_hits += 1
+            self.metrics.increment_counter("embeddings.cache_hit.redis", redis_hits)
+        return found
+    
+    async def _store(self, vectors: Dict[str, List[float]]):
+        """Cache computed vectors."""
+        for key, vector in vectors.items():
+            self.cache.set(key, vector)
+        self.metrics.set_gauge("embeddings.cache_entries", len(self.cache))
+        if self.use_redis and vectors:
+            try:
+                client = await redis_client.get_redis_client()
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, vector in vectors.items():
+                        pipe.set(self._redis_key(key), json.dumps(vector), ex=self.ttl)
+                    await pipe.execute()
+            except Exception as e:
+                self.metrics.increment_counter("embeddings.cache_error")
+                logger.warning("Embedding cache store failed", error=str(e))
+    
+    async def _compute(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in one forward pass per batch_size chunk, off the event loop."""
+        def run():
+            embedding_fn = get_embedding_function(self.model_name)
+            vectors = []
+            for start in range(0, len(texts), self.batch_size):
+                vectors.extend(embedding_fn(texts[start:start + self.batch_size]))
+            return [[float(x) for x in vector] for vector in vectors]
+        
+        start_time = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        vectors = await loop.run_in_executor(self._executor, run)
+        self.metrics.record_timing("embeddings.compute", time.perf_counter() - start_time)
+        self.metrics.increment_counter("embeddings.computed", len(texts))
+        return vectors
+    
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, computing only those not cached.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            Vector per text
+        """
+        keys = [self._key(text) for text in texts]
+        found = await self._lookup(list(dict.fromkeys(keys)))
+        
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing[key] = text
+        if missing:
+            computed = dict(zip(missing, await self._compute(list(missing.values()))))
+            await self._store(computed)
+            found.update(computed)
+        
+        return [found[key] for key in keys]
+    
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed one text, batched with concurrent requests.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            Vector
+        """
+        key = self._key(text)
+        vector = self.cache.get(key)
+        if vector is not None:
+            self.metrics.increment_counter("embeddings.cache_hit.memory")
+            return vector
+        
+        # Identical text already queued or computing
+        future = self._pending.get(key)
+        if future is None:
+            if self._collector is None or self._collector.done():
+                self._queue = asyncio.Queue()
+                self._collector = asyncio.create_task(self._collect())
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            await self._queue.put((key, text))
+        return await asyncio.shield(future)
+    
+    async def _next_batch(self) -> List[Tuple[str, str]]:
+        """Wait for a request, then gather more until the batch is full or the wait expires."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _collect(self):
+        """Embed queued texts in batches until cancelled."""
+        while True:
+            batch = await self._next_batch()
+            keys = [key for key, _ in batch]
+            # Sizes are counts, not timings: last size plus totals for the mean
+            self.metrics.set_gauge("embeddings.batch_size", len(batch))
+            self.metrics.increment_counter("embeddings.batches")
+            self.metrics.increment_counter("embeddings.batched_texts", len(batch))
+            try:
+                vectors = await self.embed_many([text for _, text in batch])
+            except Exception as e:
+                logger.error("Embedding batch failed", size=len(batch), error=str(e))
+                for key in keys:
+                    future = self._pending.pop(key, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+            for key, vector in zip(keys, vectors):
+                future = self._pending.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_result(vector)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and batching statistics."""
+        return {
+            "model": self.model_name,
+            "entries": len(self.cache),
+            "evictions": self.cache.evictions,
+            "pending": len(self._pending),
+            "redis": self.use_redis
+        }
+
+
+_services: Dict[str, EmbeddingService] = {}
+
+
+def get_embedding_service(model_name: str = CHROMA_DEFAULT_MODEL) -> EmbeddingService:
+    """
+    Get or create the embedding service for a model.
+    
+    Args:
+        model_name: Embedding model name (defaults to the model Chroma collections use)
+        
+    Returns:
+        Embedding service
+    """
+    if model_name not in _services:
+        _services[model_name] = EmbeddingService(model_name)
+    return _services[model_name]
 
 
 async def generate_embeddings(texts: List[str], model_name: str = "all-MiniLM-L6-v2") -> List[List[float]]:
@@ -26,12 +288,8 @@ async def generate_embeddings(texts: List[str], model_name: str = "all-MiniLM-L6
     Args:
         texts: List of texts to embed
         model_name: Embedding model name
-        
+    
     Returns:
         List of embedding vectors
     """
-    embedding_fn = get_embedding_function(model_name)
-    return embedding_fn(texts)
-
-
-
+    return await get_embedding_service(model_name).embed_many(texts)
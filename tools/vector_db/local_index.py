@@ -0,0 +1,256 @@
+"""In-process vector index over the knowledge base (NumPy brute force)."""
+import os
+import json
+import threading
+from typing import List, Dict, Any, Optional
+import numpy as np
+from tools.utils.exceptions import VectorDBException
+
+VECTORS_FILE = "vectors.npy"
+META_FILE = "meta.json"
+
+
+class LocalVectorIndex:
+    """
+    Exact nearest-neighbour index held in process memory.
+
+    Vectors are L2-normalized float32 rows, so a search is one matrix-vector
+    product; for a knowledge base of a few thousand cases that is well under
+    a millisecond. Snapshots are a directory with vectors.npy (memory-mapped
+    on load) and meta.json (ids, documents, metadatas).
+
+    Snapshots record the embedding model that produced the vectors; loading
+    one for a different query model is refused, since its neighbours would
+    be meaningless.
+
+    Distances match Chroma's default l2 space (squared L2 between normalized
+    vectors, 2 - 2 * cosine), so similarity scores from either backend are
+    comparable.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        embedding_model: Optional[str] = None
+    ):
+        """
+        Initialize index.
+
+        Args:
+            ids: Case IDs
+            documents: Case texts
+            metadatas: Case metadata
+            vectors: Embedding per case (rows are normalized here if needed)
+            embedding_model: Name of the model that produced the vectors
+        """
+        if not (len(ids) == len(documents) == len(metadatas) == len(vectors)):
+            raise ValueError("ids, documents, metadatas and vectors must have the same length")
+
+        self.ids = ids
+        self.documents = documents
+        self.metadatas = metadatas
+        self.embedding_model = embedding_model
+        self.vectors = vectors if _is_normalized(vectors) else _normalize(vectors)
+        # Row positions per category, so a category filter only scores that slice
+        self.category_rows: Dict[str, np.ndarray] = {}
+        for category in {metadata.get("category") for metadata in metadatas}:
+            self.category_rows[category] = np.array(
+                [row for row, metadata in enumerate(metadatas) if metadata.get("category") == category],
+                dtype=np.int64
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> int:
+        return self.vectors.shape[1] if len(self.vectors) else 0
+
+    def _candidate_rows(self, filter_dict: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows matching equality filters (None means all rows)."""
+        if not filter_dict:
+            return None
+
+        rows = None
+        other_filters = dict(filter_dict)
+        if "category" in other_filters:
+            rows = self.category_rows.get(other_filters.pop("category"), np.array([], dtype=np.int64))
+        if other_filters:
+            candidates = rows if rows is not None else range(len(self.ids))
+            rows = np.array(
+                [
+                    row for row in candidates
+                    if all(self.metadatas[row].get(key) == value for key, value in other_filters.items())
+                ],
+                dtype=np.int64
+            )
+        return rows
+
+    def query(
+        self,
+        query_vector: List[float],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Find the nearest cases.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Number of results
+            filter_dict: Metadata equality filters (e.g. {"category": "BILLING"})
+
+        Returns:
+            Results in Chroma's query format (one query)
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        rows = self._candidate_rows(filter_dict)
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        if len(vectors) == 0 or top_k <= 0:
+            return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+
+        scores = vectors @ query
+        count = min(top_k, len(scores))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top])]
+        positions = top if rows is None else rows[top]
+
+        return {
+            "ids": [[self.ids[row] for row in positions]],
+            "documents": [[self.documents[row] for row in positions]],
+            "metadatas": [[self.metadatas[row] for row in positions]],
+            "distances": [[float(2.0 - 2.0 * score) for score in scores[top]]]
+        }
+
+    def save(self, path: str, embedding_model: Optional[str] = None):
+        """
+        Write a snapshot directory.
+
+        Args:
+            path: Snapshot directory
+            embedding_model: Name of the model that produced the vectors
+                (defaults to the index's own)
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, VECTORS_FILE), np.ascontiguousarray(self.vectors, dtype=np.float32))
+        with open(os.path.join(path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump({
+                "ids": self.ids,
+                "documents": self.documents,
+                "metadatas": self.metadatas,
+                "embedding_model": embedding_model or self.embedding_model
+            }, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True, embedding_model: Optional[str] = None) -> "LocalVectorIndex":
+        """
+        Load a snapshot directory.
+
+        Args:
+            path: Snapshot directory
+            mmap: Memory-map the vectors instead of reading them into memory
+            embedding_model: Query embedding model the snapshot must match (not checked if None)
+
+        Returns:
+            Index
+
+        Raises:
+            VectorDBException: If the snapshot was built with another embedding model
+        """
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if embedding_model is not None and meta.get("embedding_model") != embedding_model:
+            raise VectorDBException(
+                f"Vector index at {path} was built with embedding model '{meta.get('embedding_model')}', "
+                f"but queries use '{embedding_model}'; rebuild it with scripts/build_vector_index.py"
+            )
+        vectors = np.load(os.path.join(path, VECTORS_FILE), mmap_mode="r" if mmap else None)
+        return cls(meta["ids"], meta["documents"], meta["metadatas"], vectors, meta.get("embedding_model"))
+
+    @classmethod
+    def from_chroma(cls, collection) -> "LocalVectorIndex":
+        """
+        Build from all entries of a Chroma collection (embeddings included).
+
+        Args:
+            collection: Chroma collection
+
+        Returns:
+            Index
+        """
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        return cls(
+            list(data["ids"]),
+            list(data["documents"] or [""] * len(data["ids"])),
+            list(data["metadatas"] or [{}] * len(data["ids"])),
+            np.asarray(data["embeddings"], dtype=np.float32).reshape(len(data["ids"]), -1)
+        )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _is_normalized(vectors: np.ndarray) -> bool:
+    if vectors.dtype != np.float32 or vectors.ndim != 2:
+        return False
+    return bool(np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-3))
+
+
+_local_index: Optional[LocalVectorIndex] = None
+_load_error: Optional[VectorDBException] = None
+_load_lock = threading.Lock()
+
+
+def get_local_index(embedding_model: Optional[str] = None) -> LocalVectorIndex:
+    """
+    Get the in-process index, loading the snapshot at VECTOR_INDEX_PATH once.
+
+    Args:
+        embedding_model: Query embedding model the snapshot must match (not checked if None)
+
+    Raises:
+        VectorDBException: If the snapshot is missing or unreadable, or was
+            built with another embedding model (remembered until reload_local_index)
+    """
+    global _local_index, _load_error
+    if _local_index is None:
+        with _load_lock:
+            if _local_index is None:
+                if _load_error is not None:
+                    raise _load_error
+                path = os.getenv("VECTOR_INDEX_PATH", "./data/vector_index")
+                try:
+                    _local_index = LocalVectorIndex.load(path, embedding_model=embedding_model)
+                except VectorDBException as e:
+                    _load_error = e
+                    raise
+                except (OSError, ValueError) as e:
+                    # Missing or corrupt snapshot (e.g. not built yet)
+                    _load_error = VectorDBException(f"Vector index at {path} could not be loaded: {e}")
+                    raise _load_error from e
+    if embedding_model is not None and _local_index.embedding_model != embedding_model:
+        raise VectorDBException(
+            f"Vector index was built with embedding model '{_local_index.embedding_model}', "
+            f"but queries use '{embedding_model}'"
+        )
+    return _local_index
+
+
+def reload_local_index(embedding_model: Optional[str] = None) -> LocalVectorIndex:
+    """Load the snapshot again (after it was rebuilt)."""
+    global _local_index, _load_error
+    with _load_lock:
+        _local_index = None
+        _load_error = None
+    return get_local_index(embedding_model)